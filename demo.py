@@ -21,7 +21,9 @@ No external services or hardware required - fully synthetic.
 """
 
 import sys
+import signal
 import logging
+import threading
 import time
 import argparse
 from pathlib import Path
@@ -37,6 +39,17 @@ PHOTONIC_CORE = PROJECT_ROOT / "photonic-radar-ai"
 if str(PHOTONIC_CORE) not in sys.path:
     sys.path.insert(0, str(PHOTONIC_CORE))
 
+# Set on SIGINT/SIGTERM; the demo loop waits on it between frames so a
+# shutdown request interrupts the frame sleep immediately.
+SHUTDOWN = threading.Event()
+
+def signal_handler(signum, frame):
+    """Request a graceful stop of the demo loop."""
+    SHUTDOWN.set()
+
+# Shared default for missing per-frame result lists (avoids a fresh [] per frame)
+_NO_ITEMS = ()
+
 # =============================================================================
 # CONSOLE FORMATTING & UTILITIES
 # =============================================================================
@@ -53,12 +66,56 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Startup banner (built once at import time)
+_BANNER = f"""\n
+{Colors.HEADER}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                  PHOENIX RADAR AI DEMONSTRATION                   ║
+║          Cognitive Photonic Radar with AI Intelligence            ║
+║                  No Hardware or Services Required                  ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.ENDC}
+{Colors.BOLD}System Components:{Colors.ENDC}
+  • Event Bus (Defense Core): Real-time messaging
+  • Radar Subsystem: Physics-based signal processing
+  • Signal Processing: Detection & Kalman filtering
+  • Cognitive Engine: AI-based threat classification
+  • EW Subsystem: Electronic warfare decisions
+  
+{Colors.BOLD}Synthetic Scenario:{Colors.ENDC}
+  • 3 target aircraft simulated
+  • Realistic Doppler effects and noise
+  • Adaptive detection thresholds (CFAR)
+  • Closed-loop cognitive adaptation
+    
+"""
+
 def print_header(title: str):
     """Print formatted section header."""
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{title:^70}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
 
+# Per-frame line templates, bound once so the hot loop only calls str.format
+_FMT_DETECTION = (
+    Colors.OKCYAN + "[DETECTION] Frame {:5d} | "
+    "Track #{:2} | "
+    "Range: {:7.1f}m | "
+    "Azimuth: {:6.1f}° | "
+    "Velocity: {:7.1f}m/s | "
+    "SNR: {:6.1f}dB | "
+    "Quality: {:.2f}" + Colors.ENDC
+).format
+
+_FMT_THREAT = (
+    "{}[THREAT] Frame {:5d} | "
+    "Track #{:2} | "
+    "Class: {:8} | "
+    "Priority: {:2}/10 | "
+    "Confidence: {:.1%} | "
+    "Action: {}" + Colors.ENDC
+).format
+
 def print_detection(detection: Dict[str, Any], frame: int):
     """Print formatted detection."""
     track_id = detection.get('id', detection.get('track_id', '?'))
@@ -68,13 +125,7 @@ def print_detection(detection: Dict[str, Any], frame: int):
     snr = detection.get('snr_db', 0)
     quality = detection.get('track_quality', 0)
     
-    print(f"{Colors.OKCYAN}[DETECTION] Frame {frame:5d} | "
-          f"Track #{track_id:2} | "
-          f"Range: {range_m:7.1f}m | "
-          f"Azimuth: {azimuth:6.1f}° | "
-          f"Velocity: {velocity:7.1f}m/s | "
-          f"SNR: {snr:6.1f}dB | "
-          f"Quality: {quality:.2f}{Colors.ENDC}")
+    print(_FMT_DETECTION(frame, track_id, range_m, azimuth, velocity, snr, quality))
 
 def print_threat(threat: Dict[str, Any], frame: int):
     """Print formatted threat assessment."""
@@ -94,12 +145,7 @@ def print_threat(threat: Dict[str, Any], frame: int):
     else:
         color = Colors.OKBLUE
     
-    print(f"{color}[THREAT] Frame {frame:5d} | "
-          f"Track #{track_id:2} | "
-          f"Class: {threat_class:8} | "
-          f"Priority: {priority:2}/10 | "
-          f"Confidence: {confidence:.1%} | "
-          f"Action: {recommendation}{Colors.ENDC}")
+    print(_FMT_THREAT(color, frame, track_id, threat_class, priority, confidence, recommendation))
 
 def print_ew_decision(decision: Dict[str, Any], frame: int):
     """Print formatted EW decision."""
@@ -141,6 +187,16 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     )
     return logging.getLogger(__name__)
 
+class _DemoTacticalState:
+    """Minimal stand-in for TacticalState; subsystem updates are discarded."""
+    __slots__ = ('event_bus', 'radar', 'ew')
+    
+    def update_radar(self, *args, **kwargs):
+        pass
+    
+    def update_ew(self, *args, **kwargs):
+        pass
+
 def initialize_system(logger: logging.Logger) -> Optional[Dict[str, Any]]:
     """
     Initialize all system components.
@@ -177,13 +233,11 @@ def initialize_system(logger: logging.Logger) -> Optional[Dict[str, Any]]:
         try:
             from subsystems.event_bus_subsystem import EventBusSubsystem
             # Create minimal tactical state
-            state['tactical_state'] = type('TacticalState', (), {
-                'event_bus': event_bus,
-                'radar': {},
-                'ew': {},
-                'update_radar': lambda *args, **kw: None,
-                'update_ew': lambda *args, **kw: None,
-            })()
+            tactical_state = _DemoTacticalState()
+            tactical_state.event_bus = event_bus
+            tactical_state.radar = {}
+            tactical_state.ew = {}
+            state['tactical_state'] = tactical_state
             print(f"{Colors.OKGREEN}✓{Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.FAIL}✗ {e}{Colors.ENDC}")
@@ -289,27 +343,28 @@ def run_demo(state: Dict[str, Any], duration: float, logger: logging.Logger):
     frame_times = deque(maxlen=100)
     
     try:
-        while state['running']:
+        while not SHUTDOWN.is_set():
             frame_start = time.time()
             state['tick'] += 1
+            tick = state['tick']
             
             # RADAR FRAME
             if state['radar']:
                 radar_result = state['radar'].tick()
                 
                 if 'error' not in radar_result:
-                    tracks = radar_result.get('tracks', [])
-                    threats = radar_result.get('threats', [])
+                    tracks = radar_result.get('tracks', _NO_ITEMS)
+                    threats = radar_result.get('threats', _NO_ITEMS)
+                    detections_total += len(tracks)
+                    threats_total += len(threats)
                     
                     # Print detections
                     for track in tracks:
-                        print_detection(track, state['tick'])
-                        detections_total += 1
+                        print_detection(track, tick)
                     
                     # Print threats
                     for threat in threats:
-                        print_threat(threat, state['tick'])
-                        threats_total += 1
+                        print_threat(threat, tick)
             
             # EW DECISION
             if state['ew']:
@@ -317,13 +372,13 @@ def run_demo(state: Dict[str, Any], duration: float, logger: logging.Logger):
                 
                 if ew_result and 'error' not in ew_result:
                     if ew_result.get('decision_count', 0) > 0:
-                        print_ew_decision(ew_result, state['tick'])
+                        print_ew_decision(ew_result, tick)
             
             # Print summary every 10 frames
-            if state['radar'] and state['tick'] % 10 == 0:
+            if state['radar'] and tick % 10 == 0:
                 radar_stats = state['radar'].get_stats() if hasattr(state['radar'], 'get_stats') else {}
                 ew_stats = state['ew'].get_stats() if state['ew'] and hasattr(state['ew'], 'get_stats') else {}
-                print_summary(state['tick'], radar_stats, ew_stats)
+                print_summary(tick, radar_stats, ew_stats)
                 print()  # Blank line for readability
             
             frame_count += 1
@@ -334,17 +389,19 @@ def run_demo(state: Dict[str, Any], duration: float, logger: logging.Logger):
             
             # Check duration
             if time.time() - start_time > duration:
-                state['running'] = False
                 break
             
-            # Sleep to maintain 10 Hz
+            # Sleep to maintain 10 Hz (wakes early on shutdown request)
             sleep_time = 0.1 - frame_time
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if sleep_time > 0 and SHUTDOWN.wait(sleep_time):
+                break
+        
+        if SHUTDOWN.is_set():
+            print(f"\n{Colors.WARNING}Interrupted by user{Colors.ENDC}")
         
         # Print final statistics
         elapsed = time.time() - start_time
-        avg_frame_time = sum(frame_times) / len(frame_times) * 1000  # Convert to ms
+        avg_frame_time = (sum(frame_times) / len(frame_times) * 1000) if frame_times else 0.0  # Convert to ms
         
         print_header("DEMONSTRATION COMPLETE")
         
@@ -381,10 +438,9 @@ def print_event_bus_summary(state: Dict[str, Any], logger: logging.Logger):
     
     # Get queue info
     try:
-        q_info = bus.get_queue_info() if hasattr(bus, 'get_queue_info') else {}
+        q_info = bus.get_queue_info_view() if hasattr(bus, 'get_queue_info_view') else ()
         print(f"{Colors.BOLD}Message Queues:{Colors.ENDC}")
-        for queue_name, queue_data in q_info.items():
-            size = queue_data.get('size', 0) if isinstance(queue_data, dict) else queue_data
+        for queue_name, size in q_info:
             print(f"  {queue_name:30} | Messages: {size:5}")
     except Exception as e:
         logger.debug(f"Could not get queue info: {e}")
@@ -418,29 +474,12 @@ def main():
     # Setup logging
     logger = setup_logging(args.verbose)
     
-    # Print banner
-    print(f"""\n
-{Colors.HEADER}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                  PHOENIX RADAR AI DEMONSTRATION                   ║
-║          Cognitive Photonic Radar with AI Intelligence            ║
-║                  No Hardware or Services Required                  ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.ENDC}
-{Colors.BOLD}System Components:{Colors.ENDC}
-  • Event Bus (Defense Core): Real-time messaging
-  • Radar Subsystem: Physics-based signal processing
-  • Signal Processing: Detection & Kalman filtering
-  • Cognitive Engine: AI-based threat classification
-  • EW Subsystem: Electronic warfare decisions
-  
-{Colors.BOLD}Synthetic Scenario:{Colors.ENDC}
-  • 3 target aircraft simulated
-  • Realistic Doppler effects and noise
-  • Adaptive detection thresholds (CFAR)
-  • Closed-loop cognitive adaptation
+    # Register signal handlers
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
-""")
+    # Print banner
+    print(_BANNER)
     
     # Initialize system
     state = initialize_system(logger)
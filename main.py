@@ -32,10 +32,15 @@ import logging
 import threading
 import time
 import argparse
+import gc
+import atexit
+import queue
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 from dataclasses import dataclass
 
 # =============================================================================
@@ -69,6 +74,10 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 # LOGGING SETUP
 # =============================================================================
 
+# Background thread draining the log queue into the real handlers
+_log_listener: Optional[QueueListener] = None
+
+
 def setup_logging(debug: bool = False) -> logging.Logger:
     """
     Configure logging to console and file.
@@ -99,12 +108,28 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     
-    # Root logger
+    # Root logger: callers only enqueue records; a background listener thread
+    # performs the console/file writes so logging never blocks the tick loop.
+    global _log_listener
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(stop_logging)
+    
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     root_logger.handlers.clear()  # Remove any existing handlers
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    # The formatter uses none of these record fields; skip collecting them
+    # (findCaller() stack walk, thread/process lookups) on every log call.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Get module logger
     logger = logging.getLogger(__name__)
@@ -117,6 +142,14 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     return logger
 
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the background log listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 # =============================================================================
 # SUBSYSTEM STATE
 # =============================================================================
@@ -131,7 +164,6 @@ class SubsystemState:
     api_process: Optional[subprocess.Popen] = None
     dashboard_process: Optional[subprocess.Popen] = None
     running: bool = False
-    shutdown_requested: bool = False
     
     def all_critical_ready(self) -> bool:
         """Check if all critical subsystems are initialized."""
@@ -146,6 +178,10 @@ class SubsystemState:
 state = SubsystemState()
 logger: Optional[logging.Logger] = None
 
+# Set by the signal handler; the main loop waits on it instead of sleeping so
+# SIGINT/SIGTERM interrupt the inter-tick wait immediately.
+SHUTDOWN = threading.Event()
+
 
 # =============================================================================
 # SIGNAL HANDLERS
@@ -155,7 +191,7 @@ def signal_handler(signum, frame):
     """Handle termination signals gracefully."""
     if logger:
         logger.info(f"\n[SHUTDOWN] Received signal {signum}")
-    state.shutdown_requested = True
+    SHUTDOWN.set()
 
 
 # =============================================================================
@@ -185,8 +221,10 @@ def initialize_event_bus(logger: logging.Logger) -> bool:
         logger.info("[EVENT BUS] Resetting defense core...")
         reset_defense_bus()
         
+        # Radar and EW are the only producer/consumer on each direction,
+        # so the lock-free SPSC ring backend is safe here
         logger.info("[EVENT BUS] Obtaining bus singleton...")
-        bus = get_defense_bus()
+        bus = get_defense_bus(backend_type='ring')
         
         if bus is None:
             logger.error("[EVENT BUS] ✗ Bus initialization returned None")
@@ -488,11 +526,203 @@ def initialize_dashboard(logger: logging.Logger) -> bool:
         return False
 
 
+# =============================================================================
+# SIMULATION CLOCK
+# =============================================================================
+
+class SimulationClock:
+    """
+    Fixed-rate simulation clock on an absolute deadline grid.
+    
+    Tick n is due at start_time + n * tick_interval, so sleep rounding never
+    accumulates into drift. Waiting is split into a coarse interruptible wait
+    on SHUTDOWN followed by a short yield loop up to the exact deadline, which
+    trims sleep overshoot without busy-waiting the whole tick.
+    """
+    
+    # Remaining time (s) below which we stop sleeping and yield until the deadline
+    SPIN_MARGIN_S = 0.002
+    # Minimum interval (s) between dropped-frame warnings
+    DROP_REPORT_INTERVAL_S = 1.0
+    
+    def __init__(self, hz: float = 10.0):
+        self.tick_rate = hz
+        self.tick_interval = 1.0 / hz
+        self.tick_count = 0
+        self.start_time = None
+        self.next_tick_time = None
+        self.dropped_frames = 0
+        self._unreported_drops = 0
+        self._last_drop_report = 0.0
+        # Bound once to skip the module attribute lookups on every tick
+        self._perf = time.perf_counter
+        self._sleep = time.sleep
+    
+    def start(self):
+        self.start_time = self._perf()
+        self.next_tick_time = self.start_time + self.tick_interval
+        self.tick_count = 0
+        self.dropped_frames = 0
+        self._unreported_drops = 0
+        self._last_drop_report = self.start_time
+    
+    def _deadline_wait(self, abs_time: float) -> bool:
+        """
+        Block until perf_counter() reaches abs_time.
+        
+        Returns:
+            True if shutdown was requested while waiting
+        """
+        perf = self._perf
+        remaining = abs_time - perf()
+        if remaining > self.SPIN_MARGIN_S:
+            if SHUTDOWN.wait(remaining - self.SPIN_MARGIN_S):
+                return True
+        sleep = self._sleep
+        while perf() < abs_time:
+            sleep(0)
+        return SHUTDOWN.is_set()
+    
+    def _skip_missed_ticks(self, now: float):
+        """
+        Drop ticks whose deadlines have fully passed after an overrun.
+        
+        Rather than issuing back-to-back catch-up ticks, jump to the latest
+        on-grid tick and count the skipped ones. Warnings are rate-limited.
+        """
+        behind = now - self.next_tick_time
+        if behind <= self.tick_interval:
+            return
+        missed = int(behind / self.tick_interval)
+        self.tick_count += missed
+        self.dropped_frames += missed
+        self._unreported_drops += missed
+        
+        if now - self._last_drop_report >= self.DROP_REPORT_INTERVAL_S:
+            if logger and logger.isEnabledFor(logging.WARNING):
+                logger.warning("[CLOCK] Tick overrun: dropped %d frame(s) (total %d)",
+                               self._unreported_drops, self.dropped_frames)
+            self._unreported_drops = 0
+            self._last_drop_report = now
+    
+    def wait_for_next_tick(self) -> Optional[int]:
+        """Block until the next tick; returns None if shutdown was requested."""
+        deadline = self.next_tick_time
+        now = self._perf()
+        if now < deadline:
+            if self._deadline_wait(deadline):
+                return None
+        else:
+            self._skip_missed_ticks(now)
+        tick = self.tick_count + 1
+        self.tick_count = tick
+        # Derived from start_time rather than accumulated, so float error
+        # from repeated additions cannot build up over long runs
+        self.next_tick_time = self.start_time + (tick + 1) * self.tick_interval
+        return tick
+
+
+# =============================================================================
+# REAL-TIME SCHEDULING
+# =============================================================================
+
+# CPUs left to helper threads (tick pool, log listener) once the loop thread
+# owns a real-time core; None when the loop is not pinned
+_HELPER_CPUS: Optional[Set[int]] = None
+
+
+def _pin_realtime(logger: logging.Logger, core: Optional[int] = None, priority: int = 50) -> bool:
+    """
+    Pin the calling thread to one core and raise it to real-time priority.
+    
+    The core is reserved for the loop: threads already running (e.g. the log
+    listener) are moved to the remaining CPUs, and threads started later
+    must call _release_realtime() first, since on Linux they would otherwise
+    inherit the single core and the SCHED_FIFO policy. At least one other CPU
+    must be available. Lack of privileges is not an error; the loop then
+    simply runs with normal scheduling.
+    
+    Args:
+        logger: Logger instance
+        core: CPU to pin to (defaults to the highest CPU currently allowed)
+        priority: SCHED_FIFO priority (1-99, Linux only)
+    
+    Returns:
+        True if real-time priority was obtained
+    """
+    global _HELPER_CPUS
+    if IS_LINUX:
+        try:
+            allowed = os.sched_getaffinity(0)
+            if core is None:
+                core = max(allowed)
+            helper_cpus = allowed - {core}
+            if not helper_cpus:
+                logger.warning("[LOOP] Real-time scheduling needs a second CPU for helper threads; "
+                               "running with normal scheduling")
+                return False
+            os.sched_setaffinity(0, {core})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[LOOP] Real-time scheduling unavailable: {e}")
+            return False
+        _HELPER_CPUS = helper_cpus
+        
+        # Keep helpers that already run (log listener, API/EW threads) off the core
+        current = threading.current_thread()
+        for thread in threading.enumerate():
+            if thread is not current and thread.native_id is not None:
+                try:
+                    os.sched_setaffinity(thread.native_id, helper_cpus)
+                except OSError:
+                    pass  # Thread exited meanwhile
+        logger.info(f"[LOOP] ✓ Pinned to CPU {core} with SCHED_FIFO priority {priority}")
+        return True
+    
+    if IS_WINDOWS:
+        import ctypes
+        THREAD_PRIORITY_TIME_CRITICAL = 15
+        kernel32 = ctypes.windll.kernel32
+        if kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL):
+            logger.info("[LOOP] ✓ Thread priority set to TIME_CRITICAL")
+            return True
+        logger.warning("[LOOP] Real-time scheduling unavailable: SetThreadPriority failed")
+        return False
+    
+    logger.warning(f"[LOOP] Real-time scheduling not supported on {platform.system()}")
+    return False
+
+
+def _release_realtime() -> None:
+    """
+    Return the calling thread to normal scheduling on the helper CPUs.
+    
+    Used as the initializer of threads started by a pinned loop thread, so
+    they neither share its core nor inherit SCHED_FIFO.
+    """
+    if IS_LINUX and _HELPER_CPUS:
+        try:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+            os.sched_setaffinity(0, _HELPER_CPUS)
+        except OSError:
+            pass
+
+
 # =============================================================================
 # MAIN SIMULATION LOOP
 # =============================================================================
 
-def run_simulation_loop(logger: logging.Logger) -> None:
+# Minimum time (s) left before the next tick for an idle-time GC pass
+GC_MIN_SLACK_S = 0.005
+
+# Collect regardless of slack once gen-0 allocations exceed this multiple of
+# the interpreter's threshold, so ticks running close to budget cannot defer
+# GC indefinitely
+GC_FORCE_FACTOR = 2
+
+
+def run_simulation_loop(logger: logging.Logger, realtime: bool = False,
+                        publish_hz: float = 1.0) -> None:
     """
     Execute main simulation loop.
     
@@ -501,60 +731,93 @@ def run_simulation_loop(logger: logging.Logger) -> None:
     
     Args:
         logger: Logger instance
+        realtime: Pin the loop thread to a dedicated core at real-time priority
+        publish_hz: Rate at which the tactical state snapshot is published
     """
     logger.info("=" * 70)
     logger.info("STARTING MAIN SIMULATION LOOP")
     logger.info("=" * 70)
     
-    class SimulationClock:
-        """Fixed-rate simulation clock with drift correction."""
-        def __init__(self, hz: float = 10.0):
-            self.tick_rate = hz
-            self.tick_interval = 1.0 / hz
-            self.tick_count = 0
-            self.start_time = None
-            self.next_tick_time = None
-        
-        def start(self):
-            self.start_time = time.perf_counter()
-            self.next_tick_time = self.start_time + self.tick_interval
-            self.tick_count = 0
-        
-        def wait_for_next_tick(self) -> int:
-            current = time.perf_counter()
-            sleep_time = self.next_tick_time - current
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            self.tick_count += 1
-            self.next_tick_time = self.start_time + (self.tick_count + 1) * self.tick_interval
-            return self.tick_count
+    if realtime:
+        _pin_realtime(logger)
+    
+    # Resolve the DEBUG gate once; the loop skips the call entirely when off
+    dbg = logger.debug if logger.isEnabledFor(logging.DEBUG) else None
     
     clock = SimulationClock(hz=10.0)
     clock.start()
     
+    # Consumers (API, dashboard) poll the snapshot at ~1 Hz: record the tick
+    # every frame, but only serialize it every publish_every frames
+    publish_every = max(1, round(clock.tick_rate / publish_hz))
+    
     state.running = True
     tick_count = 0
     
+    # Bind per-tick callables once; subsystems are fixed for the loop's lifetime
+    has_radar = bool(state.radar)
+    subsystem_ticks = tuple(sub.tick for sub in (state.radar, state.ew) if sub)
+    ts_record = ts_publish = None
+    if state.tactical_state:
+        state.tactical_state.set_publish_rate(publish_hz)
+        ts_record = state.tactical_state.record_tick
+        ts_publish = state.tactical_state.publish
+    wait_for_next_tick = clock.wait_for_next_tick
+    shutdown_is_set = SHUTDOWN.is_set
+    perf = time.perf_counter
+    
+    # Automatic GC can fire mid-frame; run it ourselves in the slack before
+    # the next deadline instead. The generation is chosen with the
+    # interpreter's own thresholds so older generations still get collected.
+    gc_threshold0, gc_threshold1, gc_threshold2 = gc.get_threshold()
+    gc_force_count = GC_FORCE_FACTOR * gc_threshold0
+    gc_get_count = gc.get_count
+    gc_collect = gc.collect
+    gc.disable()
+    
+    # Radar and EW only exchange data through the event bus and the
+    # thread-safe tactical state, so their ticks can overlap. EW picks up
+    # the radar packet on the same or the following frame.
+    tick_pool = None
+    if len(subsystem_ticks) > 1:
+        # Workers are created lazily by the (possibly pinned) loop thread;
+        # the initializer moves them off its real-time core
+        tick_pool = ThreadPoolExecutor(
+            max_workers=len(subsystem_ticks), thread_name_prefix="tick",
+            initializer=_release_realtime
+        )
+        submit = tick_pool.submit
+    
     try:
-        while not state.shutdown_requested:
-            tick = clock.wait_for_next_tick()
+        while not shutdown_is_set():
+            tick = wait_for_next_tick()
+            if tick is None:
+                break
             
-            # RADAR FRAME
-            if state.radar:
-                radar_result = state.radar.tick()
-                if tick_count % 100 == 0:  # Log every 10 seconds
-                    logger.debug(f"[TICK {tick:6d}] Radar frame executed")
+            # RADAR FRAME + EW DECISION
+            if tick_pool:
+                for future in [submit(fn) for fn in subsystem_ticks]:
+                    future.result()
+            else:
+                for subsystem_tick in subsystem_ticks:
+                    subsystem_tick()
             
-            # EW DECISION
-            if state.ew:
-                ew_result = state.ew.tick()
+            if dbg and has_radar and tick_count % 100 == 0:  # Log every 10 seconds
+                dbg("[TICK %6d] Radar frame executed", tick)
             
             # STATE UPDATE
-            if state.tactical_state:
-                # Tactical state updates handled via radar.tick() and ew.tick()
-                state.tactical_state.update_tick(tick_count)
+            # Tactical state updates handled via radar.tick() and ew.tick()
+            if ts_record:
+                ts_record(tick_count)
+                if tick_count % publish_every == 0:
+                    ts_publish()
             
             tick_count += 1
+            
+            # IDLE-TIME GC (forced if slack has been short for too long)
+            count0, count1, count2 = gc_get_count()
+            if clock.next_tick_time - perf() > GC_MIN_SLACK_S or 0 < gc_force_count <= count0:
+                gc_collect(2 if count2 >= gc_threshold2 else 1 if count1 >= gc_threshold1 else 0)
     
     except KeyboardInterrupt:
         logger.info("[LOOP] Interrupted by user")
@@ -563,6 +826,9 @@ def run_simulation_loop(logger: logging.Logger) -> None:
         import traceback
         traceback.print_exc()
     finally:
+        gc.enable()
+        if tick_pool:
+            tick_pool.shutdown(wait=True)
         state.running = False
 
 
@@ -634,6 +900,7 @@ def shutdown_subsystems(logger: logging.Logger) -> None:
             logger.warning(f"[SHUTDOWN] Event bus shutdown warning: {e}")
     
     logger.info("[SHUTDOWN] ✓ ALL SYSTEMS DOWN")
+    stop_logging()
 
 
 # =============================================================================
@@ -663,6 +930,7 @@ Examples:
   python main.py --ui               # With Streamlit dashboard
   python main.py --debug            # Debug logging
   python main.py --api-only         # API server only
+  python main.py --realtime         # Pin loop to a core at real-time priority
         """
     )
     parser.add_argument(
@@ -680,6 +948,17 @@ Examples:
         action='store_true',
         help='Start API server only (no radar simulation)'
     )
+    parser.add_argument(
+        '--realtime',
+        action='store_true',
+        help='Pin the simulation loop to one core at real-time priority (needs privileges)'
+    )
+    parser.add_argument(
+        '--publish-hz',
+        type=float,
+        default=1.0,
+        help='Rate (Hz) at which tactical state is published to the API/dashboard (default: 1.0)'
+    )
     parser.add_argument(
         '--headless',
         action='store_true',
@@ -687,6 +966,8 @@ Examples:
     )
     
     args = parser.parse_args()
+    if args.publish_hz <= 0:
+        parser.error("--publish-hz must be positive")
     
     # Setup logging
     logger = setup_logging(debug=args.debug)
@@ -760,13 +1041,18 @@ Examples:
         if state.ew:
             logger.info("EW Engine: Cognitive intelligence pipeline active")
     
+    # Everything allocated so far lives for the whole run; move it out of
+    # the collector's view so idle-time passes only scan per-frame objects
+    gc.collect()
+    gc.freeze()
+    
     logger.info("")
     logger.info("Press Ctrl+C to shutdown gracefully...")
     logger.info("")
     
     # Main simulation loop
     try:
-        run_simulation_loop(logger)
+        run_simulation_loop(logger, realtime=args.realtime, publish_hz=args.publish_hz)
     except Exception as e:
         logger.error(f"✗ Unhandled exception in main loop: {e}")
         import traceback
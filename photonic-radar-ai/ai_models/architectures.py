@@ -20,7 +20,7 @@ Architecture Design:
 Author: Senior AI Research Scientist (Radar Intelligence)
 """
 
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 import warnings
 
 # Try to import torch, provide fallback if not available
@@ -28,6 +28,7 @@ try:
     import torch
     import torch.nn as nn
     import torch.nn.functional as F
+    from torch.nn.utils.fusion import fuse_conv_bn_eval
     TORCH_AVAILABLE = True
 except ImportError:
     TORCH_AVAILABLE = False
@@ -63,6 +64,22 @@ if TORCH_AVAILABLE:
             out = self.bn2(self.conv2(out))
             out += residual
             return F.relu(out)
+
+        def fuse_for_inference(self) -> None:
+            """
+            Folds each BatchNorm into its preceding convolution (eval mode only).
+            The BN layers become identities, so the block's state_dict changes.
+            """
+            if isinstance(self.bn1, nn.BatchNorm2d):
+                self.conv1 = fuse_conv_bn_eval(self.conv1, self.bn1)
+                self.bn1 = nn.Identity()
+            if isinstance(self.bn2, nn.BatchNorm2d):
+                self.conv2 = fuse_conv_bn_eval(self.conv2, self.bn2)
+                self.bn2 = nn.Identity()
+            if len(self.identity_mapping) == 2:
+                self.identity_mapping = nn.Sequential(
+                    fuse_conv_bn_eval(self.identity_mapping[0], self.identity_mapping[1])
+                )
 else:
     class TacticalResidualBlock(_DummyModule):
         """Fallback stub - torch not available"""
@@ -83,8 +100,9 @@ if TORCH_AVAILABLE:
             # sequential_output: (batch_size, sequence_length, hidden_dimension)
             scores = self.attention_score_layer(sequential_output)
             weights = F.softmax(scores, dim=1)
-            # Context vector via weighted summation
-            context_vector = torch.sum(weights * sequential_output, dim=1)
+            # Context vector via weighted summation, as one batched matmul:
+            # (B, 1, S) @ (B, S, H) -> (B, 1, H)
+            context_vector = torch.bmm(weights.transpose(1, 2), sequential_output).squeeze(1)
             return context_vector, weights
 
 
@@ -163,6 +181,19 @@ if TORCH_AVAILABLE:
             
             return classification_logits, attention_weights
 
+        def fuse_for_inference(self) -> "TacticalHybridClassifier":
+            """
+            Folds Conv+BatchNorm pairs of the spectral encoder for inference.
+            
+            Must be called in eval mode, after any checkpoint has been loaded.
+            """
+            if self.training:
+                raise RuntimeError("fuse_for_inference() requires eval mode")
+            for module in self.modules():
+                if isinstance(module, TacticalResidualBlock):
+                    module.fuse_for_inference()
+            return self
+
 else:
     # Fallback stub implementations when torch not available
     class KinematicAttentionBlock(_DummyModule):
@@ -197,3 +228,30 @@ def initialize_tactical_model(num_target_classes: int = 5) -> Optional[TacticalH
         warnings.warn("Torch not available - returning None for model", UserWarning)
         return None
     return TacticalHybridClassifier(num_classes=num_target_classes)
+
+
+def save_tactical_weights(model: "nn.Module", persistence_path: str) -> None:
+    """
+    Persists model weights with floating-point tensors stored as FP16.
+    
+    Halves checkpoint size and read bandwidth; load_state_dict() casts the
+    values back to the parameter dtype on load.
+    """
+    state_dict = {
+        name: tensor.detach().cpu().half() if tensor.is_floating_point() else tensor.detach().cpu()
+        for name, tensor in model.state_dict().items()
+    }
+    torch.save(state_dict, persistence_path)
+
+
+def load_tactical_weights(persistence_path: str) -> Dict[str, "torch.Tensor"]:
+    """
+    Loads a weights-only checkpoint, memory-mapped where supported (PyTorch 2.1+)
+    so tensors are read straight from the file without an intermediate copy.
+    """
+    try:
+        return torch.load(persistence_path, map_location="cpu", mmap=True, weights_only=True)
+    except TypeError:
+        # Older PyTorch without the mmap argument
+        return torch.load(persistence_path, map_location="cpu", weights_only=True)
+
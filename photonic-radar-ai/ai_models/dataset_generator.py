@@ -24,13 +24,34 @@ Author: Senior AI Research Scientist (Radar Physics)
 import numpy as np
 import os
 import torch
-from typing import Tuple, List, Dict
+from multiprocessing import Pool
+from typing import Tuple, List, Dict, Optional
 from photonic.signals import generate_synthetic_photonic_signal
 from signal_processing.transforms import compute_range_doppler_map, compute_spectrogram
 from signal_processing.noise import inject_thermal_awgn, generate_stochastic_clutter
 from ai_models.model import get_tactical_classes
 
 
+# Per-process generator used by generate_batch worker pools
+_worker_generator = None
+
+
+def _init_synthesis_worker(simulation_config: Dict):
+    """Pool initializer: builds one generator per worker process."""
+    global _worker_generator
+    _worker_generator = RadarDatasetGenerator(simulation_config)
+
+
+def _synthesize_indexed_sample(task: Tuple[int, str, int]) -> Tuple[int, Dict[str, np.ndarray]]:
+    """
+    Worker entry point. Reseeds the process RNG per task so forked workers
+    do not replay the parent's random stream.
+    """
+    index, tactical_class_name, seed = task
+    np.random.seed(seed)
+    return index, _worker_generator.synthesize_multimodal_sample(tactical_class_name)
+
+
 class RadarDatasetGenerator:
     """
     Orchestration engine for synthetic tactical radar data synthesis.
@@ -38,6 +59,18 @@ class RadarDatasetGenerator:
     def __init__(self, simulation_config: Dict):
         self.config = simulation_config
         self.target_labels = get_tactical_classes()
+        # float32 sample-time vectors keyed by (num_samples, fs); fixed for a given config
+        self._time_vectors: Dict[Tuple[int, float], np.ndarray] = {}
+    
+    def _get_time_vector(self, num_samples: int, fs: float) -> np.ndarray:
+        """Returns the cached (read-only) sample-time vector for this geometry."""
+        key = (num_samples, fs)
+        time_vector = self._time_vectors.get(key)
+        if time_vector is None:
+            time_vector = (np.arange(num_samples) / fs).astype(np.float32)
+            time_vector.setflags(write=False)
+            self._time_vectors[key] = time_vector
+        return time_vector
         
     def synthesize_multimodal_sample(self, tactical_class_name: str) -> Dict[str, np.ndarray]:
         """
@@ -46,7 +79,7 @@ class RadarDatasetGenerator:
         duration = self.config.get('chirp_duration_s', 0.1)
         fs = self.config.get('sampling_rate_hz', 5e5)
         num_samples = int(fs * duration)
-        time_vector = np.arange(num_samples) / fs
+        time_vector = self._get_time_vector(num_samples, fs)
         
         target_class = tactical_class_name.lower()
         kinematic_params = {}
@@ -54,8 +87,8 @@ class RadarDatasetGenerator:
         # 1. Physics-Driven Signal Synthesis
         if target_class == "noise":
             # Tactical Clutter Modeling (K-distribution for non-Rayleigh sea/urban clutter)
-            signal = generate_stochastic_clutter(num_samples, distribution_type='k', 
-                                              shape_parameter=1.5, scale_parameter=2.0)
+            signal = generate_stochastic_clutter(num_samples, distribution='k', 
+                                              shape=1.5, scale=2.0)
         
         elif target_class == "bird":
             # Biological modulation: 3-10Hz erratic wing flapping AM
@@ -79,13 +112,13 @@ class RadarDatasetGenerator:
                 actual_velocity = kinematic_params["v"] + np.random.normal(0, 3)
                 carrier = np.exp(1j * 2 * np.pi * actual_velocity * time_vector)
                 
-                micro_doppler_modulation = np.zeros(num_samples, dtype=complex)
-                for _ in range(kinematic_params["rotors"]):
-                    rotor_rpm = kinematic_params["rpm"] + np.random.normal(0, 1000)
-                    fm = rotor_rpm / 60.0
-                    # Phase modulation depth (beta) based on blade length and wavelength
-                    beta = (2 * np.pi * kinematic_params["blade_len"]) / 0.03
-                    micro_doppler_modulation += np.exp(1j * beta * np.sin(2 * np.pi * fm * time_vector))
+                # All rotors at once: (rotors, num_samples) phase matrix reduced over rotors
+                rotor_rpm = kinematic_params["rpm"] + np.random.normal(0, 1000, size=kinematic_params["rotors"])
+                fm = (rotor_rpm / 60.0).astype(np.float32)
+                # Phase modulation depth (beta) based on blade length and wavelength
+                beta = (2 * np.pi * kinematic_params["blade_len"]) / 0.03
+                rotor_phase = beta * np.sin(2 * np.pi * np.outer(fm, time_vector))
+                micro_doppler_modulation = np.exp(1j * rotor_phase).sum(axis=0)
                 
                 signal = carrier * (micro_doppler_modulation / kinematic_params["rotors"])
                 
@@ -108,14 +141,18 @@ class RadarDatasetGenerator:
                 phase_path = (2 * np.pi / wavelength) * (v0 * time_vector + 0.5 * acceleration * time_vector**2)
                 signal = np.exp(1j * phase_path)
 
+        # Single precision end to end: halves FFT/STFT memory traffic and matches
+        # the float32 tensors the batch is delivered as
+        signal = signal.astype(np.complex64, copy=False)
+        
         # 2. Adaptive Noise Injection (Signal-to-Noise Floor Calibration)
         target_snr = np.random.uniform(5, 30)
-        signal = inject_thermal_awgn(signal, target_snr_db=target_snr)
+        signal = inject_thermal_awgn(signal, snr_db=target_snr)
         
         # 3. Multimodal Tactical Feature Extraction
         # Spatial-Spectral Mapping (Range-Doppler)
         # Using 64-pulse coherent processing interval (CPI)
-        spectral_map = compute_range_doppler_map(signal, n_chirps=64, samples_per_chirp=num_samples//64)
+        spectral_map = compute_range_doppler_map(signal, num_pulses=64, samples_per_pulse=num_samples//64)
         
         # Temporal-Frequency Mapping (Spectrogram)
         temporal_spectrogram = compute_spectrogram(signal, sampling_rate_hz=fs, nperseg=256, noverlap=128)
@@ -137,26 +174,55 @@ class RadarDatasetGenerator:
             }
         }
 
-    def generate_batch(self, samples_per_class: int = 50) -> Dict[str, torch.Tensor]:
+    def generate_batch(self, samples_per_class: int = 50,
+                       num_workers: Optional[int] = None) -> Dict[str, torch.Tensor]:
         """
         Orchestrates the synthesis of a balanced multimodal training batch.
+        
+        Samples are independent, so they are synthesized across a process pool
+        (one worker per core by default, overridable via the 'num_workers'
+        config key or argument). Output order is class-major regardless of the
+        order in which workers finish.
         """
-        accumulation_rd = []
-        accumulation_spec = []
-        accumulation_ts = []
-        accumulation_y = []
+        if num_workers is None:
+            num_workers = self.config.get('num_workers', os.cpu_count() or 1)
+        
+        tasks = [tactical_class for tactical_class in self.target_labels
+                 for _ in range(samples_per_class)]
+        total = len(tasks)
+        
+        # Output buffers are allocated once the first sample fixes the shapes and
+        # filled in place, then handed to torch without another copy.
+        outputs: Dict[str, np.ndarray] = {}
+        
+        def store(index: int, sample: Dict[str, np.ndarray]):
+            if not outputs:
+                outputs["rd_maps"] = np.empty((total,) + sample["spectral_map"].shape, dtype=np.float32)
+                outputs["spectrograms"] = np.empty((total,) + sample["spectrogram"].shape, dtype=np.float32)
+                outputs["time_series"] = np.empty((total,) + sample["kinematic_series"].shape, dtype=np.float32)
+                outputs["labels"] = np.empty(total, dtype=np.int64)
+            outputs["rd_maps"][index] = sample["spectral_map"]
+            outputs["spectrograms"][index] = sample["spectrogram"]
+            outputs["time_series"][index] = sample["kinematic_series"]
+            outputs["labels"][index] = sample["label_index"]
+        
+        if num_workers > 1 and total > 1:
+            # Seeds come from the parent RNG so np.random.seed() still makes batches reproducible
+            seeds = np.random.randint(0, 2**32 - 1, size=total, dtype=np.int64)
+            indexed_tasks = [(i, cls, int(seed)) for i, (cls, seed) in enumerate(zip(tasks, seeds))]
+            chunksize = max(1, total // (num_workers * 4))
+            with Pool(min(num_workers, total), initializer=_init_synthesis_worker,
+                      initargs=(self.config,)) as pool:
+                for index, sample in pool.imap_unordered(_synthesize_indexed_sample,
+                                                         indexed_tasks, chunksize=chunksize):
+                    store(index, sample)
+        else:
+            for index, tactical_class in enumerate(tasks):
+                store(index, self.synthesize_multimodal_sample(tactical_class))
         
-        for tactical_class in self.target_labels:
-            for _ in range(samples_per_class):
-                sample = self.synthesize_multimodal_sample(tactical_class)
-                accumulation_rd.append(sample["spectral_map"])
-                accumulation_spec.append(sample["spectrogram"])
-                accumulation_ts.append(sample["kinematic_series"])
-                accumulation_y.append(sample["label_index"])
-                
         return {
-            "rd_maps": torch.tensor(np.array(accumulation_rd), dtype=torch.float32).unsqueeze(1),
-            "spectrograms": torch.tensor(np.array(accumulation_spec), dtype=torch.float32).unsqueeze(1),
-            "time_series": torch.tensor(np.array(accumulation_ts), dtype=torch.float32),
-            "labels": torch.tensor(np.array(accumulation_y), dtype=torch.long)
+            "rd_maps": torch.from_numpy(outputs["rd_maps"]).unsqueeze(1),
+            "spectrograms": torch.from_numpy(outputs["spectrograms"]).unsqueeze(1),
+            "time_series": torch.from_numpy(outputs["time_series"]),
+            "labels": torch.from_numpy(outputs["labels"])
         }
@@ -18,13 +18,30 @@ Intelligence Output:
 Author: Lead AI/ML Radar Architect
 """
 
+import copy
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
-from ai_models.architectures import initialize_tactical_model
+from ai_models.architectures import initialize_tactical_model, load_tactical_weights
+
+
+# torch.compile is deliberately kept off the inference hot path. For a graph
+# this small its tracing/guard overhead outweighs any fusion gain, the first
+# call stalls for seconds while compiling, and shape changes trigger
+# recompiles. Launch overhead is removed with CUDA graph replay instead.
+USE_COMPILE = False
+
+# CPU-only deployments may opt in to INT8 dynamic quantization of the Linear
+# layers (weights stored as int8, activations quantized on the fly). Conv2d has
+# no dynamic-quantized kernel, so the spectral CNN stays FP32 with BatchNorm
+# folded into its convolutions; the quantized LSTM kernel is slower than FP32
+# at single-frame batch sizes and is left unquantized. Off by default: the
+# quantized graph is not differentiable (no Grad-CAM) and its per-batch
+# activation scales make batch and single-frame results differ slightly.
+USE_INT8_ON_CPU = False
 
 
 @dataclass
@@ -34,6 +51,7 @@ class IntelligenceOutput:
     inference_confidence: float
     class_probabilities: Dict[str, float]
     attention_weights: Optional[np.ndarray] = None
+    probabilities: Optional[np.ndarray] = None  # Same distribution as an array, in class order
 
 
 def get_tactical_classes() -> List[str]:
@@ -46,12 +64,16 @@ class IntelligencePipeline:
     Orchestration layer for Radar Artificial Intelligence.
     Handles data normalization, tensor conversion, and model execution.
     """
-    def __init__(self, model_checkpoint_path: Optional[str] = None):
+    def __init__(self,
+                 model_checkpoint_path: Optional[str] = None,
+                 use_int8_on_cpu: Optional[bool] = None):
         """
         Initializes the intelligence pipeline.
         
         Args:
             model_checkpoint_path: Optional path to serialized PyTorch weights.
+            use_int8_on_cpu: Run inference on an INT8 dynamic-quantized copy
+                of the model when on CPU (defaults to USE_INT8_ON_CPU).
         """
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.target_labels = get_tactical_classes()
@@ -63,68 +85,257 @@ class IntelligencePipeline:
         
         if model_checkpoint_path:
             try:
-                self.model.load_state_dict(torch.load(model_checkpoint_path, map_location=self.device))
+                self.model.load_state_dict(load_tactical_weights(model_checkpoint_path))
             except FileNotFoundError:
                 print(f"[RECON-AI] Warning: Specified checkpoint not found. Operating with heuristic weights.")
+        
+        # Unquantized FP32 model, kept for gradient-based XAI (Grad-CAM,
+        # attribution); self.model is what the inference path executes
+        self.fp32_model = self.model
+        if use_int8_on_cpu is None:
+            use_int8_on_cpu = USE_INT8_ON_CPU
+        if use_int8_on_cpu and self.device.type == "cpu":
+            self.model = self._quantize_for_cpu(self.model)
+        
+        if USE_COMPILE:
+            self.model = torch.compile(self.model)
+        
+        # Single-frame CUDA graph (captured lazily per input shape); per-frame
+        # inference at batch 1 is otherwise dominated by kernel-launch overhead
+        self.use_cuda_graph = self.device.type == "cuda"
+        self._cuda_graph = None
+        self._graph_key = None
+        
+        # Reduced-precision inference on CUDA (BF16 where supported, else FP16)
+        self.use_amp = self.device.type == "cuda"
+        self.amp_dtype = (torch.bfloat16 if self.use_amp and torch.cuda.is_bf16_supported()
+                          else torch.float16)
+        
+        # Reusable pinned host staging buffers for H2D copies, keyed by (slot, shape)
+        self._pinned_buffers: Dict[Tuple[str, Tuple[int, ...]], torch.Tensor] = {}
+
+    @staticmethod
+    def _quantize_for_cpu(model: nn.Module) -> nn.Module:
+        """
+        Returns a BatchNorm-folded, INT8 dynamic-quantized copy of the model
+        for CPU inference; the model passed in is left untouched.
+        """
+        quantized = copy.deepcopy(model).fuse_for_inference()
+        try:
+            return torch.ao.quantization.quantize_dynamic(
+                quantized, {nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+        except (RuntimeError, AssertionError) as e:
+            print(f"[RECON-AI] Warning: INT8 quantization unavailable ({e}). Using FP32 weights.")
+            return model
 
     def preprocess_spectral_map(self, rd_intensity_map: np.ndarray) -> torch.Tensor:
         """
         Prepares 2D Range-Doppler maps for CNN ingestion.
+        
+        Accepts a single (H, W) map or a (Batch, H, W) stack. The raw maps are
+        uploaded once; normalization and resampling run on the inference
+        device as batched tensor ops.
         """
-        # 1. Normalization (Min-Max Scaling to [0, 1])
-        # Assumes input in dB or linear power
-        val_min = np.min(rd_intensity_map)
-        val_max = np.max(rd_intensity_map)
+        # (H, W) or (Batch, H, W) -> (Batch, Channels=1, H, W)
+        tensor = self._to_device(rd_intensity_map, 'spectral')
+        if tensor.dim() == 2:
+            tensor = tensor.unsqueeze(0)
+        tensor = tensor.unsqueeze(1)
         
-        if val_max - val_min > 1e-9:
-            normalized_map = (rd_intensity_map - val_min) / (val_max - val_min)
-        else:
-            normalized_map = rd_intensity_map
-            
-        # 2. Tensor Conversion & Dimensionality Alignment
-        # (H, W) -> (Batch=1, Channels=1, H, W)
-        tensor = torch.tensor(normalized_map, dtype=torch.float32).unsqueeze(0).unsqueeze(0)
+        # 1. Normalization (Min-Max Scaling to [0, 1], per map)
+        # Assumes input in dB or linear power; flat maps pass through unscaled
+        # aminmax finds both extrema in one pass over each map
+        val_min, val_max = torch.aminmax(tensor.flatten(1), dim=1)
+        val_min = val_min.view(-1, 1, 1, 1)
+        val_span = val_max.view(-1, 1, 1, 1) - val_min
+        tensor = torch.where(val_span > 1e-9, (tensor - val_min) / val_span.clamp_min(1e-9), tensor)
         
-        # 3. Spatial Resampling (Bilinear Interpolation)
-        # Standardizes input size to model's receptive field
-        resampled_tensor = F.interpolate(tensor, size=(128, 128), mode='bilinear', align_corners=False)
+        # 2. Spatial Resampling
+        # Standardizes input size to model's receptive field. Downsampling uses
+        # area averaging (cheaper per output pixel and alias-free); bilinear
+        # interpolation is kept for maps smaller than the target in any axis.
+        height, width = tensor.shape[-2:]
+        if (height, width) != (128, 128):
+            if height >= 128 and width >= 128:
+                tensor = F.interpolate(tensor, size=(128, 128), mode='area')
+            else:
+                tensor = F.interpolate(tensor, size=(128, 128), mode='bilinear', align_corners=False)
         
-        return resampled_tensor.to(self.device)
+        return tensor
 
     def preprocess_kinematic_stream(self, doppler_time_series: np.ndarray) -> torch.Tensor:
         """
         Prepares 1D Doppler/Kinematic sequences for RNN ingestion.
         """
         # Ensure sequence is a float tensor with batch dimension
-        tensor = torch.tensor(doppler_time_series, dtype=torch.float32)
+        tensor = self._to_device(doppler_time_series, 'kinematic')
         if tensor.dim() == 1:
             tensor = tensor.unsqueeze(0) # Add batch dim
             
-        return tensor.to(self.device)
+        return tensor
+
+    def _to_device(self, array: np.ndarray, staging_slot: str) -> torch.Tensor:
+        """
+        Moves a host array to the inference device as float32.
+        
+        On CUDA the data is staged through a pinned buffer that is allocated
+        once per (slot, shape) and reused every frame, so the copy is an async
+        DMA without per-call pinned allocations. Reuse is safe because each
+        inference call synchronizes on its results before returning.
+        """
+        if self.device.type != "cuda":
+            return torch.from_numpy(np.ascontiguousarray(array, dtype=np.float32))
+        
+        buffer_key = (staging_slot, np.shape(array))
+        pinned_buffer = self._pinned_buffers.get(buffer_key)
+        if pinned_buffer is None:
+            pinned_buffer = torch.empty(np.shape(array), dtype=torch.float32, pin_memory=True)
+            self._pinned_buffers[buffer_key] = pinned_buffer
+        np.copyto(pinned_buffer.numpy(), array, casting='unsafe')
+        return pinned_buffer.to(self.device, non_blocking=True)
 
     def infer_tactical_intelligence(self, 
                                    rd_intensity_map: np.ndarray, 
-                                   doppler_time_series: np.ndarray) -> IntelligenceOutput:
+                                   doppler_time_series: np.ndarray,
+                                   return_attention: bool = True) -> IntelligenceOutput:
         """
         Executes multimodal inference to classify a radar tactical entity.
+        
+        Attention weights ((1, Seq_Len, 1)) are copied back to the host
+        unless return_attention is cleared; per-frame callers that do not
+        read them should clear it to skip the copy.
+        """
+        prediction_indices, soft_probabilities, attention_weights = self._forward(
+            rd_intensity_map, doppler_time_series, return_attention
+        )
+        return self._build_output(prediction_indices[0], soft_probabilities[0], attention_weights)
+
+    def infer_tactical_intelligence_batch(self,
+                                         rd_intensity_maps: np.ndarray,
+                                         doppler_time_series: np.ndarray,
+                                         return_attention: bool = False) -> List[IntelligenceOutput]:
+        """
+        Classifies a batch of tactical entities in a single forward pass.
+        
+        Args:
+            rd_intensity_maps: (Batch, H, W) Range-Doppler maps.
+            doppler_time_series: (Batch, Seq_Len) kinematic sequences.
+            return_attention: Whether to include per-entry attention weights.
+            
+        Returns:
+            One IntelligenceOutput per batch entry, in input order.
+        """
+        prediction_indices, soft_probabilities, attention_weights = self._forward(
+            rd_intensity_maps, doppler_time_series, return_attention
+        )
+        return [
+            self._build_output(
+                prediction_idx,
+                probabilities,
+                attention_weights[i] if attention_weights is not None else None
+            )
+            for i, (prediction_idx, probabilities) in enumerate(zip(prediction_indices, soft_probabilities))
+        ]
+
+    def _forward(self,
+                 rd_intensity_map: np.ndarray,
+                 doppler_time_series: np.ndarray,
+                 return_attention: bool = False) -> Tuple[List[int], np.ndarray, Optional[np.ndarray]]:
+        """
+        Runs preprocessing and the model.
+        
+        Returns:
+            Predicted class indices, (Batch, Classes) probabilities and attention
+            weights (None unless return_attention is set).
         """
         # Pre-processing
         tensor_map = self.preprocess_spectral_map(rd_intensity_map)
         tensor_stream = self.preprocess_kinematic_stream(doppler_time_series)
         
-        with torch.no_grad():
-            # Dual-path forward pass
-            logits, attention_weights = self.model(tensor_map, tensor_stream)
+        with torch.inference_mode():
+            # Dual-path forward pass. The autocast weight-cast cache is disabled:
+            # a CUDA graph captured inside this block must own its cast weights
+            # rather than point at cache entries freed when autocast exits
+            with torch.autocast(device_type=self.device.type, dtype=self.amp_dtype,
+                                enabled=self.use_amp, cache_enabled=False):
+                logits, attention_weights = self._run_model(tensor_map, tensor_stream)
             
-            # Probability calibration
-            soft_probabilities = F.softmax(logits, dim=1).cpu().numpy()[0]
+            # Probability calibration (in FP32) and class decision on the device
+            soft_probabilities = F.softmax(logits.float(), dim=1)
+            prediction_indices = soft_probabilities.argmax(dim=1)
             
-        prediction_idx = np.argmax(soft_probabilities)
-        probability_map = {label: float(p) for label, p in zip(self.target_labels, soft_probabilities)}
+            # Pack everything into one tensor so results cross to the host in a
+            # single synchronizing copy: [index | probabilities | attention?]
+            if not return_attention:
+                attention_weights = None
+            packed_columns = [prediction_indices.unsqueeze(1).float(), soft_probabilities]
+            if attention_weights is not None:
+                packed_columns.append(attention_weights.float().flatten(1))
+            packed = torch.cat(packed_columns, dim=1).cpu().numpy()
+        
+        num_classes = soft_probabilities.shape[1]
+        attention = None
+        if attention_weights is not None:
+            attention = packed[:, 1 + num_classes:].reshape(attention_weights.shape)
+        return packed[:, 0].astype(np.int64).tolist(), packed[:, 1:1 + num_classes], attention
+
+    def _run_model(self,
+                   tensor_map: torch.Tensor,
+                   tensor_stream: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Executes the model, replaying a captured CUDA graph for single frames."""
+        if not self.use_cuda_graph or tensor_map.shape[0] != 1:
+            return self.model(tensor_map, tensor_stream)
         
+        graph_key = (tuple(tensor_map.shape), tuple(tensor_stream.shape))
+        if graph_key != self._graph_key and not self._capture_cuda_graph(tensor_map, tensor_stream, graph_key):
+            return self.model(tensor_map, tensor_stream)
+        
+        self._static_map.copy_(tensor_map)
+        self._static_stream.copy_(tensor_stream)
+        self._cuda_graph.replay()
+        return self._static_logits, self._static_attention
+
+    def _capture_cuda_graph(self,
+                            tensor_map: torch.Tensor,
+                            tensor_stream: torch.Tensor,
+                            graph_key: tuple) -> bool:
+        """Records the forward pass into a CUDA graph over static I/O buffers."""
+        try:
+            self._static_map = tensor_map.clone()
+            self._static_stream = tensor_stream.clone()
+            
+            # Warm up on a side stream so lazy cuDNN/allocator setup is not captured
+            warmup_stream = torch.cuda.Stream()
+            warmup_stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(warmup_stream):
+                for _ in range(3):
+                    self.model(self._static_map, self._static_stream)
+            torch.cuda.current_stream().wait_stream(warmup_stream)
+            
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                self._static_logits, self._static_attention = self.model(self._static_map, self._static_stream)
+        except RuntimeError as e:
+            print(f"[RECON-AI] Warning: CUDA graph capture failed ({e}). Using eager execution.")
+            self.use_cuda_graph = False
+            self._cuda_graph = None
+            self._graph_key = None
+            return False
+        
+        self._cuda_graph = graph
+        self._graph_key = graph_key
+        return True
+
+    def _build_output(self,
+                      prediction_idx: int,
+                      soft_probabilities: np.ndarray,
+                      attention_weights: Optional[np.ndarray]) -> IntelligenceOutput:
+        """Packages one row of class probabilities into an intelligence report."""
         return IntelligenceOutput(
             tactical_class=self.target_labels[prediction_idx],
             inference_confidence=float(soft_probabilities[prediction_idx]),
-            class_probabilities=probability_map,
-            attention_weights=attention_weights.cpu().numpy() if attention_weights is not None else None
+            class_probabilities=dict(zip(self.target_labels, soft_probabilities.tolist())),
+            attention_weights=attention_weights,
+            probabilities=soft_probabilities
         )
@@ -14,9 +14,8 @@ import os
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import DataLoader, TensorDataset
 from ai_models.dataset_generator import RadarDatasetGenerator
-from ai_models.architectures import initialize_tactical_model
+from ai_models.architectures import initialize_tactical_model, save_tactical_weights
 from ai_models.model import get_tactical_classes
 
 
@@ -47,40 +46,60 @@ def execute_intelligence_training_entrypoint(num_epochs: int = 5):
     _, spectral_maps, kinematic_series, ground_truth = generate_tactical_training_data(samples_per_vessel_class=25)
     
     # 2. Data Loading Infrastructure
-    training_dataset = TensorDataset(spectral_maps, kinematic_series, ground_truth)
-    intel_loader = DataLoader(training_dataset, batch_size=16, shuffle=True)
+    # The whole dataset fits in memory: move it to the device once and draw
+    # shuffled minibatches by index instead of going through a DataLoader.
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    spectral_maps = spectral_maps.to(device)
+    kinematic_series = kinematic_series.to(device)
+    ground_truth = ground_truth.to(device)
+    num_samples = ground_truth.size(0)
+    batch_size = 16
+    num_batches = (num_samples + batch_size - 1) // batch_size
 
     # 3. Model & Optimization Orchestration
     target_classes = get_tactical_classes()
     intelligence_model = initialize_tactical_model(num_target_classes=len(target_classes))
+    intelligence_model.to(device)
+    
+    # Mixed precision on CUDA: FP16 tensor-core math with dynamic loss scaling
+    use_amp = device.type == "cuda"
+    grad_scaler = torch.amp.GradScaler("cuda", enabled=use_amp)
     
     optimizer = optim.Adam(intelligence_model.parameters(), lr=0.001)
     objective_function = nn.CrossEntropyLoss()
 
     print(f"[TRAIN-IO] Starting training cycle for {len(target_classes)} tactical classes...")
     intelligence_model.train()
+    intelligence_model.zero_grad(set_to_none=True)  # Drop grads instead of zero-filling them
     
     for epoch in range(num_epochs):
-        cumulative_epoch_loss = 0.0
-        for i, (b_spectral, b_kinematic, b_labels) in enumerate(intel_loader):
-            optimizer.zero_grad()
+        cumulative_epoch_loss = torch.zeros((), device=device)  # Read back once per epoch
+        permutation = torch.randperm(num_samples, device=device)
+        for start in range(0, num_samples, batch_size):
+            batch_indices = permutation[start:start + batch_size]
+            b_spectral = spectral_maps[batch_indices]
+            b_kinematic = kinematic_series[batch_indices]
+            b_labels = ground_truth[batch_indices]
+            optimizer.zero_grad(set_to_none=True)
             
-            # Multimodal forward pass
-            inference_logits, _ = intelligence_model(b_spectral, b_kinematic)
+            with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                # Multimodal forward pass
+                inference_logits, _ = intelligence_model(b_spectral, b_kinematic)
+                optimization_loss = objective_function(inference_logits, b_labels)
             
-            optimization_loss = objective_function(inference_logits, b_labels)
-            optimization_loss.backward()
-            optimizer.step()
+            grad_scaler.scale(optimization_loss).backward()
+            grad_scaler.step(optimizer)
+            grad_scaler.update()
             
-            cumulative_epoch_loss += optimization_loss.item()
+            cumulative_epoch_loss += optimization_loss.detach().float()
         
-        avg_loss = cumulative_epoch_loss / len(intel_loader)
+        avg_loss = cumulative_epoch_loss.item() / num_batches
         print(f"  [Epoch {epoch+1}/{num_epochs}] Curriculum Loss: {avg_loss:.4f}")
 
     # 4. Intelligence Persistence
     os.makedirs("results", exist_ok=True)
     persistence_path = "results/tactical_intelligence_weights.pt"
-    torch.save(intelligence_model.state_dict(), persistence_path)
+    save_tactical_weights(intelligence_model, persistence_path)
     print(f"[TRAIN-IO] Tactical weights persisted to: {persistence_path}")
     
     return intelligence_model
@@ -20,9 +20,8 @@ import os
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import DataLoader, TensorDataset
 from ai_models.dataset_generator import RadarDatasetGenerator
-from ai_models.architectures import initialize_tactical_model
+from ai_models.architectures import initialize_tactical_model, save_tactical_weights
 from ai_models.model import get_tactical_classes
 import numpy as np
 
@@ -41,16 +40,23 @@ def execute_intelligence_training_curriculum(num_epochs: int = 15,
     print("[TRAIN-INTEL] Synthesizing high-fidelity tactical dataset...")
     raw_data = data_engine.generate_batch(samples_per_class=120)
     
-    training_set = TensorDataset(
-        raw_data["spectrograms"], 
-        raw_data["time_series"], 
-        raw_data["labels"]
-    )
-    data_loader = DataLoader(training_set, batch_size=training_batch_size, shuffle=True)
+    # The whole dataset fits in memory: move it to the device once and draw
+    # shuffled minibatches by index instead of going through a DataLoader.
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    training_spectrograms = raw_data["spectrograms"].to(device)
+    training_series = raw_data["time_series"].to(device)
+    training_labels = raw_data["labels"].to(device)
+    num_samples = training_labels.size(0)
+    num_batches = (num_samples + training_batch_size - 1) // training_batch_size
     
     # 2. Architect Model & Optimization Function
     target_labels = get_tactical_classes()
     intelligence_model = initialize_tactical_model(num_target_classes=len(target_labels))
+    intelligence_model.to(device)
+    
+    # Mixed precision on CUDA: FP16 tensor-core math with dynamic loss scaling
+    use_amp = device.type == "cuda"
+    grad_scaler = torch.amp.GradScaler("cuda", enabled=use_amp)
     
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(intelligence_model.parameters(), lr=learning_rate)
@@ -58,29 +64,37 @@ def execute_intelligence_training_curriculum(num_epochs: int = 15,
     # 3. Supervised Optimization Loop
     print(f"[TRAIN-INTEL] Initiating curriculum for {len(target_labels)} tactical classes.")
     intelligence_model.train()
+    intelligence_model.zero_grad(set_to_none=True)  # Drop grads instead of zero-filling them
     
     for epoch in range(num_epochs):
-        cumulative_loss = 0.0
-        correct_identifications = 0
-        total_samples = 0
+        # Accumulated on the device; read back once per epoch to avoid a
+        # host sync on every minibatch
+        cumulative_loss = torch.zeros((), device=device)
+        correct_identifications = torch.zeros((), device=device, dtype=torch.long)
         
-        for spectral_maps, kinematic_series, ground_truth_labels in data_loader:
-            optimizer.zero_grad()
+        permutation = torch.randperm(num_samples, device=device)
+        for start in range(0, num_samples, training_batch_size):
+            batch_indices = permutation[start:start + training_batch_size]
+            spectral_maps = training_spectrograms[batch_indices]
+            kinematic_series = training_series[batch_indices]
+            ground_truth_labels = training_labels[batch_indices]
+            optimizer.zero_grad(set_to_none=True)
             
-            # Unpack multimodal outputs (logits + attention)
-            prediction_logits, _ = intelligence_model(spectral_maps, kinematic_series)
+            with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                # Unpack multimodal outputs (logits + attention)
+                prediction_logits, _ = intelligence_model(spectral_maps, kinematic_series)
+                optimization_loss = criterion(prediction_logits, ground_truth_labels)
             
-            optimization_loss = criterion(prediction_logits, ground_truth_labels)
-            optimization_loss.backward()
-            optimizer.step()
+            grad_scaler.scale(optimization_loss).backward()
+            grad_scaler.step(optimizer)
+            grad_scaler.update()
             
-            cumulative_loss += optimization_loss.item()
+            cumulative_loss += optimization_loss.detach().float()
             _, predicted_indices = prediction_logits.max(1)
-            total_samples += ground_truth_labels.size(0)
-            correct_identifications += predicted_indices.eq(ground_truth_labels).sum().item()
+            correct_identifications += predicted_indices.eq(ground_truth_labels).sum()
             
-        epoch_accuracy = 100. * correct_identifications / total_samples
-        avg_loss = cumulative_loss / len(data_loader)
+        epoch_accuracy = 100. * correct_identifications.item() / num_samples
+        avg_loss = cumulative_loss.item() / num_batches
         
         print(f"  [Epoch {epoch+1:02d}/{num_epochs:02d}] Loss: {avg_loss:.4f} | Accuracy: {epoch_accuracy:.2f}%")
         
@@ -88,7 +102,8 @@ def execute_intelligence_training_curriculum(num_epochs: int = 15,
 
 
 def benchmark_intelligence_performance(intelligence_model: nn.Module, 
-                                       evaluation_samples: int = 40):
+                                       evaluation_samples: int = 40,
+                                       evaluation_batch_size: int = 64):
     """
     Performs standardized tactical benchmarking of the trained model.
     """
@@ -99,11 +114,20 @@ def benchmark_intelligence_performance(intelligence_model: nn.Module,
     data_engine = RadarDatasetGenerator(generation_config)
     validation_data = data_engine.generate_batch(samples_per_class=evaluation_samples)
     
-    with torch.no_grad():
-        # Multimodal validation pass
-        logits, _ = intelligence_model(validation_data["spectrograms"], validation_data["time_series"])
-        _, predicted_indices = logits.max(1)
-        ground_truth = validation_data["labels"]
+    # Multimodal validation pass in minibatches to bound peak device memory
+    device = next(intelligence_model.parameters()).device
+    spectrograms = validation_data["spectrograms"]
+    time_series = validation_data["time_series"]
+    ground_truth = validation_data["labels"]
+    
+    batch_predictions = []
+    with torch.inference_mode():
+        for start in range(0, ground_truth.size(0), evaluation_batch_size):
+            stop = start + evaluation_batch_size
+            logits, _ = intelligence_model(spectrograms[start:stop].to(device, non_blocking=True),
+                                           time_series[start:stop].to(device, non_blocking=True))
+            batch_predictions.append(logits.argmax(1).cpu())
+    predicted_indices = torch.cat(batch_predictions)
         
     correct_count = predicted_indices.eq(ground_truth).sum().item()
     total_count = ground_truth.size(0)
@@ -112,10 +136,43 @@ def benchmark_intelligence_performance(intelligence_model: nn.Module,
     print(f"[EVAL-INTEL] Result Summary | Total: {total_count} | Correct: {correct_count} | Accuracy: {final_accuracy:.2f}%")
     
     # Detailed classification report
-    from sklearn.metrics import classification_report
     target_names = get_tactical_classes()
     print("\n[EVAL-INTEL] TACTICAL CLASSIFICATION REPORT:")
-    print(classification_report(ground_truth.numpy(), predicted_indices.numpy(), target_names=target_names))
+    print(format_classification_report(ground_truth.numpy(), predicted_indices.numpy(), target_names))
+
+
+def format_classification_report(ground_truth: np.ndarray,
+                                 predictions: np.ndarray,
+                                 target_names: list) -> str:
+    """
+    Per-class precision/recall/F1 table (sklearn classification_report layout).
+    
+    Built from a single bincount confusion matrix; undefined ratios are 0.
+    """
+    num_classes = len(target_names)
+    confusion = np.bincount(ground_truth * num_classes + predictions,
+                            minlength=num_classes * num_classes).reshape(num_classes, num_classes)
+    
+    true_positives = np.diag(confusion).astype(np.float64)
+    support = confusion.sum(axis=1)
+    predicted_counts = confusion.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.nan_to_num(true_positives / predicted_counts)
+        recall = np.nan_to_num(true_positives / support)
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+    
+    total = support.sum()
+    name_width = max(len(name) for name in target_names + ["weighted avg"])
+    lines = [f"{'':>{name_width}} {'precision':>9} {'recall':>9} {'f1-score':>9} {'support':>9}", ""]
+    for name, p, r, f, n in zip(target_names, precision, recall, f1, support):
+        lines.append(f"{name:>{name_width}} {p:>9.2f} {r:>9.2f} {f:>9.2f} {n:>9d}")
+    lines.append("")
+    lines.append(f"{'accuracy':>{name_width}} {'':>9} {'':>9} {true_positives.sum() / max(total, 1):>9.2f} {total:>9d}")
+    lines.append(f"{'macro avg':>{name_width}} {precision.mean():>9.2f} {recall.mean():>9.2f} {f1.mean():>9.2f} {total:>9d}")
+    weights = support / max(total, 1)
+    lines.append(f"{'weighted avg':>{name_width}} {precision @ weights:>9.2f} {recall @ weights:>9.2f} "
+                 f"{f1 @ weights:>9.2f} {total:>9d}")
+    return "\n".join(lines)
 
 
 if __name__ == "__main__":
@@ -126,5 +183,5 @@ if __name__ == "__main__":
     # Secure model persistence
     os.makedirs("results", exist_ok=True)
     persistence_path = "results/tactical_intelligence_v1.pt"
-    torch.save(model.state_dict(), persistence_path)
+    save_tactical_weights(model, persistence_path)
     print(f"\n[IO-INTEL] Securely persisted model to: {persistence_path}")
@@ -18,6 +18,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, List, Union, Tuple, Optional
 import numpy as np
 import torch
+import torch.nn as nn
 import torch.nn.functional as F
 
 
@@ -44,16 +45,12 @@ class TacticalAttributionGenerator:
         self.gradients: Optional[torch.Tensor] = None
         self.activations: Optional[torch.Tensor] = None
         
-        # Register hooks for back-propagation analysis
+        # Capture target-layer activations; gradients are taken w.r.t. them directly
         self.target_layer.register_forward_hook(self._hook_activations)
-        self.target_layer.register_full_backward_hook(self._hook_gradients)
 
     def _hook_activations(self, module, input, output):
         self.activations = output
 
-    def _hook_gradients(self, module, grad_input, grad_output):
-        self.gradients = grad_output[0]
-
     def generate_saliency_map(self, 
                               spectral_map: torch.Tensor, 
                               kinematic_series: torch.Tensor, 
@@ -61,12 +58,13 @@ class TacticalAttributionGenerator:
         """
         Generates a normalized heatmap indicating feature importance.
         """
-        self.model.zero_grad()
-        logits, _ = self.model(spectral_map, kinematic_series)
-        
-        # Gradient of the winning class w.r.t the target hidden layer
-        target_score = logits[0, target_class_idx]
-        target_score.backward()
+        with torch.enable_grad():
+            logits, _ = self.model(spectral_map.detach(), kinematic_series.detach())
+            
+            # Gradient of the winning class w.r.t the target hidden layer only;
+            # layers below it and parameter .grad buffers are left untouched
+            target_score = logits[0, target_class_idx]
+            self.gradients = torch.autograd.grad(target_score, self.activations)[0]
 
         # Weight the activations by spatial average of gradients (Global Average Pooling)
         weights = torch.mean(self.gradients, dim=(2, 3), keepdim=True)
@@ -90,22 +88,32 @@ def compute_monte_carlo_uncertainty(model: torch.nn.Module,
     """
     Estimates epistemic uncertainty by keeping dropout active during inference.
     """
-    model.train() # Enable Dropout and BatchNorm stochasticity
-    prob_accumulation = []
+    # Enable Dropout only; BatchNorm stays in eval mode so its running
+    # statistics are neither used per-batch nor updated by these passes
+    model.eval()
+    for module in model.modules():
+        if isinstance(module, (nn.Dropout, nn.Dropout1d, nn.Dropout2d, nn.Dropout3d)):
+            module.train()
     
-    with torch.no_grad():
-        for _ in range(stochastic_iterations):
-            logits, _ = model(spectral_map, kinematic_series)
-            probs = F.softmax(logits, dim=1).cpu().numpy()
-            prob_accumulation.append(probs)
-            
-    prob_accumulation = np.array(prob_accumulation)
-    mean_probabilities = np.mean(prob_accumulation, axis=0)[0]
+    # Replicate the sample along the batch axis so all stochastic passes run
+    # as one forward call; dropout draws an independent mask per replica
+    replicated_map = spectral_map[:1].expand(stochastic_iterations, *spectral_map.shape[1:]).contiguous()
+    replicated_series = kinematic_series[:1].expand(stochastic_iterations, *kinematic_series.shape[1:]).contiguous()
     
-    # Entropy as a measure of predictive uncertainty (H = -sum(p * log(p)))
-    predictive_entropy = -np.sum(mean_probabilities * np.log(mean_probabilities + 1e-9))
+    try:
+        with torch.inference_mode():
+            logits, _ = model(replicated_map, replicated_series)
+            mean_probabilities = F.softmax(logits, dim=1).mean(dim=0)
+            
+            # Entropy as a measure of predictive uncertainty (H = -sum(p * log(p)))
+            predictive_entropy = -torch.sum(mean_probabilities * mean_probabilities.clamp_min(1e-9).log())
+            
+            # One host copy for both results: [mean probabilities | entropy]
+            packed = torch.cat([mean_probabilities, predictive_entropy.view(1)]).cpu().numpy()
+    finally:
+        model.eval()
     
-    return mean_probabilities, float(predictive_entropy)
+    return packed[:-1], float(packed[-1])
 
 
 def validate_classification_physics(tactical_class: str, 
@@ -128,6 +136,19 @@ def validate_classification_physics(tactical_class: str,
     return True
 
 
+# Per-class narrative table: lowercase class -> (dominant attribution, weight, template)
+CLASS_NARRATIVES: Dict[str, Tuple[str, float, str]] = {
+    "drone": ("Coherent Modulation", 0.75,
+              "Identified as {tactical_class} based on micro-Doppler sidebands consistent with rotor modulation."),
+    "missile": ("Kinematic-Temporal", 0.85,
+                "Classified as high-threat {tactical_class} due to sustained high-velocity kinematic trajectory."),
+    "bird": ("Coherent Modulation", 0.60,
+             "Biological entity (Bird) signature detected with characteristic low-RCS flapping modulation."),
+    "aircraft": ("Spatial-Spectral (RCS)", 0.80,
+                 "Fixed-wing {tactical_class} identified by large, stable RCS and non-fluctuating Kinematics."),
+}
+
+
 def construct_intelligence_narrative(
     tactical_class_raw: str, 
     calibrated_probs: np.ndarray, 
@@ -152,18 +173,11 @@ def construct_intelligence_narrative(
     operational_warnings = []
     
     # Class-specific characterization
-    if tactical_class.lower() == "drone":
-        attribution["Coherent Modulation"] = 0.75
-        narrative_segments.append(f"Identified as {tactical_class} based on micro-Doppler sidebands consistent with rotor modulation.")
-    elif tactical_class.lower() == "missile":
-        attribution["Kinematic-Temporal"] = 0.85
-        narrative_segments.append(f"Classified as high-threat {tactical_class} due to sustained high-velocity kinematic trajectory.")
-    elif tactical_class.lower() == "bird":
-        attribution["Coherent Modulation"] = 0.60
-        narrative_segments.append(f"Biological entity (Bird) signature detected with characteristic low-RCS flapping modulation.")
-    elif tactical_class.lower() == "aircraft":
-        attribution["Spatial-Spectral (RCS)"] = 0.80
-        narrative_segments.append(f"Fixed-wing {tactical_class} identified by large, stable RCS and non-fluctuating Kinematics.")
+    class_narrative = CLASS_NARRATIVES.get(tactical_class_raw.lower())
+    if class_narrative is not None:
+        attribution_key, attribution_weight, template = class_narrative
+        attribution[attribution_key] = attribution_weight
+        narrative_segments.append(template.format(tactical_class=tactical_class))
     else:
         narrative_segments.append(f"Non-target signature categorized as {tactical_class}.")
 
@@ -4,50 +4,125 @@ import threading
 import time
 import webbrowser
 import json
+import gzip
 import os
-from flask import Flask, jsonify
-from typing import Optional, Dict, Any, List
+import socket
+from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
+from typing import Optional, Dict, Any, List, Tuple
 from collections import deque
-from datetime import datetime
+from itertools import islice
 import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
 from pathlib import Path
+from defense_core.shared_snapshot import SnapshotReader
 # Determine PROJECT_ROOT: api/..
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SHARED_STATE_PATH = PROJECT_ROOT / "runtime" / "shared_state.json"
+HEALTH_PATH = PROJECT_ROOT / "runtime" / "health.json"  # {uptime, tick} sidecar
+
+# JSON Encoding
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (Rust encoder, compact output)."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+        def response(self, *args: Any, **kwargs: Any):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, option=_ORJSON_OPTIONS), mimetype="application/json"
+            )
 
 # Flask App
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+else:
+    # Compact, unsorted output; the default provider pretty-prints in debug
+    # mode and sorts keys on every response
+    app.json.compact = True
+    app.json.sort_keys = False
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encodes a payload to JSON bytes, skipping jsonify's argument handling."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    return app.json.dumps(payload).encode()
+
+def decode_json(raw: bytes) -> Any:
+    """Parses JSON bytes (orjson's parser when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_json_file(path: Path) -> Any:
+    """Reads and parses a JSON file."""
+    return decode_json(path.read_bytes())
 
 # Event Log System
 class EventLog:
-    """Circular buffer for system events."""
+    """
+    Circular buffer for system events.
+    
+    Lock-free: deque.append and tuple(deque) each run as a single C-level
+    operation under the GIL, so writers and readers never see a torn buffer.
+    """
     
     def __init__(self, max_size: int = 100):
         self.events = deque(maxlen=max_size)
-        self.lock = threading.Lock()
     
     def add_event(self, event_type: str, severity: str, message: str, data: Optional[Dict] = None):
         """Add an event to the log."""
-        with self.lock:
-            event = {
-                'timestamp': datetime.now().strftime('%H:%M:%S.%f')[:-3],
-                'type': event_type,
-                'severity': severity,  # INFO, WARNING, CRITICAL
-                'message': message,
-                'data': data or {}
-            }
-            self.events.append(event)
+        # HH:MM:SS.mmm built directly; avoids datetime construction + strftime
+        now = time.time()
+        local = time.localtime(now)
+        event = {
+            'timestamp': f'{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}.{int((now % 1) * 1000):03d}',
+            'type': event_type,
+            'severity': severity,  # INFO, WARNING, CRITICAL
+            'message': message,
+            'data': data or {}
+        }
+        self.events.append(event)
     
     def get_recent(self, count: int = 20) -> List[Dict]:
         """Get recent events in reverse chronological order."""
-        with self.lock:
-            # Return last N events, newest first
-            return list(reversed(list(self.events)))[:count]
+        # Snapshot first: iterating the live deque while a writer appends
+        # raises "deque mutated during iteration"
+        snapshot = tuple(self.events)
+        # Return last N events, newest first
+        return list(islice(reversed(snapshot), count))
 
 # Shared State Container
 class StateContainer:
@@ -57,6 +132,7 @@ class StateContainer:
         self.last_track_ids = set()
         self.last_threat_ids = set()
         self.last_decision_count = 0
+        self.last_publish_seq = None
         self.monitor = None
 
 _SHARED = StateContainer()
@@ -69,6 +145,61 @@ def home():
         'endpoints': ['/state', '/health', '/events']
     })
 
+# Parsed shared-state snapshot, reused while the producer has not published
+# a newer one. Reads within SNAPSHOT_TTL_S of the last check skip even the
+# version check.
+SNAPSHOT_TTL_S = 0.1
+_SNAPSHOT_CACHE: Dict[str, Any] = {'mtime': 0.0, 'seq': None, 'data': None, 'fetched_at': 0.0}
+_SNAPSHOT_LOCK = threading.Lock()
+_SNAPSHOT_READER = SnapshotReader()
+
+def read_shared_snapshot() -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+    """
+    Returns the shared state's publish time and parsed contents.
+    
+    The producer's shared-memory segment is preferred; the JSON file (and
+    its mtime) is used when no segment is available.
+    
+    Returns:
+        (None, None) if nothing is published; (mtime, None) if the snapshot
+        could not be parsed.
+    """
+    with _SNAPSHOT_LOCK:
+        now = time.monotonic()
+        if _SNAPSHOT_CACHE['data'] is not None and now - _SNAPSHOT_CACHE['fetched_at'] < SNAPSHOT_TTL_S:
+            return _SNAPSHOT_CACHE['mtime'], _SNAPSHOT_CACHE['data']
+        
+        published = _SNAPSHOT_READER.read(known_seq=_SNAPSHOT_CACHE['seq'])
+        if published is not None:
+            seq, mtime, payload = published
+            if payload is not None:
+                try:
+                    data = decode_json(payload)
+                except ValueError as e:
+                    logger.error(f"Failed to decode shared state snapshot: {e}")
+                    return mtime, None
+                _SNAPSHOT_CACHE['seq'] = seq
+                _SNAPSHOT_CACHE['data'] = data
+        else:
+            try:
+                mtime = SHARED_STATE_PATH.stat().st_mtime
+            except FileNotFoundError:
+                return None, None
+            
+            if _SNAPSHOT_CACHE['data'] is None or _SNAPSHOT_CACHE['seq'] is not None \
+                    or mtime != _SNAPSHOT_CACHE['mtime']:
+                try:
+                    data = load_json_file(SHARED_STATE_PATH)
+                except (OSError, ValueError) as e:  # ValueError covers truncated mid-write files
+                    logger.error(f"Failed to read shared state file: {e}")
+                    return mtime, None
+                _SNAPSHOT_CACHE['seq'] = None
+                _SNAPSHOT_CACHE['data'] = data
+        
+        _SNAPSHOT_CACHE['mtime'] = mtime
+        _SNAPSHOT_CACHE['fetched_at'] = now
+        return mtime, _SNAPSHOT_CACHE['data']
+
 @app.route('/health')
 def health():
     """System health status."""
@@ -77,17 +208,19 @@ def health():
     uptime = 0
     
     try:
-         if SHARED_STATE_PATH.exists():
-            mtime = SHARED_STATE_PATH.stat().st_mtime
-            if time.time() - mtime < 5.0:
-                fresh = True
-                # Try to read uptime
-                try:
-                    with open(SHARED_STATE_PATH, 'r') as f:
-                        data = json.load(f)
-                        uptime = data.get('uptime', 0)
-                except Exception as read_e:
-                    pass
+        # The producer's health sidecar is a few bytes; the full snapshot is
+        # only consulted for producers that do not write one
+        try:
+            mtime = HEALTH_PATH.stat().st_mtime
+            data = load_json_file(HEALTH_PATH) if time.time() - mtime < 5.0 else None
+        except FileNotFoundError:
+            mtime, data = read_shared_snapshot()
+        except ValueError:
+            data = None
+        if mtime is not None and time.time() - mtime < 5.0:
+            fresh = True
+            if data is not None:
+                uptime = data.get('uptime', 0)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -101,25 +234,43 @@ def health():
         'uptime': uptime
     })
 
+# Serialized /state body for the current shared-state version, plus its
+# compressed variants (filled lazily, one per content coding)
+_STATE_RESPONSE_CACHE: Dict[str, Any] = {'version': None, 'body': None, 'encoded': {}}
+_STATE_RESPONSE_LOCK = threading.Lock()
+
+# Content codings offered for /state, in server preference order
+STATE_ENCODINGS = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+
 @app.route('/state')
 def get_state():
     """Full system state."""
     snapshot = None
+    version = None
     
-    # Try reading from shared state file (IPC mode)
     # Try reading from shared state file (IPC mode)
     try:
-        if SHARED_STATE_PATH.exists():
-            # Check modification time to ensure freshness
-            mtime = SHARED_STATE_PATH.stat().st_mtime
-            if time.time() - mtime < 2.0: # Only accept if fresh
-                with open(SHARED_STATE_PATH, 'r') as f:
-                    snapshot = json.load(f)
+        mtime, data = read_shared_snapshot()
+        # Check publish time to ensure freshness
+        if data is not None and time.time() - mtime < 2.0: # Only accept if fresh
+            # The snapshot version doubles as the validator: unchanged pollers
+            # get a 304 and repeat pollers reuse the encoded body
+            version = str(int(mtime * 1000))
+            encoding = request.accept_encodings.best_match(STATE_ENCODINGS)
+            etag = f'"{version}-{encoding}"' if encoding else f'"{version}"'
+            if request.headers.get('If-None-Match') == etag:
+                return _state_response(b'', etag, None, status=304)
+            with _STATE_RESPONSE_LOCK:
+                if _STATE_RESPONSE_CACHE['version'] == version:
+                    return _state_response(_cached_state_body(encoding), etag, encoding)
+            snapshot = data
     except Exception as e:
         logger.error(f"Failed to read shared state file: {e}")
+        version = None
 
     # Fallback to memory state if available (Legacy/Thread mode)
     if not snapshot and _SHARED.state:
+        version = None
         s = _SHARED.state
         try:
             if hasattr(s, 'tactical_state') and s.tactical_state:
@@ -129,30 +280,70 @@ def get_state():
 
     if not snapshot:
         return jsonify({'error': 'State unavailable'}), 503
-            
+    
+    body = encode_json(_build_state_response(snapshot))
+    if version is None:
+        return app.response_class(body, mimetype="application/json")
+    
+    with _STATE_RESPONSE_LOCK:
+        _STATE_RESPONSE_CACHE['version'] = version
+        _STATE_RESPONSE_CACHE['body'] = body
+        _STATE_RESPONSE_CACHE['encoded'] = {}
+        return _state_response(_cached_state_body(encoding), etag, encoding)
+
+def _cached_state_body(encoding: Optional[str]) -> bytes:
+    """Returns the cached /state body in the given coding (caller holds the lock)."""
+    if encoding is None:
+        return _STATE_RESPONSE_CACHE['body']
+    encoded = _STATE_RESPONSE_CACHE['encoded'].get(encoding)
+    if encoded is None:
+        raw = _STATE_RESPONSE_CACHE['body']
+        # Moderate levels: each version is compressed once but must keep up
+        # with the producer's publish rate
+        if encoding == 'br':
+            encoded = brotli.compress(raw, quality=5)
+        else:
+            encoded = gzip.compress(raw, compresslevel=6)
+        _STATE_RESPONSE_CACHE['encoded'][encoding] = encoded
+    return encoded
+
+def _state_response(body: bytes, etag: str, encoding: Optional[str], status: int = 200):
+    """Wraps an encoded /state body with revalidation and content-coding headers."""
+    response = app.response_class(body, status=status, mimetype="application/json")
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Vary'] = 'Accept-Encoding'
+    if encoding and status == 200:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def _build_state_response(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshapes a tactical snapshot into the /state payload."""
     radar_data = snapshot.get('radar', {})
     ew_data = snapshot.get('ew', {})
     
     # Mock s.running for file mode
     system_running = snapshot.get('ew', {}).get('status') != 'OFFLINE'
     
-    # Create response structure
-    # Create response structure
-    
-    # Extract raw detections from latest history record if available
-    latest_detections = []
+    # Raw detections from the latest history record; detections_idx points
+    # at the same record for clients that read detection_history directly
     det_history = radar_data.get('detection_history', [])
-    if det_history:
-        latest_detections = det_history[-1].get('detections', [])
+    latest_detections = det_history[-1].get('detections', []) if det_history else []
+    
+    # Producers publish the SNR view ready-made; project it for older snapshots
+    snr_history = radar_data.get('snr_history')
+    if snr_history is None:
+        snr_history = [
+            {'frame': h['frame'], 'snr': h['mean_snr_db']} 
+            for h in radar_data.get('telemetry_history', [])
+        ]
 
-    response = {
+    return {
         "radar": {
             "detections": latest_detections,
+            "detections_idx": len(det_history) - 1 if det_history else -1,
             "detection_history": det_history,
-            "snr_history": [
-                {'frame': h['frame'], 'snr': h['mean_snr_db']} 
-                for h in radar_data.get('telemetry_history', [])
-            ],
+            "snr_history": snr_history,
             "tracks": radar_data.get('tracks', []),
             "threats": radar_data.get('threats', [])
         },
@@ -170,8 +361,6 @@ def get_state():
         }
     }
 
-    return jsonify(response)
-
 @app.route('/events')
 def get_events():
     """Recent events."""
@@ -181,6 +370,26 @@ def get_events():
         'count': len(events)
     })
 
+if WATCHDOG_AVAILABLE:
+    class SharedStateFileHandler(FileSystemEventHandler):
+        """Forwards completed writes of the shared-state file to a callback."""
+        
+        def __init__(self, on_update):
+            super().__init__()
+            self._on_update = on_update
+        
+        def on_any_event(self, event):
+            # The producer writes a temp file and renames it into place, which
+            # arrives as a move onto the shared-state path
+            if event.event_type == 'moved':
+                path = event.dest_path
+            elif event.event_type in ('created', 'modified', 'closed'):
+                path = event.src_path
+            else:
+                return
+            if os.fsdecode(path) == str(SHARED_STATE_PATH):
+                self._on_update()
+
 class EventMonitor:
     """Background monitor that watches for state changes and generates events."""
     
@@ -188,48 +397,87 @@ class EventMonitor:
         self._shared = state_container
         self.running = False
         self._thread: Optional[threading.Thread] = None
+        self._observer = None
 
     def start(self):
-        """Start the monitor thread."""
+        """Start watching the shared-state file (falls back to a polling thread)."""
         if not self.running:
             self.running = True
+            if WATCHDOG_AVAILABLE and self._start_observer():
+                logger.info("[UI] Event monitor watching shared state for changes")
+                return
             self._thread = threading.Thread(target=self._monitor_loop, name="EventMonitor")
             self._thread.daemon = True
             self._thread.start()
             logger.info("[UI] Event monitor thread started")
 
+    def _start_observer(self) -> bool:
+        """Blocks on kernel file-change notifications instead of polling."""
+        try:
+            SHARED_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            observer = Observer()
+            observer.schedule(SharedStateFileHandler(self._check_snapshot),
+                              str(SHARED_STATE_PATH.parent), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except OSError as e:
+            logger.warning(f"[UI] File watching unavailable ({e}), polling shared state instead")
+            return False
+        
+        self._observer = observer
+        self._check_snapshot()
+        return True
+
     def _monitor_loop(self):
         """Main loop that polls shared state and generates events."""
         while self.running:
-            try:
-                # Read snapshot from file (IPC mode)
-                if SHARED_STATE_PATH.exists():
-                    mtime = SHARED_STATE_PATH.stat().st_mtime
-                    if time.time() - mtime < 2.0:
-                        with open(SHARED_STATE_PATH, 'r') as f:
-                            snapshot = json.load(f)
-                        self._process_snapshot(snapshot)
-            except Exception as e:
-                logger.error(f"Event monitor error: {e}")
-            
+            self._check_snapshot()
             time.sleep(0.1)  # 10Hz polling
 
+    def _check_snapshot(self):
+        """Reads the shared-state file and generates events if it is fresh."""
+        try:
+            # Read snapshot from file (IPC mode)
+            if SHARED_STATE_PATH.exists():
+                mtime = SHARED_STATE_PATH.stat().st_mtime
+                if time.time() - mtime < 2.0:
+                    snapshot = load_json_file(SHARED_STATE_PATH)
+                    self._process_snapshot(snapshot)
+        except Exception as e:
+            logger.error(f"Event monitor error: {e}")
+
     def _process_snapshot(self, snapshot: Dict[str, Any]):
         """Detect changes and generate events using ID tracking."""
         radar_data = snapshot.get('radar', {})
         ew_data = snapshot.get('ew', {})
         
-        current_tracks = radar_data.get('tracks', [])
+        # Same publication seen again (e.g. several file events per write)
+        publish_seq = snapshot.get('publish_seq')
+        if publish_seq is not None and publish_seq == self._shared.last_publish_seq:
+            return
+        
         current_threats = radar_data.get('threats', [])
         current_decision_count = ew_data.get('decision_count', 0)
         
         # Extract IDs - support both 'id' and 'track_id'
-        current_track_ids = {str(t.get('id') or t.get('track_id')) for t in current_tracks if (t.get('id') is not None or t.get('track_id') is not None)}
         current_threat_ids = {str(t.get('id') or t.get('track_id')) for t in current_threats if (t.get('id') is not None or t.get('track_id') is not None)}
         
         # 1. Detect new/removed tracks
-        new_tracks = current_track_ids - self._shared.last_track_ids
-        lost_tracks = self._shared.last_track_ids - current_track_ids
+        # The producer publishes the delta against its previous snapshot; it is
+        # only usable if that snapshot is the last one this monitor processed
+        track_diff = radar_data.get('track_diff')
+        if (track_diff is not None and self._shared.last_publish_seq is not None
+                and publish_seq == self._shared.last_publish_seq + 1):
+            new_tracks = track_diff['added']
+            lost_tracks = track_diff['removed']
+            current_track_ids = self._shared.last_track_ids
+            current_track_ids.difference_update(lost_tracks)
+            current_track_ids.update(new_tracks)
+        else:
+            current_tracks = radar_data.get('tracks', [])
+            current_track_ids = {str(t.get('id') or t.get('track_id')) for t in current_tracks if (t.get('id') is not None or t.get('track_id') is not None)}
+            new_tracks = current_track_ids - self._shared.last_track_ids
+            lost_tracks = self._shared.last_track_ids - current_track_ids
         
         for tid in new_tracks:
             self._shared.event_log.add_event(
@@ -273,14 +521,20 @@ class EventMonitor:
         self._shared.last_track_ids = current_track_ids
         self._shared.last_threat_ids = current_threat_ids
         self._shared.last_decision_count = current_decision_count
+        self._shared.last_publish_seq = publish_seq
 
 # Process-local monitor tracking
 _MONITOR_INITIALIZED = False
+_MONITOR_LOCK = threading.Lock()
 
 def ensure_monitor():
-    """Ensure the event monitor is running in this process."""
+    """Ensure the event monitor is running in this process (safe to call from any thread)."""
     global _MONITOR_INITIALIZED
-    if not _MONITOR_INITIALIZED:
+    if _MONITOR_INITIALIZED:
+        return
+    with _MONITOR_LOCK:
+        if _MONITOR_INITIALIZED:
+            return
         if _SHARED.monitor is None:
             _SHARED.monitor = EventMonitor(_SHARED)
         _SHARED.monitor.start()
@@ -289,14 +543,22 @@ def ensure_monitor():
 
 @app.before_request
 def check_monitor():
-    """Check monitor on every request (first one will trigger initialization)."""
-    ensure_monitor()
+    """Start the monitor on the first request; a flag check on every later one."""
+    if not _MONITOR_INITIALIZED:
+        ensure_monitor()
 
 def run_server_thread():
     """Target for the server thread."""
-    logger.info("[UI] Starting API Server on port 5000...")
-    # Disable reloader and debugger for thread safety
-    app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False)
+    try:
+        from waitress import serve
+        # Thread-pool WSGI server: concurrent dashboard polls overlap instead
+        # of queueing behind one another
+        logger.info("[UI] Starting API Server on port 5000 (waitress, 8 threads)...")
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    except ImportError:
+        logger.info("[UI] Starting API Server on port 5000...")
+        # Disable reloader and debugger for thread safety
+        app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False)
 
 def start_server(shared_state_obj):
     """
@@ -308,8 +570,7 @@ def start_server(shared_state_obj):
     _SHARED.state = shared_state_obj
     
     # Start Event Monitor first
-    monitor = EventMonitor(_SHARED)
-    monitor.start()
+    ensure_monitor()
     
     t = threading.Thread(target=run_server_thread, name="APIServer")
     t.daemon = True
@@ -318,7 +579,13 @@ def start_server(shared_state_obj):
     
     # Auto-open browser
     def open_browser():
-        time.sleep(1.5)  # Wait for server startup
+        # Wait until the server accepts connections (up to ~2.5s)
+        for _ in range(50):
+            try:
+                with socket.create_connection(('127.0.0.1', 5000), timeout=0.05):
+                    break
+            except OSError:
+                time.sleep(0.05)
         url = "http://localhost:5000"
         logger.info(f"[UI] Opening browser at {url}")
         webbrowser.open(url)
@@ -327,8 +594,7 @@ def start_server(shared_state_obj):
 
 if __name__ == "__main__":
     # Start Event Monitor if running as standalone process
-    monitor = EventMonitor(_SHARED)
-    monitor.start()
+    ensure_monitor()
     
     try:
         import uvicorn
@@ -34,9 +34,13 @@ Author: Cognitive Radar Systems Team
 from cognitive.engine import (
     CognitiveRadarEngine,
     SituationAssessment,
+    SituationAssessmentArray,
+    FrameBatch,
     SceneType,
     AdaptationCommand,
     CognitiveRadarState,
+    TrackBatch,
+    create_track_batch_for_cognitive,
     create_track_dict_for_cognitive,
     extract_track_metrics,
 )
@@ -62,8 +66,11 @@ __all__ = [
     # Engine components
     "CognitiveRadarEngine",
     "SituationAssessment",
+    "SituationAssessmentArray",
+    "FrameBatch",
     "AdaptationCommand",
     "SceneType",
+    "TrackBatch",
     
     # Parameter management
     "RadarWaveformParameters",
@@ -75,6 +82,7 @@ __all__ = [
     "EWIntelligencePipeline",
     
     # Utilities
+    "create_track_batch_for_cognitive",
     "create_track_dict_for_cognitive",
     "extract_track_metrics",
     "convert_config_to_waveform_params",
@@ -14,9 +14,12 @@ Key Functions:
 Author: Cognitive Radar Systems Team
 """
 
+import math
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from itertools import islice
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
 import logging
 
@@ -33,7 +36,60 @@ class SceneType(Enum):
     CLUTTERED = "Cluttered"     # High false alarm rate
 
 
-@dataclass
+# Internal scene codes (the engine compares plain ints; SceneType is only
+# materialised for reporting)
+SCENE_SEARCH = 0
+SCENE_SPARSE = 1
+SCENE_TRACKING = 2
+SCENE_DENSE = 3
+SCENE_CLUTTERED = 4
+
+SCENE_TYPES: Tuple[SceneType, ...] = (
+    SceneType.SEARCH, SceneType.SPARSE, SceneType.TRACKING, SceneType.DENSE, SceneType.CLUTTERED
+)  # Indexed by scene code
+SCENE_CODES: Dict[SceneType, int] = {scene: code for code, scene in enumerate(SCENE_TYPES)}
+
+
+# Decision outcomes per adapted parameter, indexed by reason code:
+# parameter -> ((scaling, reasoning template), ...). Code 0 is the nominal
+# outcome; templates are formatted only when an explanation is requested,
+# from the metrics named in REASON_ARG_NAMES.
+DECISION_TABLE: Dict[str, Tuple[Tuple[float, str], ...]] = {
+    'tx_power_scaling': (
+        (1.0, "Nominal operating point"),
+        (1.5, "Low classification confidence ({avg_conf:.1%}): boost TX power for weak target SNR"),  # Increase 50%
+        (0.8, "Stable tracks ({track_stability:.2f}) + high SNR ({snr_db:.1f} dB): "
+              "reduce power for efficiency"),  # Reduce 20%
+    ),
+    'bandwidth_scaling': (
+        (1.0, "Standard range resolution"),
+        (1.3, "Cluttered scene (clutter ratio {clutter_ratio:.1%}): expand BW for range resolution"),  # Expand 30%
+        (1.2, "Dense targets (swarm): expand BW to separate closely-spaced targets"),  # Expand 20%
+    ),
+    'cfar_alpha_scale': (
+        (1.0, "Standard CFAR threshold"),
+        (0.9, "High classification confidence ({avg_conf:.1%}): aggressive detection enabled"),  # Tighten by 10%
+        (1.2, "Clutter-rich environment: conservative threshold to avoid false alarms"),  # Relax by 20%
+    ),
+    'dwell_time_scale': (
+        (1.0, "Standard integration time"),
+        (1.5, "Unstable tracks ({track_stability:.2f}): extend coherent integration time for SNR"),  # Extend 50%
+        (0.95, "Stable tracks: nominal dwell time"),  # Slight reduction for efficiency
+    ),
+    'prf_scale': (
+        (1.0, "Standard PRF"),
+        (0.9, "High velocity spread ({velocity_spread:.1f} m/s): "
+              "reduce PRF to widen Doppler unambiguous range"),  # Reduce PRF by 10%
+    ),
+}
+
+REASON_ARG_NAMES = ('avg_conf', 'track_stability', 'clutter_ratio', 'snr_db', 'velocity_spread')
+
+# Narrative heading per adapted parameter, e.g. 'TX POWER SCALING'
+DECISION_LABELS: Dict[str, str] = {name: name.upper().replace('_', ' ') for name in DECISION_TABLE}
+
+
+@dataclass(slots=True)
 class SituationAssessment:
     """
     Quantitative assessment of current radar scene.
@@ -62,7 +118,7 @@ class SituationAssessment:
     # Scene characterization
     clutter_ratio: float = 0.0  # num_false_alarms / num_detections
     mean_velocity_spread: float = 0.0  # std of track velocities
-    scene_type: SceneType = SceneType.SEARCH
+    scene_code: int = SCENE_SEARCH  # See SCENE_TYPES
     
     # SNR estimation (from RD-map peak vs noise floor)
     estimated_snr_db: float = 10.0
@@ -70,9 +126,26 @@ class SituationAssessment:
     # Power/efficiency
     mean_signal_power: float = 0.0
     mean_noise_power: float = 0.0
+    
+    @property
+    def scene_type(self) -> SceneType:
+        """Scene classification as a SceneType."""
+        return SCENE_TYPES[self.scene_code]
+    
+    @scene_type.setter
+    def scene_type(self, scene: SceneType):
+        self.scene_code = SCENE_CODES[scene]
+    
+    def to_dict(self) -> Dict:
+        """Field dict for snapshots; the scene is reported as scene_type (a SceneType)."""
+        return {
+            ('scene_type' if name == 'scene_code' else name):
+                (SCENE_TYPES[value] if name == 'scene_code' else value)
+            for name, value in asdict(self).items()
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptationCommand:
     """
     Cognitive engine output: Recommended parameter adaptations for next frame.
@@ -87,25 +160,127 @@ class AdaptationCommand:
     cfar_alpha_scale: float = 1.0
     dwell_time_scale: float = 1.0
     
-    # Explanations
+    # Explanations; `reasoning` is formatted from the reason codes on first
+    # read (see the property bound below the class)
     reasoning: Dict[str, str] = field(default_factory=dict)
+    reason_codes: Dict[str, int] = field(default_factory=dict)  # Index into DECISION_TABLE
+    reason_args: Tuple[float, ...] = ()  # Metric values in REASON_ARG_NAMES order
     decision_confidence: float = 0.7  # Confidence in this adaptation
     
     # Impact predictions
     predicted_snr_improvement_db: float = 0.0
     predicted_pfa_change: float = 0.0  # Fractional change
     predicted_range_resolution_m: float = 0.0
+    
+    def explain(self) -> Dict[str, str]:
+        """
+        Per-parameter reasoning, formatted from the reason codes on first use.
+        
+        Returns:
+            reasoning dict (empty if the engine recorded no XAI arguments)
+        """
+        reasoning = _REASONING_SLOT.__get__(self)
+        if not reasoning and self.reason_args:
+            metrics = dict(zip(REASON_ARG_NAMES, self.reason_args))
+            for param_name, code in self.reason_codes.items():
+                reasoning[param_name] = DECISION_TABLE[param_name][code][1].format(**metrics)
+        return reasoning
+
+
+def _set_reasoning(cmd: AdaptationCommand, reasoning: Optional[Dict[str, str]]):
+    _REASONING_SLOT.__set__(cmd, dict(reasoning) if reasoning else {})
+
+
+# `reasoning` stays an ordinary field (init, repr, eq, asdict all see it); its
+# slot is wrapped after class creation so every read goes through explain()
+_REASONING_SLOT = AdaptationCommand.reasoning
+AdaptationCommand.reasoning = property(AdaptationCommand.explain, _set_reasoning,
+                                       doc="Per-parameter reasoning strings (see explain()).")
+
+
+# AdaptationCommand float fields kept per entry in AdaptationHistory
+HISTORY_SCALINGS = ('bandwidth_scaling', 'prf_scale', 'tx_power_scaling',
+                    'cfar_alpha_scale', 'dwell_time_scale')
+HISTORY_PREDICTIONS = ('decision_confidence', 'predicted_snr_improvement_db',
+                       'predicted_pfa_change', 'predicted_range_resolution_m')
+HISTORY_REASON_PARAMS = tuple(DECISION_TABLE)
+
+
+class AdaptationHistory:
+    """
+    Bounded ring buffer of past adaptations.
+    
+    Stores each command's frame id, timestamp, scalings, predictions and
+    reason codes/arguments in preallocated arrays instead of retaining the
+    command objects; indexing rebuilds an AdaptationCommand whose reasoning
+    is formatted on demand (oldest first, negative indices count from the
+    newest, slices return lists).
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.frame_ids = np.zeros(capacity, dtype=np.int64)
+        self.timestamps = np.zeros(capacity)
+        self.scalings = np.zeros((capacity, len(HISTORY_SCALINGS)))
+        self.predictions = np.zeros((capacity, len(HISTORY_PREDICTIONS)))
+        self.reason_codes = np.full((capacity, len(HISTORY_REASON_PARAMS)), -1, dtype=np.int8)
+        self.reason_args = np.zeros((capacity, len(REASON_ARG_NAMES)))
+        self.has_reason_args = np.zeros(capacity, dtype=bool)
+        # Reasoning supplied as text rather than codes (rare; None otherwise)
+        self.reasoning_text = np.full(capacity, None, dtype=object)
+        self._next = 0    # Slot the next entry is written to
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, cmd: AdaptationCommand):
+        """Record cmd, overwriting the oldest entry once full."""
+        slot = self._next
+        self.frame_ids[slot] = cmd.frame_id
+        self.timestamps[slot] = cmd.timestamp
+        self.scalings[slot] = (cmd.bandwidth_scaling, cmd.prf_scale, cmd.tx_power_scaling,
+                               cmd.cfar_alpha_scale, cmd.dwell_time_scale)
+        self.predictions[slot] = (cmd.decision_confidence, cmd.predicted_snr_improvement_db,
+                                  cmd.predicted_pfa_change, cmd.predicted_range_resolution_m)
+        codes = cmd.reason_codes
+        self.reason_codes[slot] = [codes.get(name, -1) for name in HISTORY_REASON_PARAMS]
+        self.has_reason_args[slot] = bool(cmd.reason_args)
+        if cmd.reason_args:
+            self.reason_args[slot] = cmd.reason_args
+        self.reasoning_text[slot] = _REASONING_SLOT.__get__(cmd) or None
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[AdaptationCommand, List[AdaptationCommand]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("adaptation history index out of range")
+        slot = (self._next - self._count + index) % self.capacity
+        return AdaptationCommand(
+            frame_id=int(self.frame_ids[slot]),
+            timestamp=float(self.timestamps[slot]),
+            reasoning=self.reasoning_text[slot],
+            reason_codes={name: code for name, code in
+                          zip(HISTORY_REASON_PARAMS, self.reason_codes[slot].tolist()) if code >= 0},
+            reason_args=tuple(self.reason_args[slot].tolist()) if self.has_reason_args[slot] else (),
+            **dict(zip(HISTORY_SCALINGS, self.scalings[slot].tolist())),
+            **dict(zip(HISTORY_PREDICTIONS, self.predictions[slot].tolist()))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class CognitiveRadarState:
     """
     Persistent state of cognitive engine across frames.
     """
     last_adaptation: Optional[AdaptationCommand] = None
-    adaptation_history: List[AdaptationCommand] = field(default_factory=list)
-    parameter_history: List[Dict] = field(default_factory=list)
-    scene_history: List[SceneType] = field(default_factory=list)
+    adaptation_history: AdaptationHistory = field(default_factory=AdaptationHistory)
+    parameter_history: deque = field(default_factory=lambda: deque(maxlen=1000))  # Dict
+    scene_history: deque = field(default_factory=lambda: deque(maxlen=1000))  # Scene codes
     
     # Metrics tracking
     mean_confidence_trend: float = 0.5
@@ -116,6 +291,200 @@ class CognitiveRadarState:
     last_major_adaptation_frame: int = -1000
 
 
+# Track state codes; values mirror tracking.manager.TacticalTrackState
+# (0 = unknown / not supplied)
+TRACK_STATE_CODES: Dict[str, int] = {
+    'PROVISIONAL': 1,
+    'CONFIRMED': 2,
+    'COASTING': 3,
+    'DELETED': 4,
+}
+NUM_TRACK_STATE_CODES = 5
+
+
+@dataclass(slots=True)
+class TrackBatch:
+    """
+    Structure-of-arrays view of the active tracks for situation assessment.
+    Element i of every array describes the same track.
+    """
+    state_codes: np.ndarray   # int8, see TRACK_STATE_CODES
+    stability: np.ndarray     # float64, hits / age in [0, 1]
+    age: np.ndarray           # int32, frames
+    velocity: np.ndarray      # float64, m/s
+    
+    def __len__(self) -> int:
+        return len(self.state_codes)
+    
+    @classmethod
+    def empty(cls, num_tracks: int) -> 'TrackBatch':
+        """Allocate an uninitialised batch for num_tracks tracks."""
+        return cls(
+            state_codes=np.empty(num_tracks, dtype=np.int8),
+            stability=np.empty(num_tracks),
+            age=np.empty(num_tracks, dtype=np.int32),
+            velocity=np.empty(num_tracks),
+        )
+    
+    @classmethod
+    def from_dicts(cls, tracks: List[Dict]) -> 'TrackBatch':
+        """
+        Pack legacy track dicts (see create_track_dict_for_cognitive).
+        Missing fields take the engine's historical defaults.
+        """
+        batch = cls.empty(len(tracks))
+        for i, t in enumerate(tracks):
+            batch.state_codes[i] = TRACK_STATE_CODES.get(t.get('state'), 0)
+            batch.stability[i] = t.get('stability_score', 0.5)
+            batch.age[i] = t.get('age', 1)
+            batch.velocity[i] = t.get('velocity', 0.0)
+        return batch
+    
+    @classmethod
+    def concatenate(cls, batches: List['TrackBatch']) -> 'TrackBatch':
+        """Join several batches end to end."""
+        if not batches:
+            return cls.empty(0)
+        return cls(
+            state_codes=np.concatenate([b.state_codes for b in batches]),
+            stability=np.concatenate([b.stability for b in batches]),
+            age=np.concatenate([b.age for b in batches]),
+            velocity=np.concatenate([b.velocity for b in batches]),
+        )
+
+
+@dataclass(slots=True)
+class FrameBatch:
+    """
+    Structure-of-arrays view of several frames' observables for
+    CognitiveRadarEngine.assess_situation_batch().
+    
+    Per-item arrays (tracks, predictions, class probability rows) hold all
+    frames back to back; the matching *_frame array gives each element's
+    frame index (0..F-1) for grouped reductions.
+    """
+    frame_ids: np.ndarray            # int64[F]
+    timestamps: np.ndarray           # float64[F]
+    num_detections: np.ndarray       # int64[F]
+    tracks: TrackBatch               # T tracks over all frames
+    track_frame: np.ndarray          # int64[T]
+    confidences: np.ndarray          # float64[P], one per AI prediction
+    prediction_frame: np.ndarray     # int64[P]
+    class_probabilities: np.ndarray  # float64[Q, K], non-empty rows, zero-padded
+    probability_frame: np.ndarray    # int64[Q]
+    rd_maps: List[Optional[np.ndarray]] = field(default_factory=list)  # F entries
+    
+    def __len__(self) -> int:
+        return len(self.frame_ids)
+    
+    @classmethod
+    def from_frames(cls, frames: List[Dict]) -> 'FrameBatch':
+        """
+        Pack per-frame inputs into a batch.
+        
+        Args:
+            frames: One dict per frame holding the assess_situation() keyword
+                arguments (frame_id, timestamp, detections, tracks,
+                ai_predictions, rd_map)
+            
+        Returns:
+            FrameBatch covering the frames in order
+        """
+        num_frames = len(frames)
+        track_batches = []
+        track_counts = np.empty(num_frames, dtype=np.int64)
+        confidences = []
+        prediction_frame = []
+        class_rows = []
+        probability_frame = []
+        
+        for f, frame in enumerate(frames):
+            tracks = frame.get('tracks', [])
+            if not isinstance(tracks, TrackBatch):
+                tracks = TrackBatch.from_dicts(tracks)
+            track_batches.append(tracks)
+            track_counts[f] = len(tracks)
+            
+            for pred in frame.get('ai_predictions', []):
+                confidences.append(pred.get('confidence', 0.5))
+                prediction_frame.append(f)
+                probs = pred.get('class_probabilities', [1.0])
+                if len(probs) > 0:
+                    class_rows.append(probs)
+                    probability_frame.append(f)
+        
+        class_matrix = np.zeros((len(class_rows), max(map(len, class_rows), default=0)))
+        for i, probs in enumerate(class_rows):
+            class_matrix[i, :len(probs)] = probs
+        
+        return cls(
+            frame_ids=np.fromiter((frame['frame_id'] for frame in frames), dtype=np.int64, count=num_frames),
+            timestamps=np.fromiter((frame['timestamp'] for frame in frames), dtype=np.float64, count=num_frames),
+            num_detections=np.fromiter((len(frame.get('detections', [])) for frame in frames),
+                                       dtype=np.int64, count=num_frames),
+            tracks=TrackBatch.concatenate(track_batches),
+            track_frame=np.repeat(np.arange(num_frames), track_counts),
+            confidences=np.asarray(confidences, dtype=np.float64),
+            prediction_frame=np.asarray(prediction_frame, dtype=np.int64),
+            class_probabilities=class_matrix,
+            probability_frame=np.asarray(probability_frame, dtype=np.int64),
+            rd_maps=[frame.get('rd_map') for frame in frames],
+        )
+
+
+@dataclass(slots=True)
+class SituationAssessmentArray:
+    """
+    Column-wise situation assessments for a FrameBatch; element f of every
+    array belongs to frame f. Index to get a SituationAssessment object.
+    """
+    frame_id: np.ndarray
+    timestamp: np.ndarray
+    num_confirmed_tracks: np.ndarray
+    num_provisional_tracks: np.ndarray
+    num_coasting_tracks: np.ndarray
+    num_detections: np.ndarray
+    num_false_alarms: np.ndarray
+    mean_classification_confidence: np.ndarray
+    mean_class_entropy: np.ndarray
+    mean_track_stability: np.ndarray
+    mean_track_age: np.ndarray
+    clutter_ratio: np.ndarray
+    mean_velocity_spread: np.ndarray
+    scene_codes: np.ndarray          # int8, index into SCENE_TYPES
+    estimated_snr_db: np.ndarray
+    mean_signal_power: np.ndarray
+    mean_noise_power: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.frame_id)
+    
+    def __getitem__(self, f: int) -> SituationAssessment:
+        return SituationAssessment(
+            frame_id=int(self.frame_id[f]),
+            timestamp=float(self.timestamp[f]),
+            num_confirmed_tracks=int(self.num_confirmed_tracks[f]),
+            num_provisional_tracks=int(self.num_provisional_tracks[f]),
+            num_coasting_tracks=int(self.num_coasting_tracks[f]),
+            num_detections=int(self.num_detections[f]),
+            num_false_alarms=int(self.num_false_alarms[f]),
+            mean_classification_confidence=float(self.mean_classification_confidence[f]),
+            mean_class_entropy=float(self.mean_class_entropy[f]),
+            mean_track_stability=float(self.mean_track_stability[f]),
+            mean_track_age=float(self.mean_track_age[f]),
+            clutter_ratio=float(self.clutter_ratio[f]),
+            mean_velocity_spread=float(self.mean_velocity_spread[f]),
+            scene_code=int(self.scene_codes[f]),
+            estimated_snr_db=float(self.estimated_snr_db[f]),
+            mean_signal_power=float(self.mean_signal_power[f]),
+            mean_noise_power=float(self.mean_noise_power[f]),
+        )
+    
+    def to_list(self) -> List[SituationAssessment]:
+        """Materialise one SituationAssessment per frame."""
+        return [self[f] for f in range(len(self))]
+
+
 class CognitiveRadarEngine:
     """
     Main cognitive decision engine.
@@ -138,16 +507,23 @@ class CognitiveRadarEngine:
     TRACK_STABILITY_THRESHOLD = 0.5      # Below this: unstable tracks
     VELOCITY_SPREAD_THRESHOLD = 100.0    # m/s, above: high velocity variance
     
+    # Track sets up to this size are reduced in a single Python pass
+    SMALL_TRACK_COUNT = 64
+    
     def __init__(self):
         """Initialize cognitive engine."""
         self.state = CognitiveRadarState()
         self.logger = logging.getLogger(__name__)
         
+        # Record the metrics needed to explain each decision (formatted lazily
+        # by AdaptationCommand.explain()); disable for headless sweeps
+        self.xai_enabled = True
+        
     def assess_situation(self, 
                         frame_id: int,
                         timestamp: float,
                         detections: List[Tuple[float, float]],
-                        tracks: List[Dict],
+                        tracks: Union[List[Dict], TrackBatch],
                         ai_predictions: List[Dict],
                         rd_map: Optional[np.ndarray] = None) -> SituationAssessment:
         """
@@ -157,7 +533,8 @@ class CognitiveRadarEngine:
             frame_id: Current frame index
             timestamp: Frame timestamp (seconds)
             detections: List of (range, doppler) tuples
-            tracks: List of track dicts with metadata (state, stability, velocity)
+            tracks: TrackBatch (see create_track_batch_for_cognitive), or a
+                list of track dicts with metadata (state, stability, velocity)
             ai_predictions: List of {class, confidence, entropy}
             rd_map: Optional Range-Doppler map for SNR estimation
             
@@ -170,9 +547,12 @@ class CognitiveRadarEngine:
         )
         
         # --- Track Statistics ---
-        assessment.num_confirmed_tracks = sum(1 for t in tracks if t.get('state') == 'CONFIRMED')
-        assessment.num_provisional_tracks = sum(1 for t in tracks if t.get('state') == 'PROVISIONAL')
-        assessment.num_coasting_tracks = sum(1 for t in tracks if t.get('state') == 'COASTING')
+        if not isinstance(tracks, TrackBatch):
+            tracks = TrackBatch.from_dicts(tracks)
+        state_counts = np.bincount(tracks.state_codes, minlength=NUM_TRACK_STATE_CODES)
+        assessment.num_confirmed_tracks = int(state_counts[TRACK_STATE_CODES['CONFIRMED']])
+        assessment.num_provisional_tracks = int(state_counts[TRACK_STATE_CODES['PROVISIONAL']])
+        assessment.num_coasting_tracks = int(state_counts[TRACK_STATE_CODES['COASTING']])
         
         # --- Detection Statistics ---
         assessment.num_detections = len(detections)
@@ -193,39 +573,60 @@ class CognitiveRadarEngine:
             confidences = [p.get('confidence', 0.5) for p in ai_predictions]
             assessment.mean_classification_confidence = np.mean(confidences) if confidences else 0.5
             
-            # Compute class entropy (as proxy for uncertainty)
-            entropies = []
-            for pred in ai_predictions:
-                class_probs = pred.get('class_probabilities', [1.0])
-                if class_probs:
-                    entropy = -np.sum([p * np.log(np.clip(p, 1e-10, 1.0)) 
-                                       for p in class_probs])
-                    entropies.append(entropy)
-            assessment.mean_class_entropy = np.mean(entropies) if entropies else 0.0
+            # Compute class entropy (as proxy for uncertainty), vectorized over
+            # an (N, K) probability matrix; shorter rows are zero-padded, and
+            # zero entries contribute nothing to the sum
+            class_rows = [probs for probs in (pred.get('class_probabilities', [1.0]) for pred in ai_predictions)
+                          if len(probs) > 0]
+            if class_rows:
+                row_lengths = {len(probs) for probs in class_rows}
+                if len(row_lengths) == 1:
+                    class_matrix = np.asarray(class_rows, dtype=np.float64)
+                else:
+                    class_matrix = np.zeros((len(class_rows), max(row_lengths)))
+                    for i, probs in enumerate(class_rows):
+                        class_matrix[i, :len(probs)] = probs
+                entropies = -(class_matrix * np.log(np.clip(class_matrix, 1e-10, 1.0))).sum(axis=1)
+                assessment.mean_class_entropy = float(entropies.mean())
+            else:
+                assessment.mean_class_entropy = 0.0
         
         # --- Track Quality Metrics ---
-        if tracks:
-            stabilities = [t.get('stability_score', 0.5) for t in tracks]
-            ages = [t.get('age', 1) for t in tracks]
-            velocities = [t.get('velocity', 0.0) for t in tracks]
-            
-            assessment.mean_track_stability = np.mean(stabilities) if stabilities else 0.5
-            assessment.mean_track_age = np.mean(ages) if ages else 1.0
-            assessment.mean_velocity_spread = np.std(velocities) if len(velocities) > 1 else 0.0
+        num_tracks = len(tracks)
+        if num_tracks > self.SMALL_TRACK_COUNT:
+            assessment.mean_track_stability = float(tracks.stability.mean())
+            assessment.mean_track_age = float(tracks.age.mean())
+            assessment.mean_velocity_spread = float(tracks.velocity.std())
+        elif num_tracks:
+            # Typical track counts: one Python pass (Welford update for the
+            # velocity spread) beats the fixed cost of three NumPy reductions
+            stability_sum = 0.0
+            age_sum = 0
+            velocity_mean = 0.0
+            velocity_m2 = 0.0
+            for k, (stability, age, velocity) in enumerate(zip(tracks.stability.tolist(),
+                                                               tracks.age.tolist(),
+                                                               tracks.velocity.tolist()), 1):
+                stability_sum += stability
+                age_sum += age
+                delta = velocity - velocity_mean
+                velocity_mean += delta / k
+                velocity_m2 += delta * (velocity - velocity_mean)
+            assessment.mean_track_stability = stability_sum / num_tracks
+            assessment.mean_track_age = age_sum / num_tracks
+            assessment.mean_velocity_spread = math.sqrt(velocity_m2 / num_tracks)
         
         # --- SNR Estimation from RD-Map ---
         if rd_map is not None and rd_map.size > 0:
-            peak_power = np.max(rd_map)
-            # Noise floor = low percentile
-            noise_floor = np.percentile(rd_map, 25)
+            peak_power, noise_floor, signal_power, noise_power = self._rd_map_statistics(rd_map)
             if noise_floor > 0:
-                assessment.estimated_snr_db = 10 * np.log10(peak_power / noise_floor)
+                assessment.estimated_snr_db = 10 * math.log10(peak_power / noise_floor)
             
-            assessment.mean_signal_power = float(np.mean(rd_map[rd_map > np.median(rd_map)]))
-            assessment.mean_noise_power = float(np.mean(rd_map[rd_map <= np.median(rd_map)]))
+            assessment.mean_signal_power = signal_power
+            assessment.mean_noise_power = noise_power
         
         # --- Scene Classification ---
-        assessment.scene_type = self._classify_scene(assessment)
+        assessment.scene_code = self._classify_scene(assessment)
         
         # --- Update state trends ---
         self.state.mean_confidence_trend = 0.8 * self.state.mean_confidence_trend + \
@@ -237,23 +638,190 @@ class CognitiveRadarEngine:
         
         return assessment
     
-    def _classify_scene(self, assessment: SituationAssessment) -> SceneType:
+    def assess_situation_batch(self, frames: FrameBatch) -> SituationAssessmentArray:
+        """
+        Assess a batch of frames at once (replay, training and parameter sweeps).
+        
+        Equivalent to calling assess_situation() on each frame in order, state
+        trends included, but every per-frame reduction runs as one grouped
+        NumPy reduction over the whole batch.
+        
+        Args:
+            frames: FrameBatch (see FrameBatch.from_frames)
+            
+        Returns:
+            SituationAssessmentArray with one element per frame
+        """
+        num_frames = len(frames)
+        
+        def grouped_counts(frame_index: np.ndarray) -> np.ndarray:
+            return np.bincount(frame_index, minlength=num_frames)
+        
+        def grouped_mean(values: np.ndarray, frame_index: np.ndarray,
+                         counts: np.ndarray, default: float) -> np.ndarray:
+            sums = np.bincount(frame_index, weights=values, minlength=num_frames)
+            return np.divide(sums, counts, out=np.full(num_frames, default), where=counts > 0)
+        
+        # --- Track Statistics ---
+        tracks = frames.tracks
+        state_counts = np.bincount(
+            frames.track_frame * NUM_TRACK_STATE_CODES + tracks.state_codes,
+            minlength=num_frames * NUM_TRACK_STATE_CODES
+        ).reshape(num_frames, NUM_TRACK_STATE_CODES)
+        num_confirmed = state_counts[:, TRACK_STATE_CODES['CONFIRMED']]
+        num_provisional = state_counts[:, TRACK_STATE_CODES['PROVISIONAL']]
+        
+        # --- Detection Statistics / Clutter Ratio ---
+        num_detections = frames.num_detections
+        num_false_alarms = np.maximum(0, num_detections - (num_confirmed + num_provisional))
+        clutter_ratio = np.divide(num_false_alarms, num_detections,
+                                  out=np.zeros(num_frames), where=num_detections > 0)
+        
+        # --- Confidence Metrics ---
+        mean_confidence = grouped_mean(frames.confidences, frames.prediction_frame,
+                                       grouped_counts(frames.prediction_frame), 0.5)
+        class_matrix = frames.class_probabilities
+        entropies = -(class_matrix * np.log(np.clip(class_matrix, 1e-10, 1.0))).sum(axis=1)
+        mean_entropy = grouped_mean(entropies, frames.probability_frame,
+                                    grouped_counts(frames.probability_frame), 0.0)
+        
+        # --- Track Quality Metrics ---
+        track_counts = grouped_counts(frames.track_frame)
+        mean_stability = grouped_mean(tracks.stability, frames.track_frame, track_counts, 0.5)
+        mean_age = grouped_mean(tracks.age, frames.track_frame, track_counts, 0.0)
+        mean_velocity = grouped_mean(tracks.velocity, frames.track_frame, track_counts, 0.0)
+        velocity_deviation = tracks.velocity - mean_velocity[frames.track_frame]
+        velocity_spread = np.sqrt(grouped_mean(velocity_deviation * velocity_deviation,
+                                               frames.track_frame, track_counts, 0.0))
+        velocity_spread[track_counts < 2] = 0.0
+        
+        # --- SNR Estimation from RD-Map (per frame; each map is reduced in NumPy) ---
+        estimated_snr_db = np.full(num_frames, 10.0)
+        mean_signal_power = np.zeros(num_frames)
+        mean_noise_power = np.zeros(num_frames)
+        for f, rd_map in enumerate(frames.rd_maps):
+            if rd_map is not None and rd_map.size > 0:
+                peak_power, noise_floor, signal_power, noise_power = self._rd_map_statistics(rd_map)
+                if noise_floor > 0:
+                    estimated_snr_db[f] = 10 * math.log10(peak_power / noise_floor)
+                mean_signal_power[f] = signal_power
+                mean_noise_power[f] = noise_power
+        
+        # --- Scene Classification (same rules as _classify_scene) ---
+        scene_codes = np.select(
+            [num_confirmed == 0,
+             clutter_ratio > self.CLUTTER_THRESHOLD,
+             num_confirmed > 5,
+             num_confirmed > 0],
+            [SCENE_SEARCH, SCENE_CLUTTERED, SCENE_DENSE, SCENE_TRACKING],
+            default=SCENE_SPARSE
+        ).astype(np.int8)
+        
+        # --- Update state trends ---
+        # The per-frame EMA (trend = 0.8 * trend + 0.2 * x) unrolled over the
+        # batch: one weighted sum over the stacked (F, 3) metrics
+        state = self.state
+        weights = 0.2 * np.power(0.8, np.arange(num_frames - 1, -1, -1))
+        carried = 0.8 ** num_frames
+        confidence_trend, stability_trend, clutter_trend = (
+            weights @ np.column_stack((mean_confidence, mean_stability, clutter_ratio))
+        ).tolist()
+        state.mean_confidence_trend = carried * state.mean_confidence_trend + confidence_trend
+        state.track_stability_trend = carried * state.track_stability_trend + stability_trend
+        state.clutter_trend = carried * state.clutter_trend + clutter_trend
+        
+        return SituationAssessmentArray(
+            frame_id=frames.frame_ids,
+            timestamp=frames.timestamps,
+            num_confirmed_tracks=num_confirmed,
+            num_provisional_tracks=num_provisional,
+            num_coasting_tracks=state_counts[:, TRACK_STATE_CODES['COASTING']],
+            num_detections=num_detections,
+            num_false_alarms=num_false_alarms,
+            mean_classification_confidence=mean_confidence,
+            mean_class_entropy=mean_entropy,
+            mean_track_stability=mean_stability,
+            mean_track_age=mean_age,
+            clutter_ratio=clutter_ratio,
+            mean_velocity_spread=velocity_spread,
+            scene_codes=scene_codes,
+            estimated_snr_db=estimated_snr_db,
+            mean_signal_power=mean_signal_power,
+            mean_noise_power=mean_noise_power,
+        )
+
+    @staticmethod
+    def _rd_map_statistics(rd_map: np.ndarray) -> Tuple[float, float, float, float]:
+        """
+        Power statistics of an RD map from a single partition of its cells.
+
+        Args:
+            rd_map: Range-Doppler power map (any shape). float32 maps are
+                reduced as-is (sums still accumulate in float64)
+
+        Returns:
+            (peak_power, noise_floor, mean_signal_power, mean_noise_power), where
+            the noise floor is the lower 25th percentile (an actual cell value,
+            no interpolation) and signal/noise powers are the means above /
+            at-or-below the median
+
+        Note:
+            The noise floor is np.percentile(rd_map, 25, method='lower'), not
+            the default linearly interpolated percentile. The two agree once a
+            map has a few hundred cells, but on small maps the lower cell can
+            sit noticeably below the interpolated value (8 vs 8.5 on a 7x5
+            ramp), which raises estimated_snr_db accordingly
+        """
+        flat = rd_map.ravel()
+        n = flat.size
+
+        # Order statistics for the lower quartile and the lower median, placed
+        # by one O(N) partition. Splitting at the lower median gives the same
+        # above/below sets as the interpolated median: no cell lies strictly
+        # between the two middle order statistics
+        p25_idx = (n - 1) // 4
+        med_idx = (n - 1) // 2
+        part = np.partition(flat, sorted({p25_idx, med_idx, n - 1}))
+
+        peak_power = part[n - 1]
+        noise_floor = part[p25_idx]
+        median = part[med_idx]
+
+        # Split means without materialising the two masked sub-arrays. The
+        # partition already places every cell before med_idx at or below the
+        # median, so only the upper part needs a comparison
+        lower, upper = part[:med_idx], part[med_idx:]
+        signal_mask = upper > median
+        signal_count = int(np.count_nonzero(signal_mask))
+        signal_sum = upper.sum(where=signal_mask, dtype=np.float64)
+        np.logical_not(signal_mask, out=signal_mask)
+        noise_sum = lower.sum(dtype=np.float64) + upper.sum(where=signal_mask, dtype=np.float64)
+
+        noise_count = n - signal_count
+        mean_signal = float(signal_sum / signal_count) if signal_count else float('nan')
+        mean_noise = float(noise_sum / noise_count) if noise_count else float('nan')
+        return float(peak_power), float(noise_floor), mean_signal, mean_noise
+
+    def _classify_scene(self, assessment: SituationAssessment) -> int:
         """
         Classify scene type based on metrics.
+        
+        Returns:
+            Scene code (see SCENE_TYPES)
         """
         num_confirmed = assessment.num_confirmed_tracks
         clutter_ratio = assessment.clutter_ratio
         
         if num_confirmed == 0:
-            return SceneType.SEARCH
+            return SCENE_SEARCH
         elif clutter_ratio > self.CLUTTER_THRESHOLD:
-            return SceneType.CLUTTERED
+            return SCENE_CLUTTERED
         elif num_confirmed > 5:
-            return SceneType.DENSE
+            return SCENE_DENSE
         elif num_confirmed > 0:
-            return SceneType.TRACKING
+            return SCENE_TRACKING
         else:
-            return SceneType.SPARSE
+            return SCENE_SPARSE
     
     def decide_adaptation(self, assessment: SituationAssessment) -> AdaptationCommand:
         """
@@ -264,7 +832,8 @@ class CognitiveRadarEngine:
             assessment: SituationAssessment from assess_situation()
             
         Returns:
-            AdaptationCommand with all parameter scalings and reasoning
+            AdaptationCommand with all parameter scalings and reason codes;
+            call cmd.explain() for the reasoning strings
         """
         cmd = AdaptationCommand(
             frame_id=assessment.frame_id,
@@ -274,70 +843,57 @@ class CognitiveRadarEngine:
         # Extract convenient metrics
         avg_conf = assessment.mean_classification_confidence
         track_stability = assessment.mean_track_stability
-        clutter_ratio = assessment.clutter_ratio
-        scene = assessment.scene_type
+        scene = assessment.scene_code
         snr_db = assessment.estimated_snr_db
         
         # ========== DECISION 1: TRANSMIT POWER ==========
         if avg_conf < self.CONFIDENCE_THRESHOLD_LOW:
-            cmd.tx_power_scaling = 1.5  # Increase 50%
-            cmd.reasoning['tx_power_scaling'] = \
-                f"Low classification confidence ({avg_conf:.1%}): boost TX power for weak target SNR"
+            tx_code = 1
         elif track_stability > 0.9 and snr_db > 20:
-            cmd.tx_power_scaling = 0.8  # Reduce 20%
-            cmd.reasoning['tx_power_scaling'] = \
-                f"Stable tracks ({track_stability:.2f}) + high SNR ({snr_db:.1f} dB): reduce power for efficiency"
+            tx_code = 2
         else:
-            cmd.tx_power_scaling = 1.0
-            cmd.reasoning['tx_power_scaling'] = "Nominal operating point"
+            tx_code = 0
         
         # ========== DECISION 2: CHIRP BANDWIDTH ==========
-        if scene == SceneType.CLUTTERED:
-            cmd.bandwidth_scaling = 1.3  # Expand 30%
-            cmd.reasoning['bandwidth_scaling'] = \
-                f"Cluttered scene (clutter ratio {clutter_ratio:.1%}): expand BW for range resolution"
-        elif scene == SceneType.DENSE:
-            cmd.bandwidth_scaling = 1.2  # Expand 20%
-            cmd.reasoning['bandwidth_scaling'] = \
-                "Dense targets (swarm): expand BW to separate closely-spaced targets"
+        if scene == SCENE_CLUTTERED:
+            bw_code = 1
+        elif scene == SCENE_DENSE:
+            bw_code = 2
         else:
-            cmd.bandwidth_scaling = 1.0
-            cmd.reasoning['bandwidth_scaling'] = "Standard range resolution"
+            bw_code = 0
         
         # ========== DECISION 3: CFAR THRESHOLD SCALING ==========
         if avg_conf > self.CONFIDENCE_THRESHOLD_HIGH:
-            cmd.cfar_alpha_scale = 0.9  # Tighten by 10%
-            cmd.reasoning['cfar_alpha_scale'] = \
-                f"High classification confidence ({avg_conf:.1%}): aggressive detection enabled"
-        elif scene == SceneType.CLUTTERED:
-            cmd.cfar_alpha_scale = 1.2  # Relax by 20%
-            cmd.reasoning['cfar_alpha_scale'] = \
-                "Clutter-rich environment: conservative threshold to avoid false alarms"
+            cfar_code = 1
+        elif scene == SCENE_CLUTTERED:
+            cfar_code = 2
         else:
-            cmd.cfar_alpha_scale = 1.0
-            cmd.reasoning['cfar_alpha_scale'] = "Standard CFAR threshold"
+            cfar_code = 0
         
         # ========== DECISION 4: COHERENT DWELL TIME ==========
         if track_stability < self.TRACK_STABILITY_THRESHOLD:
-            cmd.dwell_time_scale = 1.5  # Extend 50%
-            cmd.reasoning['dwell_time_scale'] = \
-                f"Unstable tracks ({track_stability:.2f}): extend coherent integration time for SNR"
+            dwell_code = 1
         elif track_stability > 0.85:
-            cmd.dwell_time_scale = 0.95  # Slight reduction for efficiency
-            cmd.reasoning['dwell_time_scale'] = "Stable tracks: nominal dwell time"
+            dwell_code = 2
         else:
-            cmd.dwell_time_scale = 1.0
-            cmd.reasoning['dwell_time_scale'] = "Standard integration time"
+            dwell_code = 0
         
         # ========== DECISION 5: PRF ADJUSTMENT ==========
-        if assessment.mean_velocity_spread > self.VELOCITY_SPREAD_THRESHOLD:
-            cmd.prf_scale = 0.9  # Reduce PRF by 10%
-            cmd.reasoning['prf_scale'] = \
-                f"High velocity spread ({assessment.mean_velocity_spread:.1f} m/s): " \
-                "reduce PRF to widen Doppler unambiguous range"
-        else:
-            cmd.prf_scale = 1.0
-            cmd.reasoning['prf_scale'] = "Standard PRF"
+        prf_code = 1 if assessment.mean_velocity_spread > self.VELOCITY_SPREAD_THRESHOLD else 0
+        
+        cmd.reason_codes = {
+            'tx_power_scaling': tx_code,
+            'bandwidth_scaling': bw_code,
+            'cfar_alpha_scale': cfar_code,
+            'dwell_time_scale': dwell_code,
+            'prf_scale': prf_code,
+        }
+        for param_name, code in cmd.reason_codes.items():
+            setattr(cmd, param_name, DECISION_TABLE[param_name][code][0])
+        
+        if self.xai_enabled:
+            cmd.reason_args = (avg_conf, track_stability, assessment.clutter_ratio,
+                               snr_db, assessment.mean_velocity_spread)
         
         # ========== Apply Bounded Scaling ==========
         cmd = self._apply_bounds(cmd)
@@ -349,8 +905,8 @@ class CognitiveRadarEngine:
             cmd.tx_power_scaling = 0.7 * cmd.tx_power_scaling + 0.3 * 1.0
         
         # ========== Compute Expected Impact ==========
-        cmd.predicted_snr_improvement_db = 10 * np.log10(cmd.tx_power_scaling) + \
-                                           5 * np.log10(cmd.dwell_time_scale)
+        cmd.predicted_snr_improvement_db = 10 * math.log10(cmd.tx_power_scaling) + \
+                                           5 * math.log10(cmd.dwell_time_scale)
         
         # Tighter CFAR → lower Pfa (fractional change)
         cmd.predicted_pfa_change = -0.15 * (1.0 - cmd.cfar_alpha_scale)
@@ -363,13 +919,8 @@ class CognitiveRadarEngine:
         
         # Update state
         self.state.last_adaptation = cmd
-        self.state.adaptation_history.append(cmd)
-        if len(self.state.adaptation_history) > 1000:
-            self.state.adaptation_history.pop(0)
-        
+        self.state.adaptation_history.append(cmd)  # Ring buffer overwrites the oldest
         self.state.scene_history.append(scene)
-        if len(self.state.scene_history) > 1000:
-            self.state.scene_history.pop(0)
         
         return cmd
     
@@ -378,11 +929,20 @@ class CognitiveRadarEngine:
         Enforce hard bounds on all parameter scalings.
         Prevents unphysical or destabilizing adaptations.
         """
-        for param_name, (min_b, max_b) in self.ADAPTATION_BOUNDS.items():
-            if hasattr(cmd, param_name):
-                current_val = getattr(cmd, param_name)
-                bounded_val = np.clip(current_val, min_b, max_b)
-                setattr(cmd, param_name, bounded_val)
+        # Unrolled scalar clamps: np.clip and attribute reflection cost more
+        # than the comparisons themselves on five Python floats
+        bounds = self.ADAPTATION_BOUNDS
+        
+        lo, hi = bounds['bandwidth_scaling']
+        cmd.bandwidth_scaling = min(hi, max(lo, cmd.bandwidth_scaling))
+        lo, hi = bounds['prf_scale']
+        cmd.prf_scale = min(hi, max(lo, cmd.prf_scale))
+        lo, hi = bounds['tx_power_scaling']
+        cmd.tx_power_scaling = min(hi, max(lo, cmd.tx_power_scaling))
+        lo, hi = bounds['cfar_alpha_scale']
+        cmd.cfar_alpha_scale = min(hi, max(lo, cmd.cfar_alpha_scale))
+        lo, hi = bounds['dwell_time_scale']
+        cmd.dwell_time_scale = min(hi, max(lo, cmd.dwell_time_scale))
         
         return cmd
     
@@ -399,7 +959,7 @@ class CognitiveRadarEngine:
         Returns:
             Formatted narrative string
         """
-        narrative = f"""
+        header = f"""
 ╔════════════════════════════════════════════════════════════════════╗
 ║           COGNITIVE RADAR ADAPTATION REPORT (Frame {assessment.frame_id})           ║
 ╚════════════════════════════════════════════════════════════════════╝
@@ -424,12 +984,13 @@ SITUATION ASSESSMENT:
 COGNITIVE DECISIONS & REASONING:
 """
         
-        for param, reasoning in cmd.reasoning.items():
-            val = getattr(cmd, param)
-            narrative += f"\n  [{param.upper().replace('_', ' ')}]: {val:.2f}×"
-            narrative += f"\n     → {reasoning}\n"
+        # One join instead of growing the string per decision
+        decisions = "".join(
+            f"\n  [{DECISION_LABELS[param]}]: {getattr(cmd, param):.2f}×\n     → {reasoning}\n"
+            for param, reasoning in cmd.explain().items()
+        )
         
-        narrative += f"""
+        footer = f"""
 EXPECTED IMPACT (Next Frame):
   • SNR Improvement: +{cmd.predicted_snr_improvement_db:.1f} dB
   • Pfa Change: {cmd.predicted_pfa_change:+.1%}
@@ -438,19 +999,21 @@ EXPECTED IMPACT (Next Frame):
 
 ╚════════════════════════════════════════════════════════════════════╝
 """
-        return narrative
+        return header + decisions + footer
     
     def get_state_summary(self) -> Dict:
         """
         Return summary of cognitive engine state for monitoring/logging.
         """
+        scene_history = self.state.scene_history
+        recent_scenes = islice(scene_history, max(len(scene_history) - 10, 0), None)
         return {
             'mean_confidence_trend': self.state.mean_confidence_trend,
             'track_stability_trend': self.state.track_stability_trend,
             'clutter_trend': self.state.clutter_trend,
             'num_adaptations': len(self.state.adaptation_history),
             'last_adaptation': self.state.last_adaptation,
-            'recent_scenes': list(s.value for s in self.state.scene_history[-10:]),
+            'recent_scenes': [SCENE_TYPES[code].value for code in recent_scenes],
         }
 
 
@@ -468,28 +1031,45 @@ def extract_track_metrics(tracks: List[Dict]) -> Tuple[float, float, List[float]
     if not tracks:
         return 0.5, 1.0, []
     
-    stabilities = []
-    ages = []
+    num_tracks = len(tracks)
+    stabilities = np.empty(num_tracks)
+    ages = np.empty(num_tracks)
     velocities = []
     
-    for track in tracks:
+    for i, track in enumerate(tracks):
         # Expect track dict with keys: state, age, hits, consecutive_misses
+        age = track.get('age', 1)
         if 'stability_score' in track:
-            stabilities.append(track['stability_score'])
+            stabilities[i] = track['stability_score']
         else:
             # Compute from hits/age
-            hits = track.get('hits', 1)
-            age = track.get('age', 1)
-            stability = min(1.0, hits / max(age, 1))
-            stabilities.append(stability)
+            stabilities[i] = min(1.0, track.get('hits', 1) / max(age, 1))
         
-        ages.append(track.get('age', 1))
+        ages[i] = age
         velocities.append(track.get('velocity', 0.0))
     
-    mean_stability = np.mean(stabilities) if stabilities else 0.5
-    mean_age = np.mean(ages) if ages else 1.0
+    return float(stabilities.mean()), float(ages.mean()), velocities
+
+
+def create_track_batch_for_cognitive(tracks) -> TrackBatch:
+    """
+    Pack tracking.manager.KinematicTrack objects into a TrackBatch for the
+    cognitive engine, without building an intermediate dict per track.
     
-    return mean_stability, mean_age, velocities
+    Args:
+        tracks: Sequence of KinematicTrack objects
+        
+    Returns:
+        TrackBatch with one element per track
+    """
+    batch = TrackBatch.empty(len(tracks))
+    for i, track in enumerate(tracks):
+        age = track.track_age_frames
+        batch.state_codes[i] = track.current_state.value
+        batch.stability[i] = min(1.0, track.total_detections_count / max(age, 1))  # hits / age
+        batch.age[i] = age
+        batch.velocity[i] = track.state_estimator.state_vector[1] if hasattr(track, 'state_estimator') else 0.0
+    return batch
 
 
 def create_track_dict_for_cognitive(track) -> Dict:
@@ -9,6 +9,8 @@ Author: Cognitive EW Systems Team
 """
 
 import logging
+import math
+import operator
 import time
 import json
 from pathlib import Path
@@ -17,6 +19,12 @@ import threading
 import queue
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from interfaces.message_schema import (
     EWFeedbackMessage, Countermeasure, EngagementStatus,
     CountermeasureType, EngagementState
@@ -24,6 +32,55 @@ from interfaces.message_schema import (
 
 logger = logging.getLogger(__name__)
 
+# Countermeasure type values, bound once for the per-threat selectors
+_NOISE_JAM = CountermeasureType.NOISE_JAM.value
+_DECEPTION_JAM = CountermeasureType.DECEPTION_JAM.value
+
+# Target type -> countermeasure type; anything unlisted is noise-jammed
+_CM_BY_TARGET = {
+    "MISSILE": _NOISE_JAM,
+    "AIRCRAFT": _DECEPTION_JAM,
+    "UAV": _NOISE_JAM,
+}
+
+# Adaptation command fields copied into attack packet metadata
+_ADAPT_KEYS = (
+    'bandwidth_scaling',
+    'tx_power_scaling',
+    'cfar_alpha_scale',
+    'prf_scale',
+    'dwell_time_scale',
+    'predicted_snr_improvement_db',
+    'predicted_pfa_change',
+    'predicted_range_resolution_m',
+)
+_ADAPT_GETTER = operator.attrgetter(*_ADAPT_KEYS)
+
+
+# ============================================================================
+# Per-threat scalar helpers (plain floats in, plain float out)
+# ============================================================================
+
+def _jam_power_boost_db(tx_power_scaling: float, predicted_snr_improvement_db: float) -> float:
+    """Adaptation-driven jam power boost; constant for one adaptation command."""
+    return 10.0 * math.log10(max(0.1, tx_power_scaling)) + predicted_snr_improvement_db
+
+
+def _jam_power_dbm(power_boost_db: float, threat_priority: int) -> float:
+    """Jam power from the adaptation boost plus up to +5 dB for priority."""
+    total_power = 30.0 + power_boost_db + (threat_priority / 10.0) * 5.0  # 1 W base
+    return min(50.0, max(20.0, total_power))
+
+
+def _cm_effectiveness_base(tx_power_scaling: float, bandwidth_scaling: float) -> float:
+    """Effectiveness before the per-threat confidence penalty."""
+    return 0.5 + (tx_power_scaling - 1.0) * 0.3 + (bandwidth_scaling - 1.0) * 0.2
+
+
+def _cm_effectiveness(base_effectiveness: float, threat_confidence: float) -> float:
+    """High-confidence threats are harder to jam."""
+    return min(0.9, max(0.1, base_effectiveness - threat_confidence * 0.1))
+
 
 class EWFeedbackPublisher:
     """
@@ -37,7 +94,9 @@ class EWFeedbackPublisher:
                  export_directory: str = 'runtime/ew_feedback',
                  enable_export: bool = True,
                  enable_event_bus: bool = False,
-                 log_all_transmissions: bool = True):
+                 log_all_transmissions: bool = True,
+                 debug_pretty_json: bool = False,
+                 export_queue_size: int = 256):
         """
         Initialize EW feedback publisher.
         
@@ -47,15 +106,26 @@ class EWFeedbackPublisher:
             enable_export: Enable/disable file export
             enable_event_bus: Enable/disable event bus publishing
             log_all_transmissions: Log every transmitted packet
+            debug_pretty_json: Indent exported files for reading by hand
+            export_queue_size: Exports buffered for the writer thread before
+                the oldest pending one is dropped
         """
         self.effector_id = effector_id
         self.export_dir = Path(export_directory)
         self.enable_export = enable_export
         self.enable_event_bus = enable_event_bus
         self.log_all_transmissions = log_all_transmissions
+        self.debug_pretty_json = debug_pretty_json
         
+        # File export runs on a writer thread so encoding and disk I/O stay
+        # off the cognitive cycle; owners call close() on shutdown to write
+        # out what is still queued
+        self._export_queue: Optional[queue.Queue] = None
+        self._export_thread: Optional[threading.Thread] = None
         if self.enable_export:
             self.export_dir.mkdir(parents=True, exist_ok=True)
+            self._export_queue = queue.Queue(maxsize=export_queue_size)
+            self._start_export_writer()
         
         # Initialize event bus if enabled
         self.defense_bus = None
@@ -70,6 +140,8 @@ class EWFeedbackPublisher:
         # Statistics
         self.packets_sent = 0
         self.packets_dropped = 0
+        self.exports_dropped = 0
+        self.export_errors = 0
         
         # Track active countermeasures
         self.active_cms: List[Countermeasure] = []
@@ -87,48 +159,35 @@ class EWFeedbackPublisher:
         Returns:
             List of Countermeasure objects
         """
-        countermeasures = []
-        
-        for threat in threat_assessments:
-            # Only engage hostile threats
-            if threat.threat_class != "HOSTILE":
-                continue
-            
-            # Select countermeasure type based on target type
-            cm_type = self._select_cm_type(threat.target_type)
-            
-            # Calculate jammer power based on threat priority
-            power_dbm = self._calculate_jammer_power(threat.threat_priority)
-            
-            # Estimate effectiveness
-            effectiveness = 0.6 + 0.2 * (threat.threat_priority / 10.0)
-            
-            cm = Countermeasure(
-                countermeasure_id=self.cm_counter,
+        # Only engage hostile threats
+        hostile = [t for t in threat_assessments if t.threat_class == "HOSTILE"]
+        if not hostile:
+            return []
+        
+        # All countermeasures of one frame start together
+        now = time.time()
+        first_id = self.cm_counter
+        self.cm_counter += len(hostile)
+        
+        # Threat lists are a handful of entries: per-threat scalar math beats
+        # packing them into arrays
+        return [
+            Countermeasure(
+                countermeasure_id=first_id + i,
                 target_track_id=threat.track_id,
-                cm_type=cm_type,
-                start_time=time.time(),
-                power_level_dbm=power_dbm,
+                cm_type=self._select_cm_type(threat.target_type),
+                start_time=now,
+                power_level_dbm=self._calculate_jammer_power(threat.threat_priority),
                 frequency_mhz=77000.0,  # Match radar frequency
                 bandwidth_mhz=150.0,
-                effectiveness_score=min(effectiveness, 0.9)
+                effectiveness_score=min(0.6 + 0.2 * (threat.threat_priority / 10.0), 0.9)
             )
-            
-            countermeasures.append(cm)
-            self.cm_counter += 1
-        
-        return countermeasures
+            for i, threat in enumerate(hostile)
+        ]
     
     def _select_cm_type(self, target_type: str) -> str:
         """Select appropriate countermeasure type for target."""
-        if target_type == "MISSILE":
-            return CountermeasureType.NOISE_JAM.value
-        elif target_type == "AIRCRAFT":
-            return CountermeasureType.DECEPTION_JAM.value
-        elif target_type == "UAV":
-            return CountermeasureType.NOISE_JAM.value
-        else:
-            return CountermeasureType.NOISE_JAM.value
+        return _CM_BY_TARGET.get(target_type, _NOISE_JAM)
     
     def _calculate_jammer_power(self, threat_priority: int) -> float:
         """Calculate jammer power based on threat priority."""
@@ -137,12 +196,14 @@ class EWFeedbackPublisher:
         priority_boost_db = (threat_priority / 10.0) * 10.0  # Up to +10dB
         return base_power_dbm + priority_boost_db
     
-    def generate_engagement_status(self, threat_assessments: List) -> List[EngagementStatus]:
+    def generate_engagement_status(self, threat_assessments: List,
+                                   engagement_cls=EngagementStatus) -> List[EngagementStatus]:
         """
         Generate engagement status for threats.
         
         Args:
             threat_assessments: List of ThreatAssessment objects
+            engagement_cls: Engagement class to build (e.g. the defense_core schema)
             
         Returns:
             List of EngagementStatus objects
@@ -157,7 +218,7 @@ class EWFeedbackPublisher:
             else:
                 continue  # Don't report ignored threats
             
-            engagement = EngagementStatus(
+            engagement = engagement_cls(
                 track_id=threat.track_id,
                 engagement_state=state,
                 time_to_threat_s=self._estimate_time_to_threat(threat),
@@ -203,11 +264,10 @@ class EWFeedbackPublisher:
         
         # Export to file
         try:
-            filename = f"ew_feedback_{int(time.time()*1000):016d}.json"
+            filename = f"ew_feedback_{int(message.timestamp*1000):016d}.json"
             filepath = self.export_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write(message.to_json(indent=2))
+            self._queue_export(filepath, message.to_dict())
             
             self.messages_published += 1
             self.active_cms = countermeasures
@@ -244,15 +304,23 @@ class EWFeedbackPublisher:
         Returns:
             True if published successfully
         """
-        from defense_core import ElectronicAttackPacket
+        from defense_core import (
+            ElectronicAttackPacket,
+            Countermeasure as DCCountermeasure,
+            EngagementStatus as DCEngagementStatus,
+        )
         
-        # Generate countermeasures from threats and adaptation
+        # Generate countermeasures from threats and adaptation, built
+        # directly as defense_core types for the event bus
         countermeasures = self._generate_countermeasures_with_adaptation(
-            threat_assessments, adaptation_command
+            threat_assessments, adaptation_command,
+            countermeasure_cls=DCCountermeasure,
+            confidence=adaptation_command.decision_confidence,
+            predicted_snr_reduction_db=adaptation_command.predicted_snr_improvement_db
         )
         
         # Generate engagements
-        engagements = self.generate_engagement_status(threat_assessments)
+        engagements = self.generate_engagement_status(threat_assessments, DCEngagementStatus)
         
         # Calculate overall effectiveness from adaptation command
         overall_effectiveness = self._calculate_effectiveness(adaptation_command)
@@ -260,40 +328,11 @@ class EWFeedbackPublisher:
         # Calculate expected impact on sensor
         expected_impact = self._calculate_expected_impact(adaptation_command)
         
-        # Convert to defense_core types for event bus
-        from defense_core import Countermeasure as DCCountermeasure, EngagementStatus as DCEngagementStatus
-        
-        dc_countermeasures = []
-        for cm in countermeasures:
-            dc_cm = DCCountermeasure(
-                countermeasure_id=cm.countermeasure_id,
-                target_track_id=cm.target_track_id,
-                cm_type=cm.cm_type,
-                start_time=cm.start_time,
-                power_level_dbm=cm.power_level_dbm,
-                frequency_mhz=cm.frequency_mhz,
-                bandwidth_mhz=cm.bandwidth_mhz,
-                effectiveness_score=cm.effectiveness_score,
-                confidence=adaptation_command.decision_confidence,
-                predicted_snr_reduction_db=adaptation_command.predicted_snr_improvement_db
-            )
-            dc_countermeasures.append(dc_cm)
-        
-        dc_engagements = []
-        for eng in engagements:
-            dc_eng = DCEngagementStatus(
-                track_id=eng.track_id,
-                engagement_state=eng.engagement_state,
-                time_to_threat_s=eng.time_to_threat_s,
-                kill_probability=eng.kill_probability
-            )
-            dc_engagements.append(dc_eng)
-        
         # Create packet
         packet = ElectronicAttackPacket.create(
             effector_id=self.effector_id,
-            countermeasures=dc_countermeasures,
-            engagements=dc_engagements,
+            countermeasures=countermeasures,
+            engagements=engagements,
             overall_effectiveness=overall_effectiveness,
             decision_confidence=adaptation_command.decision_confidence
         )
@@ -303,17 +342,8 @@ class EWFeedbackPublisher:
         
         # Add decision rationale to metadata
         packet.effector_metadata = {
-            'decision_rationale': adaptation_command.reasoning,
-            'adaptation_command': {
-                'bandwidth_scaling': adaptation_command.bandwidth_scaling,
-                'tx_power_scaling': adaptation_command.tx_power_scaling,
-                'cfar_alpha_scale': adaptation_command.cfar_alpha_scale,
-                'prf_scale': adaptation_command.prf_scale,
-                'dwell_time_scale': adaptation_command.dwell_time_scale,
-                'predicted_snr_improvement_db': adaptation_command.predicted_snr_improvement_db,
-                'predicted_pfa_change': adaptation_command.predicted_pfa_change,
-                'predicted_range_resolution_m': adaptation_command.predicted_range_resolution_m
-            }
+            'decision_rationale': adaptation_command.explain(),
+            'adaptation_command': dict(zip(_ADAPT_KEYS, _ADAPT_GETTER(adaptation_command)))
         }
         
         success = False
@@ -353,49 +383,49 @@ class EWFeedbackPublisher:
     
     def _generate_countermeasures_with_adaptation(self,
                                                    threat_assessments: List,
-                                                   adaptation_command) -> List[Countermeasure]:
+                                                   adaptation_command,
+                                                   countermeasure_cls=Countermeasure,
+                                                   **extra_fields) -> List[Countermeasure]:
         """
         Generate countermeasures incorporating cognitive adaptation decisions.
         
-        Maps adaptation command to countermeasure parameters.
+        Maps adaptation command to countermeasure parameters. Countermeasures
+        are built as countermeasure_cls, with extra_fields passed to each, so
+        the event bus path can build defense_core countermeasures directly.
         """
-        countermeasures = []
-        
-        for threat in threat_assessments:
-            # Only engage hostile threats
-            if threat.threat_class != "HOSTILE":
-                continue
-            
-            # Determine CM type from adaptation
-            cm_type = self._map_adaptation_to_cm_type(adaptation_command)
-            
-            # Calculate jam power from adaptation
-            jam_power_dbm = self._calculate_jam_power(
-                adaptation_command,
-                threat.threat_priority
-            )
-            
-            # Calculate effectiveness
-            effectiveness = self._calculate_cm_effectiveness(
-                adaptation_command,
-                threat.classification_confidence
-            )
-            
-            cm = Countermeasure(
-                countermeasure_id=self.cm_counter,
+        # Only engage hostile threats
+        hostile = [t for t in threat_assessments if t.threat_class == "HOSTILE"]
+        if not hostile:
+            return []
+        
+        # Adaptation terms are shared by every threat in this frame
+        power_boost_db = _jam_power_boost_db(adaptation_command.tx_power_scaling,
+                                             adaptation_command.predicted_snr_improvement_db)
+        base_effectiveness = _cm_effectiveness_base(adaptation_command.tx_power_scaling,
+                                                    adaptation_command.bandwidth_scaling)
+        
+        cm_type = self._map_adaptation_to_cm_type(adaptation_command)
+        bandwidth_mhz = 150.0 * adaptation_command.bandwidth_scaling
+        # All countermeasures of one frame start together
+        now = time.time()
+        first_id = self.cm_counter
+        self.cm_counter += len(hostile)
+        
+        return [
+            countermeasure_cls(
+                countermeasure_id=first_id + i,
                 target_track_id=threat.track_id,
                 cm_type=cm_type,
-                start_time=time.time(),
-                power_level_dbm=jam_power_dbm,
+                start_time=now,
+                power_level_dbm=_jam_power_dbm(power_boost_db, threat.threat_priority),
                 frequency_mhz=77000.0,  # Match radar frequency
-                bandwidth_mhz=150.0 * adaptation_command.bandwidth_scaling,
-                effectiveness_score=effectiveness,
+                bandwidth_mhz=bandwidth_mhz,
+                effectiveness_score=_cm_effectiveness(base_effectiveness,
+                                                      threat.classification_confidence),
+                **extra_fields
             )
-            
-            countermeasures.append(cm)
-            self.cm_counter += 1
-        
-        return countermeasures
+            for i, threat in enumerate(hostile)
+        ]
     
     def _map_adaptation_to_cm_type(self, adaptation_command) -> str:
         """
@@ -405,19 +435,19 @@ class EWFeedbackPublisher:
         """
         # If significantly increasing power → noise jamming
         if adaptation_command.tx_power_scaling > 1.2:
-            return CountermeasureType.NOISE_JAM.value
+            return _NOISE_JAM
         
         # If changing bandwidth → deception jamming
         elif adaptation_command.bandwidth_scaling > 1.1:
-            return CountermeasureType.DECEPTION_JAM.value
+            return _DECEPTION_JAM
         
         # If adjusting CFAR → deception jamming
         elif adaptation_command.cfar_alpha_scale < 0.95:
-            return CountermeasureType.DECEPTION_JAM.value
+            return _DECEPTION_JAM
         
         # Default: noise jamming
         else:
-            return CountermeasureType.NOISE_JAM.value
+            return _NOISE_JAM
     
     def _calculate_jam_power(self,
                             adaptation_command,
@@ -427,22 +457,9 @@ class EWFeedbackPublisher:
         
         Jam power incorporates TX power scaling and threat priority.
         """
-        # Base power
-        base_power_dbm = 30.0  # 1 Watt
-        
-        # Scale based on TX power adaptation
-        power_boost_db = 10 * np.log10(max(0.1, adaptation_command.tx_power_scaling))
-        
-        # Add predicted SNR improvement
-        power_boost_db += adaptation_command.predicted_snr_improvement_db
-        
-        # Add threat priority boost
-        priority_boost_db = (threat_priority / 10.0) * 5.0  # Up to +5dB
-        
-        total_power = base_power_dbm + power_boost_db + priority_boost_db
-        
-        # Clamp to realistic range
-        return min(50.0, max(20.0, total_power))
+        power_boost_db = _jam_power_boost_db(adaptation_command.tx_power_scaling,
+                                             adaptation_command.predicted_snr_improvement_db)
+        return _jam_power_dbm(power_boost_db, threat_priority)
     
     def _calculate_cm_effectiveness(self,
                                    adaptation_command,
@@ -450,21 +467,9 @@ class EWFeedbackPublisher:
         """
         Calculate countermeasure effectiveness score.
         """
-        # Base effectiveness from adaptation impact
-        base_effectiveness = 0.5
-        
-        # Boost from power scaling
-        power_factor = (adaptation_command.tx_power_scaling - 1.0) * 0.3
-        
-        # Boost from bandwidth scaling
-        bandwidth_factor = (adaptation_command.bandwidth_scaling - 1.0) * 0.2
-        
-        # Reduce if threat has high confidence (harder to jam)
-        confidence_penalty = threat_confidence * 0.1
-        
-        effectiveness = base_effectiveness + power_factor + bandwidth_factor - confidence_penalty
-        
-        return min(0.9, max(0.1, effectiveness))
+        base_effectiveness = _cm_effectiveness_base(adaptation_command.tx_power_scaling,
+                                                    adaptation_command.bandwidth_scaling)
+        return _cm_effectiveness(base_effectiveness, threat_confidence)
     
     def _calculate_effectiveness(self, adaptation_command) -> float:
         """
@@ -500,28 +505,106 @@ class EWFeedbackPublisher:
         
         return min(0.9, max(0.0, total_impact))
     
+    def _encode_export(self, payload: dict) -> bytes:
+        """
+        Encode an exported message: compact by default, indented when
+        debug_pretty_json is set.
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if self.debug_pretty_json:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(payload, option=option)
+        return json.dumps(payload, indent=2 if self.debug_pretty_json else None).encode()
+    
     def _export_attack_packet_to_file(self, packet):
         """
         Export attack packet to file (legacy mode).
         """
         try:
-            filename = f"ew_attack_{int(time.time()*1000):016d}.json"
+            filename = f"ew_attack_{int(packet.timestamp*1000):016d}.json"
             filepath = self.export_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write(packet.to_json(indent=2))
+            self._queue_export(filepath, packet.to_dict())
             
             self.messages_published += 1
             
         except Exception as e:
             logger.error(f"Failed to export attack packet to file: {e}")
     
+    def _start_export_writer(self):
+        self._export_thread = threading.Thread(
+            target=self._export_writer_loop, name=f"{self.effector_id}-export", daemon=True
+        )
+        self._export_thread.start()
+    
+    def _queue_export(self, filepath: Path, payload: dict):
+        """
+        Hand an export to the writer thread, dropping the oldest pending
+        export when the queue is full.
+        """
+        if self._export_thread is None:
+            self._start_export_writer()  # Publishing again after close()
+        while True:
+            try:
+                self._export_queue.put_nowait((filepath, payload))
+                return
+            except queue.Full:
+                try:
+                    self._export_queue.get_nowait()
+                    self._export_queue.task_done()
+                except queue.Empty:
+                    continue
+                self.exports_dropped += 1
+                if self.exports_dropped == 1 or self.exports_dropped % 100 == 0:
+                    logger.warning(f"[EW-FEEDBACK] Export writer behind; "
+                                   f"{self.exports_dropped} exports dropped")
+    
+    def _export_writer_loop(self):
+        """Encode and write queued exports until close() sends the sentinel."""
+        while True:
+            item = self._export_queue.get()
+            try:
+                if item is None:
+                    return
+                filepath, payload = item
+                # Write then rename so readers globbing *.json never see a partial file
+                tmp_path = filepath.with_suffix('.tmp')
+                tmp_path.write_bytes(self._encode_export(payload))
+                tmp_path.replace(filepath)
+            except Exception as e:
+                self.export_errors += 1
+                logger.error(f"Failed to write EW export: {e}")
+            finally:
+                self._export_queue.task_done()
+    
+    def flush(self):
+        """Block until every queued export has been written."""
+        if self._export_queue is not None:
+            self._export_queue.join()
+    
+    def close(self):
+        """Write out pending exports and stop the writer thread (idempotent)."""
+        if self._export_thread is not None:
+            self._export_queue.put(None)
+            self._export_thread.join()
+            self._export_thread = None
+    
     def get_statistics(self):
-        """Get publisher statistics."""
+        """
+        Get publisher statistics.
+        
+        messages_published counts exports handed to the writer; those lost to
+        a full queue or a failed write are counted in exports_dropped and
+        export_errors, and exports_pending are not on disk yet.
+        """
         return {
             'messages_published': self.messages_published,
             'packets_sent': self.packets_sent,
             'packets_dropped': self.packets_dropped,
+            'exports_dropped': self.exports_dropped,
+            'export_errors': self.export_errors,
+            'exports_pending': self._export_queue.qsize() if self._export_queue is not None else 0,
             'active_countermeasures': len(self.active_cms),
             'active_engagements': len(self.active_engagements),
             'drop_rate': self.packets_dropped / max(1, self.packets_sent) if self.packets_sent > 0 else 0.0
@@ -534,5 +617,8 @@ class NullEWFeedbackPublisher:
     def publish_feedback(self, *args, **kwargs):
         return False
     
+    def close(self):
+        pass
+    
     def get_statistics(self):
         return {'enabled': False}
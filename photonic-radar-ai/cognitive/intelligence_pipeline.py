@@ -107,6 +107,7 @@ class EWIntelligencePipeline:
     def stop(self):
         """Stop the intelligence pipeline."""
         self.subscriber.stop()
+        self.feedback_publisher.close()
         logger.info(f"EW Intelligence Pipeline stopped. Processed {self.messages_processed} messages")
     
     def _on_intelligence_received(self, received: ReceivedIntelligence):
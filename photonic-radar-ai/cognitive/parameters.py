@@ -16,8 +16,9 @@ Author: Adaptive Waveform Systems
 """
 
 import numpy as np
+from collections import deque
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -72,7 +73,7 @@ class AdaptiveParameterCache:
     pending_adaptations: Dict = None
     
     # Historical tracking
-    parameter_history: list = None
+    parameter_history: deque = None
     
     def __post_init__(self):
         if self.waveform_params is None:
@@ -80,7 +81,7 @@ class AdaptiveParameterCache:
         if self.pending_adaptations is None:
             self.pending_adaptations = {}
         if self.parameter_history is None:
-            self.parameter_history = []
+            self.parameter_history = deque(maxlen=1000)
 
 
 class AdaptiveParameterManager:
@@ -223,11 +224,7 @@ class AdaptiveParameterManager:
             'frame_id': frame_id,
             'params': asdict(params),
             'timestamp': None,
-        })
-        
-        # Keep history bounded
-        if len(self.cache.parameter_history) > 1000:
-            self.cache.parameter_history.pop(0)
+        })  # History is a bounded deque
     
     def get_current_parameters(self) -> RadarWaveformParameters:
         """
@@ -25,7 +25,7 @@ from cognitive.engine import (
     CognitiveRadarEngine,
     SituationAssessment,
     AdaptationCommand,
-    create_track_dict_for_cognitive,
+    create_track_batch_for_cognitive,
 )
 from cognitive.parameters import (
     AdaptiveParameterManager,
@@ -86,8 +86,8 @@ class ModularCognitiveIntelligenceBridge:
             return self.active_parameters, None, "[STATIC MODE] Autonomous adaptation disabled."
         
         # 1. Observability Mapping
-        # Convert internal KinematicTrack objects to cognitive-compatible telemetry
-        tactical_telemetry_tracks = [create_track_dict_for_cognitive(track) for track in active_tracks]
+        # Pack internal KinematicTrack objects into cognitive-compatible telemetry
+        tactical_telemetry_tracks = create_track_batch_for_cognitive(active_tracks)
         
         # 2. Situation Assessment
         assessment = self.intelligence_engine.assess_situation(
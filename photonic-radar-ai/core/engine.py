@@ -44,7 +44,7 @@ from evaluation.metrics import (
     PerformanceStats
 )
 from ai_models.model import IntelligencePipeline, IntelligenceOutput
-from cognitive.engine import CognitiveRadarEngine, create_track_dict_for_cognitive
+from cognitive.engine import CognitiveRadarEngine, create_track_batch_for_cognitive
 from tracking.manager import TacticalTrackManager
 from signal_processing.detection import execute_detection_pipeline
 
@@ -142,11 +142,13 @@ class CognitiveRadarPipeline:
         track_summaries = self.track_manager.update_pipeline(observed_vectors)
         
         # Multimodal classification of the primary target cluster
-        intel_output = self.intelligence_unit.infer_tactical_intelligence(rd_intensity_map, micro_doppler_spec)
+        intel_output = self.intelligence_unit.infer_tactical_intelligence(
+            rd_intensity_map, micro_doppler_spec, return_attention=False
+        )
         
         # --- 5. Situation Assessment & Cognitive Decisioning ---
         # Prepare track data for cognitive assessment
-        track_dictionaries = [create_track_dict_for_cognitive(t) for t in self.track_manager.active_tracks]
+        track_batch = create_track_batch_for_cognitive(self.track_manager.active_tracks)
         
         # Per-target intelligence mapping
         target_classifications = []
@@ -154,14 +156,14 @@ class CognitiveRadarPipeline:
             target_classifications.append({
                 "class": intel_output.tactical_class,
                 "confidence": intel_output.inference_confidence,
-                "class_probabilities": list(intel_output.class_probabilities.values())
+                "class_probabilities": intel_output.probabilities.tolist()
             })
             
         situation_assessment = self.cognitive_engine.assess_situation(
             frame_id=self.frame_index,
             timestamp=float(self.frame_index * 0.1),
             detections=observed_vectors,
-            tracks=track_dictionaries,
+            tracks=track_batch,
             ai_predictions=target_classifications,
             rd_map=rd_intensity_map
         )
@@ -189,7 +191,7 @@ class CognitiveRadarPipeline:
         far_estimate = estimate_false_alarm_rate(threshold_voltage=13.0, noise_variance=1.0)
         
         # Extract metadata from AI probabilities
-        inference_stats = evaluate_ai_inference_confidence(list(intel_output.class_probabilities.values()))
+        inference_stats = evaluate_ai_inference_confidence(intel_output.probabilities)
         feature_vector = extract_statistical_features(intermediate_freq_signal)
         
         probabilistic_stats = PerformanceStats(
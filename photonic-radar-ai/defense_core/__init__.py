@@ -45,6 +45,7 @@ from defense_core.event_bus import (
     get_defense_bus,
     reset_defense_bus,
     QueueBackend,
+    RingBackend,
 )
 
 from defense_core.validators import (
@@ -87,6 +88,7 @@ __all__ = [
     'get_defense_bus',
     'reset_defense_bus',
     'QueueBackend',
+    'RingBackend',
     
     # Validators
     'ValidationRules',
@@ -9,13 +9,13 @@ Features:
 - Safe writes
 - No busy waiting
 - Thread-safe design
-- Swappable backend (Queue, Kafka, Redis, ZeroMQ)
+- Swappable backend (Queue, SPSC ring, Kafka, Redis, ZeroMQ)
 
 Author: Defense Core Team
 """
 
 import logging
-from typing import Optional, Any, Protocol
+from typing import Optional, Any, Protocol, Tuple
 from queue import Queue, Empty, Full
 import threading
 import time
@@ -147,6 +147,118 @@ class QueueBackend:
         }
 
 
+# ============================================================================
+# Ring Backend (single producer / single consumer)
+# ============================================================================
+
+class RingBackend:
+    """
+    Lock-free single-producer/single-consumer ring buffer.
+    
+    Slots are preallocated; the producer only advances ``_head`` and the
+    consumer only advances ``_tail``, so neither side takes a lock. Each
+    index has a single writer, and the GIL orders the slot write before the
+    index update that publishes it. Only valid with at most one producer and
+    one consumer active at a time.
+    
+    Timed waits block on a condition variable (no busy waiting). The other
+    side only takes the condition's lock to signal when a waiter has
+    registered, so the non-blocking fast path stays lock-free.
+    """
+    
+    def __init__(self, maxsize: int = 100):
+        """
+        Initialize ring backend.
+        
+        Args:
+            maxsize: Ring capacity (must be positive)
+        """
+        if maxsize <= 0:
+            raise ValueError("RingBackend requires a positive capacity")
+        self.capacity = maxsize
+        self._slots = [None] * maxsize
+        self._head = 0  # Next write position (producer-owned)
+        self._tail = 0  # Next read position (consumer-owned)
+        self._changed = threading.Condition()
+        self._waiters = 0  # Threads blocked in _wait_until (changed under _changed)
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.messages_dropped = 0
+    
+    def put(self, message: Any, timeout: Optional[float] = None) -> bool:
+        """Put message in ring (non-blocking by default)."""
+        head = self._head
+        if head - self._tail >= self.capacity:
+            if timeout is None or not self._wait_until(
+                    lambda: head - self._tail < self.capacity, timeout):
+                self.messages_dropped += 1
+                logger.warning("Ring full, message dropped")
+                return False
+        
+        self._slots[head % self.capacity] = message
+        self._head = head + 1
+        self.messages_sent += 1
+        self._notify()
+        return True
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Get message from ring (non-blocking by default)."""
+        tail = self._tail
+        if tail == self._head:
+            if timeout is None or not self._wait_until(
+                    lambda: tail != self._head, timeout):
+                return None
+        
+        index = tail % self.capacity
+        message = self._slots[index]
+        self._slots[index] = None  # Release the reference for the GC
+        self._tail = tail + 1
+        self.messages_received += 1
+        self._notify()
+        return message
+    
+    def _wait_until(self, ready, timeout: float) -> bool:
+        """Block until ``ready()`` holds or ``timeout`` seconds elapse."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            # Registering before re-checking ready() means an index update
+            # either is seen here or sees the waiter and signals
+            self._waiters += 1
+            try:
+                while not ready():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._changed.wait(remaining)
+                return True
+            finally:
+                self._waiters -= 1
+    
+    def _notify(self):
+        """Wake threads blocked in _wait_until after an index update."""
+        if self._waiters:
+            with self._changed:
+                self._changed.notify_all()
+    
+    def qsize(self) -> int:
+        """Get approximate ring occupancy."""
+        return self._head - self._tail
+    
+    def empty(self) -> bool:
+        """Check if ring is empty."""
+        return self._head == self._tail
+    
+    def get_statistics(self) -> dict:
+        """Get ring statistics."""
+        return {
+            'messages_sent': self.messages_sent,
+            'messages_received': self.messages_received,
+            'messages_dropped': self.messages_dropped,
+            'queue_size': self.qsize(),
+            'drop_rate': self.messages_dropped / max(1, self.messages_sent)
+        }
+
+
 # ============================================================================
 # Dual-Queue Event Bus
 # ============================================================================
@@ -173,7 +285,7 @@ class DefenseEventBus:
         Args:
             radar_to_ew_maxsize: Max size for radar→EW queue
             ew_to_radar_maxsize: Max size for EW→radar queue
-            backend_type: Backend type ('queue', 'kafka', 'redis', 'zeromq')
+            backend_type: Backend type ('queue', 'ring', 'kafka', 'redis', 'zeromq')
         """
         self.backend_type = backend_type
         
@@ -181,6 +293,9 @@ class DefenseEventBus:
         if backend_type == 'queue':
             self.radar_to_ew_bus = QueueBackend(maxsize=radar_to_ew_maxsize)
             self.ew_to_radar_bus = QueueBackend(maxsize=ew_to_radar_maxsize)
+        elif backend_type == 'ring':
+            self.radar_to_ew_bus = RingBackend(maxsize=radar_to_ew_maxsize)
+            self.ew_to_radar_bus = RingBackend(maxsize=ew_to_radar_maxsize)
         else:
             raise NotImplementedError(f"Backend '{backend_type}' not implemented yet")
         
@@ -306,6 +421,18 @@ class DefenseEventBus:
             'ew_to_radar': self.ew_to_radar_bus.get_statistics()
         }
     
+    def get_queue_info_view(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get current queue depths as (name, size) pairs.
+        
+        Lightweight alternative to get_statistics() for status displays:
+        reads the backend sizes directly without building nested dicts.
+        """
+        return (
+            ('radar_to_ew', self.radar_to_ew_bus.qsize()),
+            ('ew_to_radar', self.ew_to_radar_bus.qsize()),
+        )
+    
     def clear(self):
         """Clear all queues."""
         # Drain queues
@@ -331,14 +458,19 @@ _global_defense_bus = None
 _bus_lock = threading.Lock()
 
 
-def get_defense_bus() -> DefenseEventBus:
-    """Get global defense event bus (singleton)."""
+def get_defense_bus(backend_type: str = 'queue') -> DefenseEventBus:
+    """
+    Get global defense event bus (singleton).
+    
+    Args:
+        backend_type: Backend used if the bus does not exist yet
+    """
     global _global_defense_bus
     
     if _global_defense_bus is None:
         with _bus_lock:
             if _global_defense_bus is None:
-                _global_defense_bus = DefenseEventBus()
+                _global_defense_bus = DefenseEventBus(backend_type=backend_type)
     
     return _global_defense_bus
 
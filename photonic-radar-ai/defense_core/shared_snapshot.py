@@ -0,0 +1,251 @@
+"""
+Defense Core - Shared-Memory Snapshot Channel
+=============================================
+
+Publishes the encoded tactical snapshot through a named
+multiprocessing.shared_memory segment so that out-of-process consumers
+(the API server) can read it without touching the filesystem.
+
+The segment is guarded by a sequence lock: the single producer makes the
+sequence number odd while it writes and even once the payload is complete.
+Readers copy the payload and accept it only if the sequence number was even
+and unchanged across the copy.
+
+There is one writer per process (acquire_writer), and a segment is owned by
+one live producer process at a time; a second producer is refused and should
+fall back to its file snapshot.
+
+Segment Layout:
+---------------
+    [seq: u64][length: u32][flags: u32][published_at: f64]
+    [publish_interval: f64][owner_pid: u64][payload ...]
+
+Author: Defense Core Team
+"""
+
+import os
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional, Tuple
+
+
+SNAPSHOT_SEGMENT_NAME = "phoenix_tactical_state"
+SNAPSHOT_SEGMENT_SIZE = 2 * 1024 * 1024
+
+FLAG_OVERFLOW = 0x1  # Last snapshot did not fit; consumers should fall back to the file
+
+_SEQ = struct.Struct("<Q")
+_HEADER_BODY = struct.Struct("<IIdd")  # length, flags, published_at, publish_interval (after seq)
+_OWNER = struct.Struct("<Q")  # pid of the producer process that owns the segment
+_OWNER_OFFSET = _SEQ.size + _HEADER_BODY.size
+HEADER_SIZE = _OWNER_OFFSET + _OWNER.size
+
+# Segments opened by a writer in this process (tracked for cleanup here)
+_WRITER_SEGMENTS = set()
+
+# Per-process writers shared by every producer object: name -> (writer, refcount)
+_WRITERS: Dict[str, Tuple["SnapshotWriter", int]] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SnapshotWriter:
+    """
+    Producer side of the snapshot channel (one per process).
+
+    Obtain it through acquire_writer() so that every producer object in the
+    process shares one writer; publish() is serialized by an internal lock.
+    """
+
+    def __init__(self, name: str = SNAPSHOT_SEGMENT_NAME, size: int = SNAPSHOT_SEGMENT_SIZE):
+        """
+        Create the segment, or reuse one left behind by an earlier run.
+
+        Raises:
+            OSError: If shared memory is unavailable on this platform, or the
+                segment is owned by another live producer process.
+        """
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            owner_pid = _OWNER.unpack_from(self._shm.buf, _OWNER_OFFSET)[0] \
+                if self._shm.size >= HEADER_SIZE else 0
+            if owner_pid not in (0, os.getpid()) and _pid_alive(owner_pid):
+                self._shm.close()
+                raise OSError(f"snapshot segment {name!r} is owned by producer pid {owner_pid}")
+        _WRITER_SEGMENTS.add(self._shm._name)
+
+        self._buf = self._shm.buf
+        self.capacity = self._shm.size - HEADER_SIZE
+        self._lock = threading.Lock()
+        _OWNER.pack_into(self._buf, _OWNER_OFFSET, os.getpid())
+
+        # Producer's nominal publish period, advertised so readers can judge staleness
+        self.publish_interval = 0.0
+
+        # Continue from the segment's last even sequence so readers see a change
+        self._seq = _SEQ.unpack_from(self._buf, 0)[0] & ~1
+
+    def publish(self, payload: bytes) -> bool:
+        """
+        Publish an encoded snapshot.
+
+        Returns:
+            True if published, False if the payload exceeds the segment capacity
+        """
+        length = len(payload)
+        fits = length <= self.capacity
+
+        with self._lock:
+            _SEQ.pack_into(self._buf, 0, self._seq + 1)  # Odd: write in progress
+            if fits:
+                self._buf[HEADER_SIZE:HEADER_SIZE + length] = payload
+            _HEADER_BODY.pack_into(self._buf, _SEQ.size,
+                                   length if fits else 0,
+                                   0 if fits else FLAG_OVERFLOW,
+                                   time.time(),
+                                   self.publish_interval)
+            self._seq += 2
+            _SEQ.pack_into(self._buf, 0, self._seq)  # Even: snapshot complete
+        return fits
+
+    def close(self, unlink: bool = True):
+        """Release the mapping and (by default) remove the segment."""
+        if not unlink:
+            _OWNER.pack_into(self._buf, _OWNER_OFFSET, 0)  # Let the next producer take over
+        self._buf = None
+        self._shm.close()
+        _WRITER_SEGMENTS.discard(self._shm._name)
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def acquire_writer(name: str = SNAPSHOT_SEGMENT_NAME, size: int = SNAPSHOT_SEGMENT_SIZE) -> SnapshotWriter:
+    """
+    Returns this process's writer for a segment, creating it on first use.
+
+    Each call must be paired with release_writer(); the segment is closed and
+    unlinked when the last holder releases it.
+
+    Raises:
+        OSError: If the writer cannot be created (see SnapshotWriter).
+    """
+    with _WRITERS_LOCK:
+        writer, refcount = _WRITERS.get(name, (None, 0))
+        if writer is None:
+            writer = SnapshotWriter(name=name, size=size)
+        _WRITERS[name] = (writer, refcount + 1)
+        return writer
+
+
+def release_writer(writer: SnapshotWriter):
+    """Drops one reference taken by acquire_writer()."""
+    with _WRITERS_LOCK:
+        for name, (shared, refcount) in _WRITERS.items():
+            if shared is writer:
+                if refcount > 1:
+                    _WRITERS[name] = (shared, refcount - 1)
+                else:
+                    del _WRITERS[name]
+                    writer.close()
+                return
+
+
+class SnapshotReader:
+    """
+    Consumer side of the snapshot channel.
+
+    Attaches lazily, so it can be created before the producer starts.
+    """
+
+    # A segment not republished for REATTACH_INTERVALS of the producer's
+    # advertised publish interval (and at least REATTACH_MIN_S) is re-attached,
+    # in case the producer restarted and created a new one under the same name
+    REATTACH_INTERVALS = 3.0
+    REATTACH_MIN_S = 1.0
+
+    def __init__(self, name: str = SNAPSHOT_SEGMENT_NAME, max_retries: int = 8):
+        self.name = name
+        self.max_retries = max_retries
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def _attach(self) -> bool:
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return False
+
+        # Attaching registers the segment with this process's resource
+        # tracker, which would unlink the producer's segment at our exit
+        if shm._name not in _WRITER_SEGMENTS:
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+
+        self._shm = shm
+        return True
+
+    def _detach(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def read(self, known_seq: Optional[int] = None) -> Optional[Tuple[int, float, Optional[bytes]]]:
+        """
+        Read the latest consistent snapshot.
+
+        Args:
+            known_seq: Sequence number the caller already holds; if it is
+                still current the payload copy is skipped
+
+        Returns:
+            (seq, published_at, payload) with payload None when seq equals
+            known_seq, or None if no usable snapshot is published
+        """
+        if self._shm is None:
+            if not self._attach():
+                return None
+            known_seq = None  # A fresh mapping may be a new segment; always copy
+
+        buf = self._shm.buf
+        result = None
+        for _ in range(self.max_retries):
+            seq = _SEQ.unpack_from(buf, 0)[0]
+            if seq & 1:
+                time.sleep(0)  # Writer mid-publish; yield and retry
+                continue
+            length, flags, published_at, publish_interval = _HEADER_BODY.unpack_from(buf, _SEQ.size)
+
+            if seq == 0 or flags & FLAG_OVERFLOW:
+                break
+            if seq == known_seq:
+                result = (seq, published_at, None)
+                break
+
+            payload = bytes(buf[HEADER_SIZE:HEADER_SIZE + length])
+            if _SEQ.unpack_from(buf, 0)[0] == seq:
+                result = (seq, published_at, payload)
+                break
+        del buf
+
+        if result is not None:
+            reattach_after_s = max(self.REATTACH_MIN_S, self.REATTACH_INTERVALS * publish_interval)
+            if time.time() - result[1] > reattach_after_s:
+                self._detach()
+        return result
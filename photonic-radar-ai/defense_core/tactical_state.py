@@ -3,9 +3,18 @@ import threading
 import time
 import json
 import os
+import weakref
 from typing import Dict, List, Any, Optional
 from collections import deque
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from defense_core.shared_snapshot import SnapshotWriter, acquire_writer, release_writer
+
 class TacticalState:
     """
     Single source of truth for system tactical state.
@@ -26,6 +35,7 @@ class TacticalState:
         self.radar_status = "OFFLINE"
         self.radar_tracks: List[Dict] = []
         self.radar_telemetry_history: deque = deque(maxlen=200)
+        self.radar_snr_history: deque = deque(maxlen=200)  # API view of telemetry: (frame, snr) pairs, published as dicts
         self.radar_detection_history: deque = deque(maxlen=500)
         self.radar_threats: List[Dict] = []
         
@@ -43,25 +53,45 @@ class TacticalState:
         # Determine PROJECT_ROOT: defense_core/..
         self.project_root = Path(__file__).resolve().parent.parent
         self.persistence_path = self.project_root / "runtime" / "shared_state.json"
+        # Tiny sidecar for health polling, so it need not parse the full snapshot
+        self.health_path = self.persistence_path.with_name("health.json")
         
         # Ensure runtime dir exists
         self.persistence_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.last_persist_time = 0
+        self.persist_interval = 0.1  # Seconds between snapshot writes (10Hz)
         self.persistence_lock = threading.Lock()
         
-    def _persist(self):
+        # Track membership as of the last published snapshot, so each snapshot
+        # can carry the delta and consumers need not diff the full track list
+        self.publish_seq = 0
+        self._published_track_ids: set = set()
+        
+        # Shared-memory channel for out-of-process readers (API server); the
+        # JSON file is still written for file-based consumers. The writer is
+        # shared by every TacticalState in this process and unlinked with the last
+        try:
+            self.snapshot_channel: Optional[SnapshotWriter] = acquire_writer()
+            self.snapshot_channel.publish_interval = self.persist_interval
+            weakref.finalize(self, release_writer, self.snapshot_channel)
+        except (OSError, ValueError):
+            self.snapshot_channel = None
+        
+    def set_publish_rate(self, hz: float):
+        """Set the maximum rate at which snapshots are written for IPC."""
+        self.persist_interval = 1.0 / hz
+        if self.snapshot_channel is not None:
+            self.snapshot_channel.publish_interval = self.persist_interval
+        
+    def _persist(self, force: bool = False):
         """Write state to disk for IPC."""
-        # Throttle to 10Hz max to avoid I/O thrashing
+        # Throttle to the publish rate to avoid I/O thrashing
         now = time.time()
-        if now - self.last_persist_time < 0.1:
+        if not force and now - self.last_persist_time < self.persist_interval:
             return
             
         try:
-            snapshot = self.get_snapshot()
-            # Convert collections.deque to list for JSON serialization logic (handled in get_snapshot)
-            # We need to ensure all data is json serializable
-            
             # Custom serializer for numpy types
             def default_serializer(obj):
                 if hasattr(obj, 'tolist'):
@@ -71,22 +101,72 @@ class TacticalState:
                 return str(obj)
 
             with self.persistence_lock:
+                snapshot = self.get_snapshot()
+                # Convert collections.deque to list for JSON serialization logic (handled in get_snapshot)
+                # We need to ensure all data is json serializable
+                
+                # Track delta against the previously published snapshot
+                track_ids = {key for key in map(self._track_key, snapshot['radar']['tracks']) if key is not None}
+                snapshot['radar']['track_diff'] = {
+                    'added': list(track_ids - self._published_track_ids),
+                    'removed': list(self._published_track_ids - track_ids)
+                }
+                self._published_track_ids = track_ids
+                self.publish_seq += 1
+                snapshot['publish_seq'] = self.publish_seq
+                
+                # Encode once; the same bytes go to shared memory and to disk
+                if ORJSON_AVAILABLE:
+                    payload = orjson.dumps(
+                        snapshot, default=default_serializer,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    )
+                else:
+                    payload = json.dumps(snapshot, default=default_serializer).encode()
+                
+                if self.snapshot_channel is not None:
+                    self.snapshot_channel.publish(payload)
+                
                 temp_path = str(self.persistence_path) + '.tmp'
-                with open(temp_path, 'w') as f:
-                    json.dump(snapshot, f, default=default_serializer)
+                with open(temp_path, 'wb') as f:
+                    f.write(payload)
                 
                 os.rename(temp_path, self.persistence_path)
+                
+                health_temp_path = str(self.health_path) + '.tmp'
+                with open(health_temp_path, 'w') as f:
+                    json.dump({'uptime': snapshot['uptime'], 'tick': snapshot['tick']}, f)
+                os.replace(health_temp_path, self.health_path)
             
             self.last_persist_time = now
         except Exception as e:
             # Silently catch persistence errors to avoid stalling main threads
             pass
 
+    @staticmethod
+    def _track_key(track: Any) -> Optional[str]:
+        """Event identity of a track, supporting both 'id' and 'track_id'."""
+        if isinstance(track, dict):
+            track_id, alt_id = track.get('id'), track.get('track_id')
+        else:
+            track_id, alt_id = getattr(track, 'id', None), getattr(track, 'track_id', None)
+        if track_id is None and alt_id is None:
+            return None
+        return str(track_id or alt_id)
+
     def update_tick(self, tick: int):
         """Update simulation tick."""
+        self.record_tick(tick)
+        self._persist()
+        
+    def record_tick(self, tick: int):
+        """Update simulation tick without writing a snapshot."""
         with self._lock:
             self.tick_count = tick
-        self._persist()
+            
+    def publish(self):
+        """Write a snapshot for IPC now, regardless of the throttle."""
+        self._persist(force=True)
             
     def update_radar(self, status: str, tracks: List[Dict], threats: List[Dict], telemetry: Optional[Dict] = None, detection_record: Optional[Dict] = None):
         """Update radar state."""
@@ -97,6 +177,7 @@ class TacticalState:
             
             if telemetry:
                 self.radar_telemetry_history.append(telemetry)
+                self.radar_snr_history.append((telemetry.get('frame'), telemetry.get('mean_snr_db')))
                 
             if detection_record:
                 self.radar_detection_history.append(detection_record)
@@ -128,6 +209,7 @@ class TacticalState:
                     "tracks": list(self.radar_tracks), # Copy
                     "threats": list(self.radar_threats), # Copy
                     "telemetry_history": list(self.radar_telemetry_history),
+                    "snr_history": [{'frame': frame, 'snr': snr} for frame, snr in self.radar_snr_history],
                     "detection_history": list(self.radar_detection_history)
                 },
                 "ew": {
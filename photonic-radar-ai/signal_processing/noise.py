@@ -34,7 +34,8 @@ def inject_thermal_awgn(signal_complex: np.ndarray, snr_db: float) -> np.ndarray
     standard_deviation = np.sqrt(noise_power_linear / 2.0)
     noise_samples = standard_deviation * (np.random.randn(*signal_complex.shape) + 1j * np.random.randn(*signal_complex.shape))
     
-    return signal_complex + noise_samples
+    # Preserve the caller's precision (e.g. complex64 training synthesis)
+    return signal_complex + noise_samples.astype(signal_complex.dtype, copy=False)
 
 
 def generate_stochastic_clutter(num_samples: int, 
@@ -30,6 +30,7 @@ Author: Lead DSP Research Engineer
 """
 
 import numpy as np
+from functools import lru_cache
 from scipy.signal import stft, get_window
 from typing import Tuple, Dict
 
@@ -64,6 +65,22 @@ def get_specialized_window(n_samples: int, method: str = 'hann', **kwargs) -> np
     else:
         return get_window(method, n_samples)
 
+@lru_cache(maxsize=32)
+def _cached_window(n_samples: int, method: str, at: float, dtype=np.float64) -> np.ndarray:
+    """
+    Memoized, read-only window for the fixed-geometry transforms below.
+    
+    Window synthesis costs about as much as the FFT it weights, and the
+    (length, method) pairs repeat on every frame/sample.
+    """
+    window = get_specialized_window(n_samples, method=method, at=at).astype(dtype, copy=False)
+    window.setflags(write=False)
+    return window
+
+def _window_dtype(data: np.ndarray):
+    """Single-precision windows for single-precision data, double otherwise."""
+    return np.float32 if data.dtype in (np.float32, np.complex64) else np.float64
+
 def compute_range_doppler_map(
     beat_signal_complex: np.ndarray, 
     num_pulses: int, 
@@ -95,8 +112,10 @@ def compute_range_doppler_map(
         data_matrix = beat_signal_complex[:expected_samples].reshape(num_pulses, samples_per_pulse)
     
     # 2. Apodization (Weighting to suppress range/Doppler sidelobes)
-    range_window = get_specialized_window(samples_per_pulse, method=window_method, at=80) 
-    doppler_window = get_specialized_window(num_pulses, method=window_method, at=60)
+    # Windows match the input precision so complex64 data is not promoted
+    real_dtype = _window_dtype(data_matrix)
+    range_window = _cached_window(samples_per_pulse, window_method, 80, real_dtype)
+    doppler_window = _cached_window(num_pulses, window_method, 60, real_dtype)
     
     # Apply Fast-Time window
     data_matrix = data_matrix * range_window[np.newaxis, :]
@@ -132,7 +151,8 @@ def compute_spectrogram(
     
     Returns the log-magnitude intensity plot.
     """
-    f, t, Zxx = stft(signal, fs=sampling_rate_hz, window='hann', nperseg=nperseg, noverlap=noverlap)
+    window = _cached_window(nperseg, 'hann', 80, _window_dtype(signal))
+    f, t, Zxx = stft(signal, fs=sampling_rate_hz, window=window, nperseg=nperseg, noverlap=noverlap)
     
     intensity_mag = np.abs(Zxx)
     intensity_db = 20 * np.log10(intensity_mag + 1e-9)
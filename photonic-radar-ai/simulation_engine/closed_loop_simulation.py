@@ -330,8 +330,9 @@ class ClosedLoopSimulation:
         # Stop radar
         self.radar.stop()
         
-        # Stop EW pipeline
+        # Stop EW pipeline and write out queued EW feedback files
         self.ew_pipeline.stop()
+        self.ew_publisher.close()
         
         # Stop feedback subscriber
         self.radar_feedback_subscriber.stop()
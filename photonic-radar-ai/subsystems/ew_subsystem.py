@@ -134,7 +134,12 @@ class EWSubsystem:
                             rec = 'JAMMING'
                     
                     # Convert dataclass to dict for state storage
-                    assessment_data = asdict(assessment) if hasattr(assessment, '__dataclass_fields__') else assessment
+                    if hasattr(assessment, 'to_dict'):
+                        assessment_data = assessment.to_dict()
+                    elif hasattr(assessment, '__dataclass_fields__'):
+                        assessment_data = asdict(assessment)
+                    else:
+                        assessment_data = assessment
                     
                     self.tactical_state.update_ew(
                         status="ENGAGING",
@@ -206,6 +211,8 @@ class EWSubsystem:
             if self.pipeline:
                 logger.info("Shutting down EW engine...")
                 self.pipeline.stop()
+                if self.publisher:
+                    self.publisher.close()
                 self.pipeline = None
                 self.publisher = None
                 self.initialized = False
@@ -0,0 +1,170 @@
+"""
+Unit tests for the cognitive radar decision engine.
+"""
+
+import dataclasses
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cognitive.engine import (AdaptationCommand, AdaptationHistory, CognitiveRadarEngine, FrameBatch,
+                              SceneType, SituationAssessment)
+
+
+def _decide(engine: CognitiveRadarEngine, frame_id: int) -> AdaptationCommand:
+    tracks = [{'state': 'CONFIRMED', 'stability_score': 0.3, 'age': 5, 'velocity': 40.0 * i}
+              for i in range(4)]
+    predictions = [{'confidence': 0.2, 'class_probabilities': [0.5, 0.3, 0.2]}]
+    assessment = engine.assess_situation(frame_id, 0.1 * frame_id, [(0, 0)] * 8, tracks, predictions)
+    return engine.decide_adaptation(assessment)
+
+
+def _random_frames(seed: int, num_frames: int):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for frame_id in range(num_frames):
+        tracks = [{'state': str(rng.choice(['CONFIRMED', 'PROVISIONAL', 'COASTING', 'LOST'])),
+                   'stability_score': float(rng.random()),
+                   'age': int(rng.integers(1, 50)),
+                   'velocity': float(rng.normal(0, 150))}
+                  for _ in range(int(rng.integers(0, 12)))]
+        predictions = [{'confidence': float(rng.random()),
+                        'class_probabilities': list(rng.dirichlet(np.ones(int(rng.integers(1, 6)))))}
+                       for _ in range(int(rng.integers(0, 5)))]
+        if predictions and frame_id % 7 == 0:
+            predictions[0]['class_probabilities'] = []
+        if predictions and frame_id % 11 == 0:
+            del predictions[0]['class_probabilities']
+        frames.append(dict(frame_id=frame_id, timestamp=0.1 * frame_id,
+                           detections=[(0, 0)] * int(rng.integers(0, 20)),
+                           tracks=tracks, ai_predictions=predictions,
+                           rd_map=rng.random((16, 20)) if frame_id % 2 else None))
+    return frames
+
+
+def _assert_assessments_equal(expected, actual):
+    for fld in dataclasses.fields(expected):
+        x, y = getattr(expected, fld.name), getattr(actual, fld.name)
+        if isinstance(x, float) and math.isnan(x):
+            assert math.isnan(y), fld.name
+        else:
+            assert y == pytest.approx(x, rel=1e-9, abs=1e-12), fld.name
+
+
+class TestAdaptationReasoning:
+
+    def test_reasoning_attribute_is_formatted_on_read(self):
+        cmd = _decide(CognitiveRadarEngine(), frame_id=1)
+        assert cmd.reasoning
+        assert cmd.reasoning == cmd.explain()
+        assert "Low classification confidence" in cmd.reasoning['tx_power_scaling']
+
+    def test_reasoning_can_be_supplied_as_text(self):
+        cmd = AdaptationCommand(frame_id=0, timestamp=0.0, reasoning={'tx_power_scaling': 'manual'})
+        assert cmd.reasoning == {'tx_power_scaling': 'manual'}
+
+    def test_serialized_command_carries_reasoning(self):
+        cmd = _decide(CognitiveRadarEngine(), frame_id=1)
+        data = dataclasses.asdict(cmd)
+
+        assert '_reasoning' not in data
+        assert data['reasoning'] == cmd.explain()
+        assert 'reasoning=' in repr(cmd)
+
+
+class TestAdaptationHistory:
+
+    def test_rebuilt_command_keeps_predictions_and_reasoning(self):
+        engine = CognitiveRadarEngine()
+        cmd = _decide(engine, frame_id=1)
+
+        rebuilt = engine.state.adaptation_history[-1]
+        assert rebuilt.frame_id == cmd.frame_id
+        assert rebuilt.tx_power_scaling == pytest.approx(cmd.tx_power_scaling)
+        assert rebuilt.decision_confidence == pytest.approx(cmd.decision_confidence)
+        assert rebuilt.predicted_snr_improvement_db == pytest.approx(cmd.predicted_snr_improvement_db)
+        assert rebuilt.reasoning == cmd.reasoning
+
+    def test_slices_follow_ring_order(self):
+        history = AdaptationHistory(capacity=3)
+        for frame_id in range(5):
+            history.append(AdaptationCommand(frame_id=frame_id, timestamp=0.0,
+                                             reasoning={'prf_scale': f"frame {frame_id}"}))
+
+        assert [cmd.frame_id for cmd in history[:]] == [2, 3, 4]
+        assert [cmd.frame_id for cmd in history[-2:]] == [3, 4]
+        assert [cmd.frame_id for cmd in history[::-2]] == [4, 2]
+        assert history[0].reasoning == {'prf_scale': "frame 2"}
+        with pytest.raises(IndexError):
+            history[3]
+
+
+class TestSituationAssessment:
+
+    def test_to_dict_reports_scene_type(self):
+        assessment = SituationAssessment(frame_id=1, timestamp=0.0)
+        assessment.scene_type = SceneType.DENSE
+        data = assessment.to_dict()
+
+        assert data['scene_type'] is SceneType.DENSE
+        assert 'scene_code' not in data
+        assert list(data)[:2] == ['frame_id', 'timestamp']
+        assert data['estimated_snr_db'] == assessment.estimated_snr_db
+
+
+class TestBatchAssessment:
+
+    def test_batch_matches_per_frame_assessment(self):
+        frames = _random_frames(seed=3, num_frames=200)
+        reference_engine, batch_engine = CognitiveRadarEngine(), CognitiveRadarEngine()
+
+        expected = [reference_engine.assess_situation(**frame) for frame in frames]
+        assessments = batch_engine.assess_situation_batch(FrameBatch.from_frames(frames))
+
+        assert len(assessments) == len(frames)
+        for f, reference in enumerate(expected):
+            _assert_assessments_equal(reference, assessments[f])
+        for trend in ('mean_confidence_trend', 'track_stability_trend', 'clutter_trend'):
+            assert getattr(batch_engine.state, trend) == pytest.approx(
+                getattr(reference_engine.state, trend), rel=1e-9)
+
+    def test_empty_batch(self):
+        assessments = CognitiveRadarEngine().assess_situation_batch(FrameBatch.from_frames([]))
+        assert len(assessments) == 0
+
+
+class TestRDMapStatistics:
+
+    def test_noise_floor_is_lower_quartile_cell(self):
+        # Small maps: the lower cell sits below the interpolated percentile
+        rd_map = np.arange(35, dtype=np.float64).reshape(7, 5)
+        _, noise_floor, _, _ = CognitiveRadarEngine._rd_map_statistics(rd_map)
+
+        assert noise_floor == 8.0
+        assert noise_floor == np.percentile(rd_map, 25, method='lower')
+        assert np.percentile(rd_map, 25) == 8.5
+
+    def test_statistics_match_reference(self):
+        rng = np.random.default_rng(0)
+        for shape in [(1, 1), (2, 3), (7, 5), (16, 20), (64, 128)]:
+            rd_map = rng.random(shape)
+            peak, noise_floor, signal, noise = CognitiveRadarEngine._rd_map_statistics(rd_map)
+
+            median = np.median(rd_map)
+            assert peak == rd_map.max()
+            assert noise_floor == np.percentile(rd_map, 25, method='lower')
+            if (rd_map > median).any():
+                assert signal == pytest.approx(rd_map[rd_map > median].mean())
+            else:
+                assert math.isnan(signal)
+            assert noise == pytest.approx(rd_map[rd_map <= median].mean())
+
+    def test_snr_uses_lower_quartile_floor(self):
+        rd_map = np.arange(1, 36, dtype=np.float64).reshape(7, 5)
+        assessment = CognitiveRadarEngine().assess_situation(0, 0.0, [], [], [], rd_map=rd_map)
+        assert assessment.estimated_snr_db == pytest.approx(10 * math.log10(35.0 / 9.0))
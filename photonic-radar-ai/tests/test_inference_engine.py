@@ -0,0 +1,202 @@
+"""
+Unit tests for the batch inference engine and its inference-time model rewrites.
+"""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_models.architectures import (
+    KinematicAttentionBlock,
+    TacticalHybridClassifier,
+    TacticalResidualBlock,
+    load_tactical_weights,
+    save_tactical_weights,
+)
+from ai_models.inference import BatchIntelligenceEngine
+from ai_models.model import IntelligencePipeline
+from ai_models.xai import TacticalAttributionGenerator
+
+
+def _randomize_bn_statistics(model: nn.Module):
+    """Give BatchNorm layers non-trivial running stats so fusion is exercised."""
+    for module in model.modules():
+        if isinstance(module, nn.BatchNorm2d):
+            module.running_mean.uniform_(-0.5, 0.5)
+            module.running_var.uniform_(0.5, 2.0)
+            module.weight.data.uniform_(0.5, 1.5)
+            module.bias.data.uniform_(-0.2, 0.2)
+
+
+class TestConvBatchNormFusion:
+
+    def test_fused_model_matches_unfused(self):
+        torch.manual_seed(0)
+        model = TacticalHybridClassifier(num_classes=5)
+        _randomize_bn_statistics(model)
+        model.eval()
+
+        rd = torch.randn(3, 1, 128, 128)
+        ts = torch.randn(3, 512)
+        with torch.no_grad():
+            reference, _ = model(rd, ts)
+            model.fuse_for_inference()
+            fused, _ = model(rd, ts)
+
+        assert torch.allclose(reference, fused, atol=1e-4)
+
+    def test_fusion_removes_batchnorm(self):
+        model = TacticalHybridClassifier(num_classes=5).eval().fuse_for_inference()
+        assert not any(isinstance(m, nn.BatchNorm2d) for m in model.modules())
+
+    def test_fusion_is_idempotent(self):
+        block = TacticalResidualBlock(16, 32, stride=2).eval()
+        block.fuse_for_inference()
+        block.fuse_for_inference()
+        assert len(block.identity_mapping) == 1
+
+    def test_fusion_requires_eval_mode(self):
+        model = TacticalHybridClassifier(num_classes=5).train()
+        with pytest.raises(RuntimeError):
+            model.fuse_for_inference()
+
+
+class TestWeightPersistence:
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        torch.manual_seed(0)
+        model = TacticalHybridClassifier(num_classes=5)
+        checkpoint = tmp_path / "weights.pt"
+
+        save_tactical_weights(model, str(checkpoint))
+        state_dict = load_tactical_weights(str(checkpoint))
+
+        assert all(t.dtype == torch.float16 for t in state_dict.values() if t.is_floating_point())
+        restored = TacticalHybridClassifier(num_classes=5)
+        restored.load_state_dict(state_dict)
+        for name, tensor in model.state_dict().items():
+            assert torch.allclose(restored.state_dict()[name].float(), tensor.float(), atol=1e-2, rtol=1e-3)
+
+    def test_engine_loads_fp16_checkpoint(self, tmp_path):
+        checkpoint = tmp_path / "weights.pt"
+        save_tactical_weights(TacticalHybridClassifier(num_classes=5), str(checkpoint))
+
+        engine = BatchIntelligenceEngine(str(checkpoint))
+
+        assert next(engine.model.parameters()).dtype == torch.float32
+
+
+class TestBatchIntelligenceEngine:
+
+    def test_batch_inference_returns_probabilities(self):
+        engine = BatchIntelligenceEngine()
+        rd_batch = np.random.rand(4, 128, 128).astype(np.float32)
+        ts_batch = np.random.rand(4, 512).astype(np.float32)
+
+        probabilities = engine.run_batch_inference(rd_batch, ts_batch)
+
+        assert probabilities.shape == (4, len(engine.get_canonical_labels()))
+        assert np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-5)
+
+    def test_non_native_rd_size_is_resampled(self):
+        engine = BatchIntelligenceEngine()
+        rd_batch = np.random.rand(2, 64, 96).astype(np.float32)
+        ts_batch = np.random.rand(2, 512).astype(np.float32)
+
+        probabilities = engine.run_batch_inference(rd_batch, ts_batch)
+
+        assert probabilities.shape == (2, len(engine.get_canonical_labels()))
+
+
+class TestKinematicAttention:
+
+    def test_context_matches_weighted_sum(self):
+        torch.manual_seed(0)
+        block = KinematicAttentionBlock(hidden_dimension=32).eval()
+        sequence = torch.randn(4, 50, 32)
+
+        context, weights = block(sequence)
+
+        expected = torch.sum(weights * sequence, dim=1)
+        assert context.shape == (4, 32)
+        assert torch.allclose(context, expected, atol=1e-5)
+
+
+class TestIntelligencePipeline:
+
+    def test_spectral_preprocessing_normalizes_each_map(self):
+        pipeline = IntelligencePipeline()
+        maps = np.stack([np.random.rand(64, 64) * 40.0 - 20.0, np.full((64, 64), 3.0)])
+
+        tensor = pipeline.preprocess_spectral_map(maps)
+
+        assert tensor.shape == (2, 1, 128, 128)
+        assert float(tensor[0].min()) >= 0.0 and float(tensor[0].max()) <= 1.0
+        # Flat maps are passed through without scaling
+        assert torch.allclose(tensor[1], torch.full_like(tensor[1], 3.0))
+
+    def test_batch_inference_matches_single_inference(self):
+        pipeline = IntelligencePipeline()
+        rd_maps = np.random.rand(3, 128, 128).astype(np.float32)
+        streams = np.random.rand(3, 512).astype(np.float32)
+
+        batch_outputs = pipeline.infer_tactical_intelligence_batch(rd_maps, streams)
+
+        assert len(batch_outputs) == 3
+        for i, batch_output in enumerate(batch_outputs):
+            single_output = pipeline.infer_tactical_intelligence(rd_maps[i], streams[i])
+            assert batch_output.tactical_class == single_output.tactical_class
+            assert batch_output.inference_confidence == pytest.approx(
+                single_output.inference_confidence, abs=1e-5)
+
+    def test_cpu_pipeline_quantizes_linear_layers(self, monkeypatch):
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+        pipeline = IntelligencePipeline(use_int8_on_cpu=True)
+
+        linear_types = {type(m) for m in pipeline.model.modules() if "Linear" in type(m).__name__}
+        assert nn.Linear not in linear_types
+        assert not any(isinstance(m, nn.BatchNorm2d) for m in pipeline.model.modules())
+        # The FP32 model stays available, unfused, for XAI
+        assert any(isinstance(m, nn.BatchNorm2d) for m in pipeline.fp32_model.modules())
+
+        output = pipeline.infer_tactical_intelligence(np.random.rand(128, 128), np.random.rand(512))
+        assert output.probabilities.sum() == pytest.approx(1.0, abs=1e-5)
+
+    def test_fp32_model_supports_grad_cam_when_int8_enabled(self, monkeypatch):
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+        pipeline = IntelligencePipeline(use_int8_on_cpu=True)
+        model = pipeline.fp32_model
+        generator = TacticalAttributionGenerator(model, model.spectral_encoder.stage3)
+
+        saliency = generator.generate_saliency_map(
+            pipeline.preprocess_spectral_map(np.random.rand(128, 128)),
+            pipeline.preprocess_kinematic_stream(np.random.rand(512)),
+            target_class_idx=0,
+        )
+        assert saliency.ndim == 2
+        assert float(saliency.max()) <= 1.0
+
+    def test_attention_copy_can_be_skipped(self):
+        pipeline = IntelligencePipeline()
+        rd_map = np.random.rand(128, 128)
+        stream = np.random.rand(512)
+
+        output = pipeline.infer_tactical_intelligence(rd_map, stream)
+        assert output.attention_weights.shape == (1, 512, 1)
+        assert pipeline.infer_tactical_intelligence(rd_map, stream, return_attention=False).attention_weights is None
+
+    def test_output_keeps_class_probability_field(self):
+        pipeline = IntelligencePipeline()
+        output = pipeline.infer_tactical_intelligence(np.random.rand(128, 128), np.random.rand(512),
+                                                      return_attention=False)
+
+        report = asdict(output)
+        assert list(report['class_probabilities']) == pipeline.target_labels
+        assert report['class_probabilities'][output.tactical_class] == pytest.approx(output.inference_confidence)
@@ -0,0 +1,95 @@
+"""
+Unit tests for the shared-memory tactical snapshot channel.
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from defense_core import shared_snapshot
+from defense_core.shared_snapshot import SnapshotReader, SnapshotWriter, acquire_writer, release_writer
+
+
+@pytest.fixture
+def channel():
+    name = f"phoenix_test_{uuid.uuid4().hex[:12]}"
+    writer = SnapshotWriter(name=name, size=4096)
+    yield writer, SnapshotReader(name=name)
+    writer.close()
+
+
+class TestSnapshotChannel:
+
+    def test_reader_before_publish_returns_none(self, channel):
+        _, reader = channel
+        assert reader.read() is None
+
+    def test_missing_segment_returns_none(self):
+        assert SnapshotReader(name=f"phoenix_missing_{uuid.uuid4().hex[:12]}").read() is None
+
+    def test_publish_round_trip(self, channel):
+        writer, reader = channel
+        writer.publish(b'{"tick": 1}')
+        seq, _, payload = reader.read()
+        assert payload == b'{"tick": 1}'
+
+        writer.publish(b'{"tick": 2}')
+        next_seq, _, payload = reader.read(known_seq=seq)
+        assert next_seq > seq
+        assert payload == b'{"tick": 2}'
+
+    def test_unchanged_snapshot_skips_copy(self, channel):
+        writer, reader = channel
+        writer.publish(b'{"tick": 1}')
+        seq, _, _ = reader.read()
+        same_seq, _, payload = reader.read(known_seq=seq)
+        assert same_seq == seq
+        assert payload is None
+
+    def test_oversized_payload_is_flagged(self, channel):
+        writer, reader = channel
+        assert not writer.publish(b"x" * (writer.capacity + 1))
+        assert reader.read() is None
+
+    def test_segment_owned_by_live_producer_is_refused(self, channel):
+        writer, _ = channel
+        # Pretend another live process (our parent) owns the segment
+        shared_snapshot._OWNER.pack_into(writer._buf, shared_snapshot._OWNER_OFFSET, os.getppid())
+        with pytest.raises(OSError):
+            SnapshotWriter(name=writer._shm.name, size=4096)
+
+    def test_stale_threshold_follows_publish_interval(self, channel, monkeypatch):
+        writer, reader = channel
+        writer.publish_interval = 2.0  # 0.5 Hz producer
+        writer.publish(b'{"tick": 1}')
+        seq, published_at, _ = reader.read()
+
+        # 1.5 s without a publish is on schedule for this producer: stay attached
+        monkeypatch.setattr(shared_snapshot.time, "time", lambda: published_at + 1.5)
+        assert reader.read(known_seq=seq)[2] is None
+        assert reader._shm is not None
+
+        monkeypatch.setattr(shared_snapshot.time, "time", lambda: published_at + 10.0)
+        reader.read(known_seq=seq)
+        assert reader._shm is None
+
+
+class TestSharedWriter:
+
+    def test_writer_is_shared_and_unlinked_with_last_holder(self):
+        name = f"phoenix_test_{uuid.uuid4().hex[:12]}"
+        first = acquire_writer(name=name, size=4096)
+        second = acquire_writer(name=name, size=4096)
+        assert first is second
+
+        release_writer(first)
+        first.publish(b'{"tick": 1}')
+        assert SnapshotReader(name=name).read()[2] == b'{"tick": 1}'
+
+        release_writer(second)
+        assert SnapshotReader(name=name).read() is None
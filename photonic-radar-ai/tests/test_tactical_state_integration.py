@@ -39,6 +39,8 @@ class TestTacticalStateIntegration(unittest.TestCase):
         self.assertEqual(len(snapshot['radar']['tracks']), 2)
         self.assertEqual(len(snapshot['radar']['telemetry_history']), 1)
         self.assertEqual(snapshot['radar']['telemetry_history'][0]['mean_snr_db'], 15.0)
+        # /state consumers read snr_history as {'frame', 'snr'} objects
+        self.assertEqual(snapshot['radar']['snr_history'], [{'frame': 1, 'snr': 15.0}])
         
     def test_state_snapshot_structure(self):
         ts = TacticalState()